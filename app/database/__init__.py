@@ -1,2 +1,3 @@
-from .database import db
-from .post_dao import PostDao
\ No newline at end of file
+from .database import db, QueryCancelledError
+from .post_dao import PostDao, SEARCH_ORDER_RECENT, SEARCH_ORDER_RELEVANCE
+from .migrations import migrate
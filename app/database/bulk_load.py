@@ -0,0 +1,67 @@
+import sqlite3
+from contextlib import contextmanager
+
+from app.database.migrations import POSTS_INDEXES
+from app.database.post_counter import create_post_counter_triggers, drop_post_counter_triggers, rebuild_post_counter
+from app.database.search_index import create_search_index, has_search_index
+
+
+@contextmanager
+def deferred_maintenance(conn: sqlite3.Connection, defer_indexes: bool = True):
+    """
+    대량 적재 동안 행마다 실행되는 인덱스/카운터 갱신을 미루는 컨텍스트 매니저입니다.
+    진입 시 카운터 트리거(와 선택적으로 보조 인덱스)를 제거하고, 종료 시 카운터를 다시 센 뒤 트리거와 인덱스를 다시 만듭니다.
+    적재하는 동안 실행 중인 앱이 게시글을 추가/삭제할 수 있으므로, 적재한 게시글만 더하지 않고 전체를 다시 셉니다.
+    검색 인덱스는 PostDao.insert_posts가 배치마다 같은 트랜잭션에서 갱신하므로 미루지 않습니다.
+    적재 중 예외가 발생해도 종료 처리는 항상 수행됩니다.
+
+    Args:
+        conn: 스키마 변경에 사용할 데이터베이스 연결 객체 (적재용 연결과 별개)
+        defer_indexes (bool): True면 보조 인덱스도 제거했다가 마지막에 한 번에 다시 만듭니다.
+    """
+    with conn:
+        conn.execute("BEGIN")
+        drop_post_counter_triggers(conn)
+        if defer_indexes:
+            for name, _ in POSTS_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+    try:
+        yield
+    finally:
+        finish_bulk_load(conn)
+
+
+def finish_bulk_load(conn: sqlite3.Connection) -> None:
+    """
+    대량 적재 후 미뤄둔 작업을 수행합니다. (인덱스 재생성, 카운터 재계산, 트리거 복구)
+    쓰기 잠금을 먼저 잡으므로 카운터를 다시 센 뒤 트리거가 복구될 때까지 다른 연결의 변경이 끼어들지 않습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for _, sql in POSTS_INDEXES:
+            conn.execute(sql)
+        rebuild_post_counter(conn)
+        create_post_counter_triggers(conn)
+    conn.execute("PRAGMA optimize")
+
+
+def repair_derived_data(conn: sqlite3.Connection) -> None:
+    """
+    보조 인덱스, 카운터와 카운터 트리거, 검색 인덱스를 posts 테이블 기준으로 모두 다시 만듭니다.
+    대량 적재 도중 프로세스가 강제 종료되어 종료 처리가 실행되지 못했거나,
+    앱 밖의 도구(sqlite3 등)로 게시글을 바꿔 검색 인덱스가 어긋났을 때 사용합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    with conn:
+        conn.execute("BEGIN")
+        for _, sql in POSTS_INDEXES:
+            conn.execute(sql)
+        rebuild_post_counter(conn)
+        create_post_counter_triggers(conn)
+        if has_search_index(conn):
+            create_search_index(conn)
@@ -0,0 +1,144 @@
+import sqlite3
+import zlib
+from typing import Optional
+
+# 이 길이(글자 수) 이상의 본문만 압축. 짧은 본문은 압축 이득보다 압축/해제 비용이 큼
+COMPRESS_MIN_LENGTH = 512
+# zlib 압축 수준 (1: 빠름 ~ 9: 작음)
+COMPRESS_LEVEL = 6
+# 압축 결과가 원본 크기의 이 비율보다 크면 압축하지 않고 원문 그대로 저장
+COMPRESS_MAX_RATIO = 0.9
+# 기존 게시글 압축(compress_existing_posts)에서 한 트랜잭션으로 처리할 게시글 수
+COMPRESS_BATCH_SIZE = 500
+
+# SQL에서 본문을 읽을 때 사용하는 함수 이름. 압축된 본문(BLOB)이면 푼 UTF-8 bytes를, 원문(TEXT)이면 그대로 반환
+UNZIP_FUNCTION = "unzip_content"
+# SQL에서 본문을 압축할 때 사용하는 함수 이름 (압축할 필요가 없으면 원문 그대로 반환)
+ZIP_FUNCTION = "zip_content"
+
+_CREATE_STATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS content_compression
+    (
+        id      INTEGER PRIMARY KEY CHECK (id = 1),
+        next_id INTEGER NOT NULL,
+        end_id  INTEGER NOT NULL
+    )
+"""
+
+
+def compress_content(content: Optional[str]) -> Optional[str | bytes]:
+    """
+    본문을 저장할 값으로 변환합니다.
+    COMPRESS_MIN_LENGTH 이상이고 압축 효과가 있으면 zlib으로 압축한 bytes(SQLite BLOB)를, 아니면 원문을 반환합니다.
+    본문 컬럼의 저장 형식(TEXT/BLOB)이 곧 압축 여부 표시이므로 별도 플래그 컬럼이 필요 없습니다.
+
+    Args:
+        content (str | None): 본문
+
+    Returns:
+        str | bytes | None: 저장할 값
+    """
+    if content is None or len(content) < COMPRESS_MIN_LENGTH:
+        return content
+    data = content.encode("utf-8")
+    compressed = zlib.compress(data, COMPRESS_LEVEL)
+    if len(compressed) > len(data) * COMPRESS_MAX_RATIO:
+        return content
+    return compressed
+
+
+def decompress_content(value: Optional[str | bytes]) -> Optional[str]:
+    """
+    저장된 본문 값(compress_content의 결과)을 원문으로 되돌립니다.
+
+    Args:
+        value (str | bytes | None): 저장된 본문 값
+
+    Returns:
+        str | None: 원문
+    """
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+def _unzip_bytes(value: Optional[str | bytes]) -> Optional[str | bytes]:
+    # 압축된 본문은 푼 UTF-8 bytes를 그대로 돌려주고 SQL에서 CAST(... AS TEXT)로 바꿈 (unzip_sql 참고).
+    # Python에서 str로 디코딩했다가 SQLite가 다시 UTF-8로 인코딩하는 비용이 들지 않음
+    if isinstance(value, bytes):
+        return zlib.decompress(value)
+    return value
+
+
+def register_compression_functions(conn: sqlite3.Connection) -> None:
+    """
+    본문 압축/해제 SQL 함수를 연결에 등록합니다. 조회 쿼리(unzip_sql)와 기존 게시글 압축에서만 사용하며,
+    트리거나 뷰 같은 스키마 객체에서는 사용하지 않으므로 함수를 등록하지 않은 도구로 DB를 열어도 posts를 변경할 수 있습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    conn.create_function(UNZIP_FUNCTION, 1, _unzip_bytes, deterministic=True)
+    conn.create_function(ZIP_FUNCTION, 1, compress_content, deterministic=True)
+
+
+def unzip_sql(column: str = "content") -> str:
+    """
+    column(본문 컬럼)을 원문으로 읽는 SQL 식을 반환합니다.
+    원문(TEXT)으로 저장된 행은 Python 함수를 호출하지 않습니다.
+
+    Args:
+        column (str): 본문 컬럼 이름 (예: "posts.content")
+
+    Returns:
+        str: SQL 식
+    """
+    return f"(CASE WHEN typeof({column}) = 'blob' THEN CAST({UNZIP_FUNCTION}({column}) AS TEXT) ELSE {column} END)"
+
+
+def create_compression_state(conn: sqlite3.Connection, compress_existing: bool = True) -> None:
+    """
+    기존 게시글 압축 진행 상태 테이블을 만듭니다.
+    지금 있는 게시글(id <= 현재 최대 id)만 압축 대상으로 기록하며, 이후 추가/수정되는 게시글은 저장할 때 압축됩니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+        compress_existing (bool): False면 기존 게시글을 압축 대상으로 기록하지 않음 (압축하지 않는 DB)
+    """
+    conn.execute(_CREATE_STATE_TABLE_SQL)
+    conn.execute("""
+                 INSERT OR IGNORE INTO content_compression (id, next_id, end_id)
+                 SELECT 1, 1, CASE WHEN ? THEN COALESCE(MAX(id), 0) ELSE 0 END FROM posts
+                 """, (compress_existing,))
+
+
+def compress_existing_posts(conn: sqlite3.Connection,
+                            batch_size: int = COMPRESS_BATCH_SIZE) -> Optional[tuple[int, int]]:
+    """
+    압축되지 않은 기존 게시글을 id 순서로 batch_size개 범위만큼 압축하고 진행 상태를 저장합니다.
+    본문 변경과 진행 상태 저장이 한 트랜잭션(호출자가 커밋)에서 이루어지므로 중간에 종료되어도 이어서 진행할 수 있습니다.
+    검색 인덱스는 원문을 따로 색인하므로(search_index 참고) 저장 형식만 바뀌는 이 작업에서는 건드리지 않습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체 (압축 SQL 함수가 등록되어 있어야 함)
+        batch_size (int): 한 번에 처리할 게시글 id 범위의 게시글 수
+
+    Returns:
+        tuple[int, int] | None: (처리한 마지막 id, 압축 대상 마지막 id). 이미 모두 처리했으면 None
+    """
+    row = conn.execute("SELECT next_id, end_id FROM content_compression WHERE id = 1").fetchone()
+    if row is None or row[0] > row[1]:
+        return None
+    next_id, end_id = row
+    last_id = conn.execute(
+        "SELECT MAX(id) FROM (SELECT id FROM posts WHERE id >= ? AND id <= ? ORDER BY id LIMIT ?)",
+        (next_id, end_id, batch_size)
+    ).fetchone()[0]
+    if last_id is None:
+        last_id = end_id
+    conn.execute(f"""
+                 UPDATE posts SET content = {ZIP_FUNCTION}(content)
+                 WHERE id >= ? AND id <= ? AND typeof(content) = 'text' AND length(content) >= ?
+                 """, (next_id, last_id, COMPRESS_MIN_LENGTH))
+    conn.execute("UPDATE content_compression SET next_id = ? WHERE id = 1", (last_id + 1,))
+    return last_id, end_id
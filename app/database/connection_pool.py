@@ -0,0 +1,133 @@
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, replace
+from typing import Callable
+
+# 풀이 동시에 유지할 최대 연결 수
+POOL_SIZE = 4
+# 모든 연결이 사용 중일 때 반납을 기다리는 최대 시간(초)
+POOL_TIMEOUT = 10.0
+
+
+@dataclass
+class PoolStats:
+    """
+    커넥션 풀의 사용 통계를 담는 데이터 클래스입니다.
+    """
+    checkouts: int = 0
+    reuses: int = 0
+    created: int = 0
+    waits: int = 0
+    wait_time: float = 0.0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        체크아웃 중 기존 연결을 재사용한 비율을 반환합니다.
+        """
+        return self.reuses / self.checkouts if self.checkouts else 0.0
+
+
+class ConnectionPool:
+    """
+    SQLite 연결을 체크아웃/반납 방식으로 재사용하는 커넥션 풀입니다.
+    연결을 닫지 않고 보관하므로 PRAGMA 설정, 페이지 캐시, 준비된 구문 캐시가 유지됩니다.
+    """
+
+    def __init__(self, factory: Callable[[], sqlite3.Connection], size: int = POOL_SIZE,
+                 timeout: float = POOL_TIMEOUT):
+        """
+        ConnectionPool 초기화 메서드입니다.
+
+        Args:
+            factory (Callable): 새 연결을 생성하는 함수
+            size (int): 최대 연결 수
+            timeout (float): 연결 반납 대기 최대 시간(초)
+        """
+        self._factory = factory
+        self.size = size
+        self.timeout = timeout
+        # 가장 최근에 반납된(캐시가 따뜻한) 연결부터 재사용하도록 LIFO 큐 사용
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+        self._closed = False
+
+    def acquire(self) -> sqlite3.Connection:
+        """
+        풀에서 연결을 하나 꺼냅니다.
+        유휴 연결이 없으면 최대 크기까지 새로 만들고, 가득 찬 경우 반납을 기다립니다.
+
+        Returns:
+            sqlite3.Connection: 데이터베이스 연결 객체
+        """
+        try:
+            conn = self._idle.get_nowait()
+            with self._lock:
+                self._stats.checkouts += 1
+                self._stats.reuses += 1
+            return conn
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._stats.created < self.size
+            if can_create:
+                self._stats.created += 1
+                self._stats.checkouts += 1
+
+        if can_create:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._stats.created -= 1
+                    self._stats.checkouts -= 1
+                raise
+
+        start = time.perf_counter()
+        try:
+            conn = self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("connection pool exhausted") from None
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.reuses += 1
+            self._stats.waits += 1
+            self._stats.wait_time += time.perf_counter() - start
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """
+        사용이 끝난 연결을 풀에 반납합니다. 풀이 닫힌 뒤라면 연결을 닫습니다.
+
+        Args:
+            conn (sqlite3.Connection): 반납할 연결 객체
+        """
+        if self._closed:
+            conn.close()
+            return
+        self._idle.put(conn)
+
+    def get_stats(self) -> PoolStats:
+        """
+        현재까지의 풀 사용 통계 사본을 반환합니다.
+
+        Returns:
+            PoolStats: 풀 통계
+        """
+        with self._lock:
+            return replace(self._stats)
+
+    def close(self) -> None:
+        """
+        유휴 연결을 모두 닫습니다. 사용 중인 연결은 반납 시점에 닫힙니다.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
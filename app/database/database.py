@@ -1,15 +1,40 @@
 import os
 import sqlite3
 import sys
+import threading
+import time
 from contextlib import contextmanager
 
+from app.database.compression import register_compression_functions
+from app.database.connection_pool import ConnectionPool, PoolStats, POOL_SIZE
+from app.database.post_changes import read_post_changes, take_local_changes, track_local_changes
+from app.database.query_stats import QueryStats, SLOW_QUERY_LOG, is_query_stats_enabled
+
 DB_FILE = "board.db"
+# 연결마다 유지할 준비된 구문(prepared statement) 캐시 크기
+STATEMENT_CACHE_SIZE = 256
+# 모든 연결에 적용할 PRAGMA 설정
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+)
+# 취소 요청을 확인하는 주기 (SQLite 가상 머신 명령어 수)
+CANCEL_CHECK_INTERVAL = 1000
+
+
+class QueryCancelledError(sqlite3.OperationalError):
+    """
+    취소 요청으로 실행 도중 중단된 쿼리를 나타내는 예외입니다.
+    """
 
 
 class DatabaseManager:
-    def __init__(self, db_file: str = DB_FILE):
+    def __init__(self, db_file: str = DB_FILE, pool_size: int = POOL_SIZE):
         """
         DB 파일의 경로를 설정합니다.
+        연결은 처음 사용할 때 커넥션 풀에서 생성됩니다.
         """
         if getattr(sys, 'frozen', False):
             # 배포 환경 -> .exe 파일이 있는 폴더 기준 : (PyInstaller로 빌드 시 sys.executable은 exe 파일 경로임)
@@ -22,38 +47,185 @@ class DatabaseManager:
             base_dir = os.path.dirname(app_dir)
 
         self.db_path = os.path.join(base_dir, db_file)
+        self.pool_size = pool_size
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        # 데이터 버전 (캐시 무효화 판단용). 이 관리자를 통해 커밋된 쓰기 작업마다,
+        # 그리고 다른 프로세스나 도구의 게시글 변경을 알아챌 때마다(get_data_version) 증가
+        self.data_version = 0
+        self._version_lock = threading.Lock()
+        # 이 프로세스의 연결이 커밋한 posts 변경 횟수 합계
+        self._local_changes = 0
+        # 마지막으로 확인한 다른 프로세스/도구의 posts 변경 횟수 (DB 전체 변경 횟수 - 이 프로세스의 변경 횟수)
+        self._external_changes = None
+        # DB 전체 변경 횟수를 읽는 전용 연결 (풀이 모두 사용 중이어도 기다리지 않도록 따로 둠)
+        self._watch_conn = None
+        # 스레드별 취소 이벤트 (cancellable 참고)
+        self._local = threading.local()
+        # 쿼리 실행 시간/느린 쿼리 계측 (BOARD_QUERY_STATS=1 또는 query_stats.enable()로 켬)
+        self.query_stats = QueryStats(enabled=is_query_stats_enabled(),
+                                      slow_log_path=os.path.join(base_dir, SLOW_QUERY_LOG))
 
     def get_connection(self) -> sqlite3.Connection:
         """
         SQLite 데이터베이스 연결 객체를 반환합니다.
         Row 팩토리를 설정하여 결과를 딕셔너리처럼 접근할 수 있게 합니다.
+        조회에 필요한 본문 압축/해제 SQL 함수를 등록하고, 이 연결이 만든 게시글 변경 횟수를 세기 시작합니다.
+        풀과 별개인 새 연결이므로 사용 후 호출자가 직접 닫아야 합니다.
 
         Returns:
             sqlite3.Connection: 데이터베이스 연결 객체
         """
-        conn = sqlite3.connect(self.db_path)
+        # 풀의 연결은 여러 스레드에서 번갈아 사용되므로 스레드 검사를 끕니다.
+        conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        register_compression_functions(conn)
+        track_local_changes(conn)
+        conn.commit()
         return conn
 
+    def set_path(self, db_path: str) -> None:
+        """
+        사용할 DB 파일 경로를 변경합니다. 기존 풀의 연결은 모두 닫힙니다.
+        (가져오기/내보내기 등 별도 DB 파일을 다루는 도구에서 사용)
+
+        Args:
+            db_path (str): DB 파일 경로
+        """
+        self.close()
+        self.db_path = os.path.abspath(db_path)
+        with self._version_lock:
+            self._local_changes = 0
+            self._external_changes = None
+            self.data_version += 1
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """
+        커넥션 풀을 반환합니다. 처음 접근할 때 생성합니다.
+        """
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ConnectionPool(self.get_connection, size=self.pool_size)
+        return self._pool
+
+    def get_pool_stats(self) -> PoolStats:
+        """
+        커넥션 풀의 사용 통계(체크아웃, 대기, 재사용 비율)를 반환합니다.
+
+        Returns:
+            PoolStats: 풀 통계
+        """
+        return self.pool.get_stats()
+
+    def close(self) -> None:
+        """
+        풀에 보관 중인 모든 연결을 닫습니다. 이후 사용 시 풀이 새로 생성됩니다.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+        with self._version_lock:
+            if self._watch_conn is not None:
+                self._watch_conn.close()
+                self._watch_conn = None
+
+    def get_data_version(self) -> int:
+        """
+        데이터 버전을 반환합니다. 이 관리자를 통한 쓰기 작업이 커밋될 때마다 증가하며,
+        DB 전체의 posts 변경 횟수(트리거로 유지)가 이 프로세스가 커밋한 변경 횟수보다 더 늘었으면
+        다른 프로세스나 도구(import_posts.py, sqlite3 등)가 게시글을 바꾼 것이므로 한 번 더 증가시킵니다.
+
+        Returns:
+            int: 데이터 버전
+        """
+        with self._version_lock:
+            if self._watch_conn is None:
+                self._watch_conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            total = read_post_changes(self._watch_conn)
+            if total is not None:
+                external = total - self._local_changes
+                if external != self._external_changes:
+                    if self._external_changes is not None:
+                        self.data_version += 1
+                    self._external_changes = external
+            return self.data_version
+
     @contextmanager
-    def get_cursor(self):
+    def get_cursor(self, bump_version: bool = True):
         """
         데이터베이스 커서를 제공하는 컨텍스트 매니저입니다.
-        작업 완료 시 자동으로 커밋하고, 예외 발생 시 롤백하며, 종료 시 연결을 닫습니다.
+        작업 완료 시 자동으로 커밋하고, 예외 발생 시 롤백하며, 종료 시 연결을 풀에 반납합니다.
+        변경된 행이 있는 작업이 커밋되면 data_version을 증가시키고, 이 연결이 만든 게시글 변경 횟수를 합산합니다.
+        쿼리 계측이 켜져 있으면 연결 대기 시간, SQL별 실행 시간, 커밋 시간을 query_stats에 기록합니다.
+
+        Args:
+            bump_version (bool): False면 변경이 있어도 data_version을 증가시키지 않습니다.
+                조회 결과가 바뀌지 않는 유지보수 작업(기존 게시글 압축 등)이 캐시를 무효화하지 않게 할 때 사용합니다.
 
         Yields:
             sqlite3.Cursor: 데이터베이스 커서 객체
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        cancel_event = getattr(self._local, "cancel_event", None)
+        if cancel_event is not None and cancel_event.is_set():
+            raise QueryCancelledError("query cancelled")
+
+        pool = self.pool
+        stats = self.query_stats if self.query_stats.enabled else None
+        wait_start = time.perf_counter()
+        conn = pool.acquire()
+        if stats:
+            stats.record_wait(time.perf_counter() - wait_start)
+        if cancel_event is not None:
+            # 취소 이벤트가 설정되면 실행 중인 쿼리를 중단
+            conn.set_progress_handler(cancel_event.is_set, CANCEL_CHECK_INTERVAL)
+        cursor = stats.cursor(conn) if stats else conn.cursor()
+        changes = conn.total_changes
         try:
             yield cursor
-            conn.commit()
+            if conn.total_changes != changes:
+                # 커밋과 변경 횟수 합산 사이에 get_data_version이 끼어들어 이 변경을 다른 프로세스의 것으로 보지 않도록 함께 잠금
+                with self._version_lock:
+                    local_changes = take_local_changes(conn)
+                    commit_start = time.perf_counter()
+                    conn.commit()
+                    self._local_changes += local_changes
+                    if bump_version:
+                        self.data_version += 1
+                if stats:
+                    stats.record_statement("COMMIT", None, time.perf_counter() - commit_start, 0)
+            else:
+                conn.commit()
         except Exception as e:
             conn.rollback()
+            if cancel_event is not None and cancel_event.is_set() and isinstance(e, sqlite3.OperationalError):
+                raise QueryCancelledError("query cancelled") from e
             raise e
         finally:
-            conn.close()
+            cursor.close()
+            if cancel_event is not None:
+                conn.set_progress_handler(None, 0)
+            pool.release(conn)
+
+    @contextmanager
+    def cancellable(self, cancel_event: threading.Event):
+        """
+        이 블록 안에서 현재 스레드가 실행하는 쿼리를 cancel_event로 취소할 수 있게 하는 컨텍스트 매니저입니다.
+        다른 스레드에서 cancel_event.set()을 호출하면 실행 중인 쿼리가 중단되고 QueryCancelledError가 발생합니다.
+
+        Args:
+            cancel_event (threading.Event): 취소 요청 이벤트
+        """
+        previous = getattr(self._local, "cancel_event", None)
+        self._local.cancel_event = cancel_event
+        try:
+            yield
+        finally:
+            self._local.cancel_event = previous
 
 
 db = DatabaseManager()
@@ -0,0 +1,138 @@
+import sqlite3
+from typing import Callable
+
+from app.database.compression import create_compression_state
+from app.database.post_changes import create_post_changes
+from app.database.post_counter import create_post_counter
+from app.database.search_index import create_search_index, has_search_index, is_search_index_current
+from app.models import Post
+
+
+# posts 테이블의 보조 인덱스 (이름, 생성 SQL). 대량 적재 중에는 잠시 제거했다가 마지막에 다시 만듭니다.
+POSTS_INDEXES = (
+    ("idx_posts_created_at_id",
+     "CREATE INDEX IF NOT EXISTS idx_posts_created_at_id ON posts (created_at DESC, id DESC)"),
+    ("idx_posts_author", "CREATE INDEX IF NOT EXISTS idx_posts_author ON posts (author)"),
+    ("idx_posts_updated_at", "CREATE INDEX IF NOT EXISTS idx_posts_updated_at ON posts (updated_at)"),
+)
+
+
+def _create_posts_table(conn: sqlite3.Connection) -> None:
+    """
+    posts 테이블을 생성합니다. (스키마 버전 1)
+    """
+    conn.execute(Post.CREATE_TABLE_SQL)
+
+
+def _add_posts_indexes(conn: sqlite3.Connection) -> None:
+    """
+    목록 정렬, 작성자 및 수정일 조회에 필요한 인덱스를 추가합니다. (스키마 버전 2)
+    """
+    for _, sql in POSTS_INDEXES:
+        conn.execute(sql)
+
+
+def _add_posts_search_index(conn: sqlite3.Connection) -> None:
+    """
+    FTS5 검색 인덱스를 만들고 기존 게시글을 색인합니다. (스키마 버전 3)
+    FTS5를 지원하지 않는 Python 빌드에서는 건너뛰며, 검색은 LIKE 방식으로 동작합니다.
+    """
+    create_search_index(conn)
+
+
+def _add_post_counter(conn: sqlite3.Connection) -> None:
+    """
+    트리거로 유지되는 전체 게시글 수 카운터 테이블을 추가합니다. (스키마 버전 4)
+    """
+    create_post_counter(conn)
+
+
+def _add_content_compression(conn: sqlite3.Connection) -> None:
+    """
+    검색 인덱스를 PostDao가 원문을 직접 넣는 contentless 형식으로 다시 만들고, 기존 게시글 압축 진행 상태를 추가합니다. (스키마 버전 5)
+    압축된 본문은 앱이 등록한 SQL 함수 없이 읽을 수 없으므로, 검색 인덱스가 posts의 본문을 직접 읽지 않게 합니다.
+    검색 인덱스가 없는 DB(FTS5 미지원)는 본문 LIKE 검색이 원문을 읽어야 하므로 본문을 압축하지 않습니다.
+    기존 게시글은 시작 시간을 늘리지 않도록 여기서 압축하지 않고, 앱 실행 중 백그라운드에서 나눠 압축합니다.
+    """
+    search_index = has_search_index(conn)
+    if search_index and not is_search_index_current(conn):
+        create_search_index(conn)
+    create_compression_state(conn, compress_existing=search_index)
+
+
+def _add_post_changes(conn: sqlite3.Connection) -> None:
+    """
+    트리거로 유지되는 posts 변경 횟수 테이블을 추가합니다. (스키마 버전 6)
+    다른 프로세스(import_posts.py 등)나 도구가 게시글을 바꿨는지 알아내어 앱의 캐시를 버리는 데 사용합니다.
+    """
+    create_post_changes(conn)
+
+
+# (버전, 설명, 적용 함수) 목록. 버전 순서대로 적용되며 각 함수는 여러 번 실행해도 안전해야 합니다.
+# 새 마이그레이션은 항상 목록 끝에 다음 버전 번호로 추가합니다.
+MIGRATIONS: list[tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "create posts table", _create_posts_table),
+    (2, "add posts indexes", _add_posts_indexes),
+    (3, "add posts full-text search index", _add_posts_search_index),
+    (4, "add post counter", _add_post_counter),
+    (5, "add content compression", _add_content_compression),
+    (6, "add post change counter", _add_post_changes),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """
+    데이터베이스에 기록된 스키마 버전(PRAGMA user_version)을 반환합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        int: 현재 스키마 버전
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    아직 적용되지 않은 마이그레이션을 버전 순서대로 적용합니다.
+    마이그레이션마다 하나의 트랜잭션 안에서 스키마 변경과 버전 기록을 함께 수행하므로,
+    도중에 실패하거나 프로그램이 종료되어도 기존 DB는 직전 버전 상태로 남습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        int: 적용 후 스키마 버전
+    """
+    isolation_level = conn.isolation_level
+    # 트랜잭션을 직접 제어하기 위해 sqlite3 모듈의 암묵적 트랜잭션을 끕니다.
+    conn.isolation_level = None
+    applied = False
+    try:
+        for version, description, apply in MIGRATIONS:
+            if version <= get_schema_version(conn):
+                continue
+
+            # 쓰기 잠금을 먼저 잡은 뒤 버전을 다시 확인하여 다른 프로세스와 중복 적용을 막습니다.
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if version > get_schema_version(conn):
+                    apply(conn)
+                    conn.execute(f"PRAGMA user_version = {version}")
+                    applied = True
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                raise sqlite3.DatabaseError(f"Migration {version} ({description}) failed: {e}") from e
+
+        # 새로 만든 인덱스를 쿼리 플래너가 활용하도록 통계를 갱신합니다.
+        # 이미 최신 버전이면 시작 시간을 줄이기 위해 건너뜁니다.
+        if applied:
+            conn.execute("PRAGMA optimize")
+    finally:
+        conn.isolation_level = isolation_level
+
+    return get_schema_version(conn)
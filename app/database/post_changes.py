@@ -0,0 +1,111 @@
+import sqlite3
+from typing import Optional
+
+# posts 테이블의 행 변경(추가/수정/삭제) 누적 횟수. 트리거로 유지되므로 어느 프로세스나 도구가 바꿔도 증가합니다.
+_CREATE_CHANGES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS post_changes
+    (
+        id    INTEGER PRIMARY KEY CHECK (id = 1),
+        total INTEGER NOT NULL
+    )
+"""
+
+_CREATE_TRIGGERS_SQL = tuple(
+    f"""
+    CREATE TRIGGER IF NOT EXISTS post_changes_{suffix} AFTER {event} ON posts BEGIN
+        UPDATE post_changes SET total = total + 1 WHERE id = 1;
+    END
+    """
+    for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+)
+
+# 이 연결이 만든 posts 행 변경 횟수. 연결마다 따로 있는 임시(temp) 테이블과 임시 트리거로 셉니다.
+_CREATE_LOCAL_TABLE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS local_post_changes
+    (
+        id    INTEGER PRIMARY KEY CHECK (id = 1),
+        total INTEGER NOT NULL
+    )
+"""
+
+_CREATE_LOCAL_TRIGGERS_SQL = tuple(
+    f"""
+    CREATE TEMP TRIGGER IF NOT EXISTS local_post_changes_{suffix} AFTER {event} ON main.posts BEGIN
+        UPDATE local_post_changes SET total = total + 1 WHERE id = 1;
+    END
+    """
+    for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+)
+
+
+def create_post_changes(conn: sqlite3.Connection) -> None:
+    """
+    posts 변경 횟수 테이블과 갱신 트리거를 만들고, 이 연결의 변경 횟수를 세기 시작합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    conn.execute(_CREATE_CHANGES_TABLE_SQL)
+    conn.execute("INSERT OR IGNORE INTO post_changes (id, total) VALUES (1, 0)")
+    for sql in _CREATE_TRIGGERS_SQL:
+        conn.execute(sql)
+    track_local_changes(conn)
+
+
+def track_local_changes(conn: sqlite3.Connection) -> bool:
+    """
+    이 연결이 만든 posts 변경 횟수를 세는 임시 테이블과 임시 트리거를 만듭니다.
+    임시 객체는 연결을 닫으면 사라지며, 스키마에 남지 않으므로 다른 도구에는 영향이 없습니다.
+    DB에 posts 변경 횟수 테이블이 없으면(마이그레이션 전) 아무 작업도 하지 않습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        bool: 변경 횟수를 세고 있으면 True
+    """
+    if read_post_changes(conn) is None:
+        return False
+    conn.execute(_CREATE_LOCAL_TABLE_SQL)
+    conn.execute("INSERT OR IGNORE INTO temp.local_post_changes (id, total) VALUES (1, 0)")
+    for sql in _CREATE_LOCAL_TRIGGERS_SQL:
+        conn.execute(sql)
+    return True
+
+
+def read_post_changes(conn: sqlite3.Connection) -> Optional[int]:
+    """
+    DB 전체의 posts 변경 누적 횟수를 반환합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        Optional[int]: 변경 횟수. posts 변경 횟수 테이블이 없으면 None
+    """
+    try:
+        row = conn.execute("SELECT total FROM main.post_changes WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def take_local_changes(conn: sqlite3.Connection) -> int:
+    """
+    이 연결이 마지막 호출 이후 만든 posts 변경 횟수를 반환하고 0으로 되돌립니다.
+    커밋 직전에 같은 트랜잭션에서 호출해야 변경과 횟수가 함께 커밋(또는 롤백)됩니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        int: 변경 횟수. 변경 횟수를 세지 않는 연결이면 0
+    """
+    try:
+        row = conn.execute("SELECT total FROM temp.local_post_changes WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    if not row or not row[0]:
+        return 0
+    conn.execute("UPDATE temp.local_post_changes SET total = 0 WHERE id = 1")
+    return row[0]
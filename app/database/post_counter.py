@@ -0,0 +1,74 @@
+import sqlite3
+
+_CREATE_COUNTER_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS post_counter
+    (
+        id    INTEGER PRIMARY KEY CHECK (id = 1),
+        total INTEGER NOT NULL
+    )
+"""
+
+_CREATE_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER IF NOT EXISTS post_counter_ai AFTER INSERT ON posts BEGIN
+        UPDATE post_counter SET total = total + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS post_counter_ad AFTER DELETE ON posts BEGIN
+        UPDATE post_counter SET total = total - 1 WHERE id = 1;
+    END
+    """,
+)
+
+_TRIGGER_NAMES = ("post_counter_ai", "post_counter_ad")
+
+
+def create_post_counter(conn: sqlite3.Connection) -> None:
+    """
+    전체 게시글 수를 보관하는 카운터 테이블과 갱신 트리거를 만들고 현재 개수로 초기화합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    conn.execute(_CREATE_COUNTER_TABLE_SQL)
+    rebuild_post_counter(conn)
+    create_post_counter_triggers(conn)
+
+
+def create_post_counter_triggers(conn: sqlite3.Connection) -> None:
+    """
+    게시글 추가/삭제 시 카운터를 갱신하는 트리거를 만듭니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    for sql in _CREATE_TRIGGERS_SQL:
+        conn.execute(sql)
+
+
+def drop_post_counter_triggers(conn: sqlite3.Connection) -> None:
+    """
+    카운터 갱신 트리거를 제거합니다. (대량 작업 중 갱신을 미루기 위해 사용)
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    for name in _TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def rebuild_post_counter(conn: sqlite3.Connection) -> int:
+    """
+    posts 테이블을 직접 세어 카운터 값을 복구합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        int: 복구된 전체 게시글 수
+    """
+    total = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+    conn.execute("INSERT OR REPLACE INTO post_counter (id, total) VALUES (1, ?)", (total,))
+    return total
+
@@ -1,15 +1,74 @@
-from typing import Optional
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from itertools import islice, starmap
+from typing import Callable, Iterable, Iterator, Optional
 
 from app.database import db
-from app.models import Post
+from app.database.compression import COMPRESS_BATCH_SIZE, compress_content, compress_existing_posts, unzip_sql
+from app.database.post_counter import rebuild_post_counter
+from app.database.search_index import (FTS_TABLE, FTS_MIN_KEYWORD_LENGTH, has_search_index, index_posts,
+                                       short_keyword_condition, unindex_posts)
+from app.models import Post, PostSummary
+
+# 조회 컬럼 순서는 모델의 필드 순서와 같아야 합니다. (튜플 행을 그대로 위치 인자로 전달하기 때문)
+# 게시글 전체 컬럼
+POST_COLUMNS = tuple(field.name for field in fields(Post))
+# 목록 조회에서 읽는 컬럼 (본문 content는 상세/수정 화면에서 get_post로 따로 조회)
+SUMMARY_COLUMNS = tuple(field.name for field in fields(PostSummary))
+
+# insert_posts에서 한 트랜잭션으로 묶어 추가할 기본 게시글 수
+INSERT_BATCH_SIZE = 5000
+# iter_posts에서 한 번에 읽을 기본 게시글 수
+EXPORT_CHUNK_SIZE = 1000
+# iter_search_page에서 찾는 대로 한 번에 넘길 게시글 수
+SEARCH_STREAM_BATCH_SIZE = 4
+
+# 검색 결과 id 목록을 기억해 둘 최대 검색어 수
+SEARCH_ID_CACHE_SIZE = 32
+# 검색 결과가 이보다 많으면 id 목록을 기억하지 않음 (메모리 제한)
+SEARCH_ID_CACHE_MAX_IDS = 100_000
+
+# 검색 결과 정렬 기준: 최신순 / 관련도(BM25)순
+SEARCH_ORDER_RECENT = "recent"
+SEARCH_ORDER_RELEVANCE = "relevance"
+
+
+def _select_list(columns: tuple, table: str = "") -> str:
+    """
+    SELECT 컬럼 목록을 만듭니다. 본문(content)은 압축되어 저장될 수 있으므로 원문으로 풀어서 읽습니다.
+
+    Args:
+        columns (tuple): 컬럼 이름들
+        table (str): 컬럼 앞에 붙일 테이블 이름 (JOIN 쿼리용)
+
+    Returns:
+        str: "title, (CASE ... END), author, ..." 형태의 SQL
+    """
+    prefix = f"{table}." if table else ""
+    return ", ".join(unzip_sql(prefix + column) if column == "content" else prefix + column for column in columns)
 
 
 class PostDao:
     """
     게시글(Posts)과 관련한 DB 작업을 전담하는 클래스입니다.
     SQL 쿼리는 이 파일 안에만 존재해야 합니다.
+    긴 본문은 압축하여 저장하고(compression 참고), 조회할 때는 항상 원문으로 풀어서 반환합니다.
+    검색 인덱스는 게시글을 추가/수정/삭제하는 트랜잭션 안에서 원문으로 함께 갱신합니다. (search_index 참고)
+    검색 인덱스가 없는 DB(FTS5 미지원)는 본문 LIKE 검색을 위해 본문을 압축하지 않습니다.
     """
 
+    def __init__(self):
+        """
+        PostDao 초기화 메서드입니다.
+        검색 인덱스(FTS5) 사용 가능 여부는 처음 검색할 때 확인합니다.
+        """
+        self._search_index_ready = None
+        # 검색어 -> (계산한 시점의 데이터 버전, 최신순으로 정렬된 검색 결과 id 리스트)
+        self._search_ids = OrderedDict()
+        self._search_ids_lock = threading.Lock()
+
     def insert_post(self, post: Post) -> None:
         """
         새로운 게시글을 데이터베이스에 추가합니다.
@@ -19,9 +78,50 @@ class PostDao:
         """
         new_post = post
         with db.get_cursor() as cursor:
+            search_index = self._has_search_index(cursor)
             sql = "INSERT INTO posts (title, content, author) VALUES (?, ?, ?)"
-            cursor.execute(sql, (new_post.title, new_post.content, new_post.author))
+            cursor.execute(sql, (new_post.title, self._stored_content(new_post.content, search_index), new_post.author))
+            if search_index:
+                index_posts(cursor, [(cursor.lastrowid, new_post.title, new_post.content)])
+
+    def insert_posts(self, posts: Iterable[Post], batch_size: int = INSERT_BATCH_SIZE,
+                     on_batch: Optional[Callable[[int], None]] = None) -> int:
+        """
+        여러 게시글을 batch_size개씩 묶어 한 트랜잭션에서 executemany로 추가합니다.
+        입력을 한 번에 메모리에 올리지 않으므로 제너레이터로 넘겨 대량의 게시글을 적재할 수 있습니다.
+        created_at, updated_at이 지정된 게시글은 그 값을 그대로 저장합니다.
+
+        Args:
+            posts (Iterable[Post]): 추가할 게시글 객체들
+            batch_size (int): 한 트랜잭션에서 추가할 게시글 수
+            on_batch (Callable[[int], None], optional): 배치 커밋마다 누적 추가 건수로 호출되는 함수
 
+        Returns:
+            int: 추가된 게시글 수
+        """
+        sql = """
+              INSERT INTO posts (title, content, author, created_at, updated_at)
+              VALUES (?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), COALESCE(?, ?, CURRENT_TIMESTAMP))
+              """
+        posts = iter(posts)
+        inserted = 0
+        while True:
+            batch = list(islice(posts, batch_size))
+            if not batch:
+                break
+            with db.get_cursor() as cursor:
+                search_index = self._has_search_index(cursor)
+                cursor.executemany(sql, ((post.title, self._stored_content(post.content, search_index), post.author,
+                                          post.created_at, post.updated_at, post.created_at) for post in batch))
+                if search_index:
+                    # 쓰기 잠금을 잡은 한 트랜잭션 안의 AUTOINCREMENT id는 연속이므로 마지막 id로 배치의 id를 구함
+                    last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    first_id = last_id - len(batch) + 1
+                    index_posts(cursor, ((first_id + i, post.title, post.content) for i, post in enumerate(batch)))
+            inserted += len(batch)
+            if on_batch:
+                on_batch(inserted)
+        return inserted
 
     def get_post(self, id: int) -> Optional[Post]:
         """
@@ -34,21 +134,29 @@ class PostDao:
             Optional[Post]: 해당 ID의 게시글 객체, 없으면 None 반환
         """
         with db.get_cursor() as cursor:
-            sql = "SELECT * FROM posts WHERE id = ?"
+            sql = f"SELECT {_select_list(POST_COLUMNS)} FROM posts WHERE id = ?"
             cursor.execute(sql, (id,))
-            row = cursor.fetchone()
+            posts_obj = self._fetch_models(cursor, Post)
 
-        if row:
-            return Post(
-                id=row['id'],
-                title=row['title'],
-                content=row['content'],
-                author=row['author'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-        else:
-            return None
+        return posts_obj[0] if posts_obj else None
+
+    def get_posts_by_ids(self, ids: list[int]) -> list[Post]:
+        """
+        여러 ID의 게시글을 한 번에 조회합니다. 없는 ID는 결과에서 빠집니다.
+
+        Args:
+            ids (list[int]): 조회할 게시글 ID 리스트
+
+        Returns:
+            list[Post]: 게시글 객체 리스트 (순서는 보장하지 않음)
+        """
+        if not ids:
+            return []
+        with db.get_cursor() as cursor:
+            placeholders = ', '.join(['?'] * len(ids))
+            sql = f"SELECT {_select_list(POST_COLUMNS)} FROM posts WHERE id IN ({placeholders})"
+            cursor.execute(sql, ids)
+            return self._fetch_models(cursor, Post)
 
     def update_post(self, updated_post: Post) -> None:
         """
@@ -60,8 +168,13 @@ class PostDao:
         """
         post = updated_post
         with db.get_cursor() as cursor:
+            search_index = self._has_search_index(cursor)
+            indexed = self._select_indexed(cursor, [post.id]) if search_index else []
             sql = "UPDATE posts SET title=?, content =?, author=?, updated_at = CURRENT_TIMESTAMP WHERE id = ?"
-            cursor.execute(sql, (post.title, post.content, post.author, post.id))
+            cursor.execute(sql, (post.title, self._stored_content(post.content, search_index), post.author, post.id))
+            if indexed and indexed[0][1:] != (post.title, post.content):
+                unindex_posts(cursor, indexed)
+                index_posts(cursor, [(post.id, post.title, post.content)])
 
     def delete_post(self, id: int) -> None:
         """
@@ -71,6 +184,8 @@ class PostDao:
             id (int): 삭제할 게시글의 ID
         """
         with db.get_cursor() as cursor:
+            if self._has_search_index(cursor):
+                unindex_posts(cursor, self._select_indexed(cursor, [id]))
             sql = "DELETE FROM posts WHERE id = ?"
             cursor.execute(sql, (id,))
 
@@ -88,81 +203,71 @@ class PostDao:
             return 0
         count = 0
         with db.get_cursor() as cursor:
+            if self._has_search_index(cursor):
+                unindex_posts(cursor, self._select_indexed(cursor, ids))
             placeholders = ', '.join(['?'] * len(ids))
             sql = "DELETE FROM posts WHERE id IN ({})".format(placeholders)
             cursor.execute(sql, ids)
             count = cursor.rowcount
         return count
 
-    def get_posts_paginated(self, page: int, limit: int) -> list[Post]:
+    def get_posts_paginated(self, page: int, limit: int) -> list[PostSummary]:
         """
-        게시글 목록을 페이지네이션하여 조회합니다.
+        게시글 목록을 페이지네이션하여 조회합니다. 본문(content)은 조회하지 않습니다.
 
         Args:
             page (int): 조회할 페이지 번호 (1부터 시작)
             limit (int): 한 페이지당 보여줄 게시글 수
 
         Returns:
-            list[Post]: 해당 페이지의 게시글 객체 리스트
+            list[PostSummary]: 해당 페이지의 게시글 요약 객체 리스트
         """
         offset = (page - 1) * limit
         with db.get_cursor() as cursor:
-            sql = "SELECT * FROM posts ORDER BY created_at DESC LIMIT ? OFFSET ?"
+            sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM posts ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?"
             cursor.execute(sql, (limit, offset))
-            rows = cursor.fetchall()
-
-        posts_obj = []
-        for row in rows:
-            post = Post(
-                id=row['id'],
-                title=row['title'],
-                content=row['content'],
-                author=row['author'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-            posts_obj.append(post)
-        return posts_obj
+            return self._fetch_models(cursor, PostSummary)
 
     def get_total_count(self) -> int:
         """
         전체 게시글의 개수를 조회합니다.
+        트리거로 유지되는 카운터 테이블을 읽으므로 게시글 수와 무관하게 O(1)입니다.
 
         Returns:
             int: 전체 게시글 수
         """
         with db.get_cursor() as cursor:
-            sql = "SELECT COUNT(*) FROM posts"
+            sql = "SELECT total FROM post_counter WHERE id = 1"
             cursor.execute(sql)
-            count = cursor.fetchone()[0]
-            return count if count else 0
+            row = cursor.fetchone()
+            return row[0] if row else 0
 
-    def search_post(self, keyword: str):
+    def rebuild_post_counter(self) -> int:
+        """
+        전체 게시글 수 카운터를 posts 테이블 기준으로 다시 계산합니다.
+        트리거 없이 DB가 수정되어 카운터가 어긋났을 때 복구용으로 사용합니다.
+
+        Returns:
+            int: 복구된 전체 게시글 수
+        """
+        with db.get_cursor() as cursor:
+            return rebuild_post_counter(cursor.connection)
+
+    def search_post(self, keyword: str, order: str = SEARCH_ORDER_RECENT):
         """
         제목이나 내용에 키워드가 포함된 게시글을 검색합니다.
 
         Args:
             keyword (str): 검색할 키워드
+            order (str): 정렬 기준 (SEARCH_ORDER_RECENT: 최신순, SEARCH_ORDER_RELEVANCE: 관련도순)
 
         Returns:
             list[Post]: 검색된 게시글 객체 리스트
         """
         with db.get_cursor() as cursor:
-            sql = "SELECT * FROM posts WHERE title LIKE ? OR content LIKE ?"
-            cursor.execute(sql, ('%' + keyword + '%', '%' + keyword + '%'))
-            rows = cursor.fetchall()
-        posts_obj = []
-        for row in rows:
-            post = Post(
-                id=row['id'],
-                title=row['title'],
-                content=row['content'],
-                author=row['author'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at']
-            )
-            posts_obj.append(post)
-        return posts_obj
+            sql, params = self._search_select_sql(keyword, order, cursor, columns=POST_COLUMNS)
+            cursor.execute(sql, params)
+            return self._fetch_models(cursor, Post)
 
     def get_search_count(self, keyword: str) -> int:
         """
@@ -175,13 +280,81 @@ class PostDao:
             int: 검색된 게시글 수
         """
         with db.get_cursor() as cursor:
-            sql = "SELECT COUNT(*) FROM posts WHERE title LIKE ? OR content LIKE ?"
-            param = f"%{keyword}%"
-            cursor.execute(sql, (param, param))
+            condition, params = self._search_condition(keyword, cursor)
+            sql = f"SELECT COUNT(*) FROM posts WHERE {condition}"
+            cursor.execute(sql, params)
             result = cursor.fetchone()
             return result[0] if result else 0
 
-    def get_search_posts_paginated(self, keyword: str, page: int, limit: int) -> list[Post]:
+    def get_search_ids(self, keyword: str, narrow_only: bool = False) -> Optional[list[int]]:
+        """
+        검색 결과 전체의 id를 최신순으로 반환합니다. 결과는 데이터 버전과 함께 기억해 두고,
+        기억해 둔 검색어를 포함하는 더 긴 검색어는 ("pyth" -> "python") 전체를 다시 검색하지 않고
+        기존 결과 id 안에서만 다시 검색합니다. 게시글이 바뀌면(다른 프로세스의 변경 포함, 데이터 버전 증가) 기억한 결과는 버립니다.
+
+        Args:
+            keyword (str): 검색할 키워드
+            narrow_only (bool): True면 기억해 둔 결과로 구할 수 있을 때만 반환하고 전체 검색은 하지 않음
+
+        Returns:
+            Optional[list[int]]: 최신순(created_at DESC, id DESC) 게시글 id 리스트.
+                결과가 너무 많거나 narrow_only인데 기억해 둔 결과가 없으면 None
+        """
+        # 다른 프로세스의 변경까지 반영한 버전이어야 가져오기 도구가 추가/삭제한 게시글이 좁혀 찾기에서 빠지지 않음
+        version = db.get_data_version()
+        with self._search_ids_lock:
+            for cached_keyword in [k for k, (v, _) in self._search_ids.items() if v != version]:
+                del self._search_ids[cached_keyword]
+            cached = self._search_ids.get(keyword)
+            if cached is not None:
+                self._search_ids.move_to_end(keyword)
+                return cached[1]
+            # 가장 긴(결과가 가장 적은) 포함 검색어의 결과에서 좁혀 나감
+            bases = [k for k in self._search_ids if self._can_narrow(k, keyword)]
+            base_ids = self._search_ids[max(bases, key=len)][1] if bases else None
+
+        if base_ids is None and narrow_only:
+            return None
+
+        with db.get_cursor() as cursor:
+            condition, params = self._search_condition(keyword, cursor)
+            if base_ids is not None:
+                condition = f"id IN (SELECT value FROM json_each(?)) AND {condition}"
+                params = (json.dumps(base_ids), *params)
+            sql = f"SELECT id FROM posts WHERE {condition} ORDER BY created_at DESC, id DESC LIMIT ?"
+            cursor.execute(sql, (*params, SEARCH_ID_CACHE_MAX_IDS + 1))
+            ids = [row[0] for row in cursor.fetchall()]
+        if len(ids) > SEARCH_ID_CACHE_MAX_IDS:
+            return None
+
+        with self._search_ids_lock:
+            self._search_ids[keyword] = (version, ids)
+            self._search_ids.move_to_end(keyword)
+            while len(self._search_ids) > SEARCH_ID_CACHE_SIZE:
+                self._search_ids.popitem(last=False)
+        return ids
+
+    def get_posts_by_ordered_ids(self, ids: list[int]) -> list[PostSummary]:
+        """
+        주어진 id 순서대로 게시글 요약을 조회합니다. 없는 id는 결과에서 빠집니다.
+
+        Args:
+            ids (list[int]): 게시글 ID 리스트
+
+        Returns:
+            list[PostSummary]: ids 순서의 게시글 요약 객체 리스트
+        """
+        if not ids:
+            return []
+        with db.get_cursor() as cursor:
+            placeholders = ', '.join(['?'] * len(ids))
+            sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM posts WHERE id IN ({placeholders})"
+            cursor.execute(sql, ids)
+            posts_by_id = {post.id: post for post in self._fetch_models(cursor, PostSummary)}
+        return [posts_by_id[id] for id in ids if id in posts_by_id]
+
+    def get_search_posts_paginated(self, keyword: str, page: int, limit: int,
+                                   order: str = SEARCH_ORDER_RECENT) -> list[PostSummary]:
         """
         검색된 게시글 목록을 페이지네이션하여 조회합니다.
 
@@ -189,32 +362,354 @@ class PostDao:
             keyword (str): 검색할 키워드
             page (int): 조회할 페이지 번호
             limit (int): 한 페이지당 보여줄 게시글 수
+            order (str): 정렬 기준 (SEARCH_ORDER_RECENT: 최신순, SEARCH_ORDER_RELEVANCE: 관련도순)
 
         Returns:
-            list[Post]: 해당 페이지의 검색된 게시글 객체 리스트
+            list[PostSummary]: 해당 페이지의 검색된 게시글 요약 객체 리스트
         """
         offset = (page - 1) * limit
         with db.get_cursor() as cursor:
-            sql = """
-                  SELECT *
+            sql, params = self._search_select_sql(keyword, order, cursor)
+            cursor.execute(sql + " LIMIT ? OFFSET ?", (*params, limit, offset))
+            return self._fetch_models(cursor, PostSummary)
+
+    def get_page_with_count(self, keyword: str, page: int, limit: int,
+                            order: str = SEARCH_ORDER_RECENT) -> tuple[list[PostSummary], int]:
+        """
+        게시글 목록의 한 페이지와 전체 개수를 한 번의 쿼리로 함께 조회합니다.
+        개수는 스칼라 서브쿼리로 한 번만 계산되므로 목록과 개수를 따로 조회할 때의 중복 검색을 피합니다.
+
+        Args:
+            keyword (str): 검색할 키워드 (빈 문자열이면 전체 목록)
+            page (int): 조회할 페이지 번호 (1부터 시작)
+            limit (int): 한 페이지당 보여줄 게시글 수
+            order (str): 검색 결과 정렬 기준
+
+        Returns:
+            tuple[list[PostSummary], int]: (해당 페이지의 게시글 요약 객체 리스트, 전체 게시글 수)
+        """
+        offset = (page - 1) * limit
+        with db.get_cursor() as cursor:
+            if keyword:
+                sql, params = self._search_select_sql(keyword, order, cursor, with_count=True)
+                count_sql, count_params = f"SELECT COUNT(*) FROM ({sql})", params
+            else:
+                # 전체 개수는 카운터 테이블에서 읽음
+                sql = f"""
+                      SELECT {', '.join(SUMMARY_COLUMNS)}, (SELECT total FROM post_counter WHERE id = 1) AS total_count
+                      FROM posts
+                      ORDER BY created_at DESC, id DESC
+                      """
+                params = ()
+                count_sql, count_params = "SELECT total FROM post_counter WHERE id = 1", ()
+
+            cursor.execute(sql + " LIMIT ? OFFSET ?", (*params, limit, offset))
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+            if rows:
+                # 마지막 컬럼이 total_count
+                count = rows[0][-1]
+                rows = [row[:-1] for row in rows]
+            else:
+                # 범위를 벗어난 페이지는 행이 없어 개수를 함께 받을 수 없으므로 같은 연결에서 따로 조회
+                cursor.execute(count_sql, count_params)
+                row = cursor.fetchone()
+                count = row[0] if row else 0
+
+        return list(starmap(PostSummary, rows)), count
+
+    def iter_search_page(self, keyword: str, page: int, limit: int, order: str = SEARCH_ORDER_RECENT,
+                         batch_size: int = SEARCH_STREAM_BATCH_SIZE) -> Iterator[list[PostSummary]]:
+        """
+        검색 결과의 한 페이지를 찾는 대로 batch_size개씩 나누어 반환하는 제너레이터입니다.
+        전체 검색(LIKE)처럼 오래 걸리는 검색에서 페이지가 다 찰 때까지 기다리지 않고 먼저 찾은 글부터 보여줄 때 사용합니다.
+
+        Args:
+            keyword (str): 검색할 키워드
+            page (int): 조회할 페이지 번호 (1부터 시작)
+            limit (int): 한 페이지당 보여줄 게시글 수
+            order (str): 검색 결과 정렬 기준
+            batch_size (int): 한 번에 넘길 게시글 수
+
+        Yields:
+            list[PostSummary]: 게시글 요약 객체 리스트
+        """
+        offset = (page - 1) * limit
+        with db.get_cursor() as cursor:
+            sql, params = self._search_select_sql(keyword, order, cursor)
+            cursor.execute(sql + " LIMIT ? OFFSET ?", (*params, limit, offset))
+            cursor.row_factory = None
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield list(starmap(PostSummary, rows))
+
+    def iter_posts(self, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[list[Post]]:
+        """
+        전체 게시글을 id 순서로 chunk_size개씩 나누어 반환하는 제너레이터입니다.
+        fetchmany로 필요한 만큼만 읽으므로 게시판 크기와 무관하게 메모리 사용량이 일정합니다.
+        제너레이터가 끝나거나 닫힐 때까지 커넥션 풀의 연결 하나를 사용합니다.
+
+        Args:
+            chunk_size (int): 한 번에 읽을 게시글 수
+
+        Yields:
+            list[Post]: 게시글 객체 리스트
+        """
+        with db.get_cursor() as cursor:
+            sql = f"SELECT {_select_list(POST_COLUMNS)} FROM posts ORDER BY id"
+            cursor.execute(sql)
+            cursor.row_factory = None
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield list(starmap(Post, rows))
+
+    def compress_existing_posts(self, batch_size: int = COMPRESS_BATCH_SIZE) -> Optional[tuple[int, int]]:
+        """
+        압축 기능 도입 전에 저장된 게시글 중 다음 batch_size개 범위의 본문을 압축합니다.
+        보이는 내용은 바뀌지 않으므로 data_version을 올리지 않아 목록/검색 캐시가 그대로 유지됩니다.
+
+        Args:
+            batch_size (int): 한 트랜잭션에서 처리할 게시글 수
+
+        Returns:
+            tuple[int, int] | None: (처리한 마지막 id, 압축 대상 마지막 id). 더 처리할 게시글이 없으면 None
+        """
+        with db.get_cursor(bump_version=False) as cursor:
+            return compress_existing_posts(cursor.connection, batch_size)
+
+    def get_data_version(self) -> int:
+        """
+        DB 데이터 버전을 반환합니다. 게시글이 추가, 수정, 삭제될 때마다 증가합니다. (다른 프로세스의 변경 포함)
+
+        Returns:
+            int: 데이터 버전
+        """
+        return db.get_data_version()
+
+    def cancellable(self, cancel_event: threading.Event):
+        """
+        이 블록 안에서 실행하는 조회를 cancel_event로 중간에 취소할 수 있게 하는 컨텍스트 매니저를 반환합니다.
+        취소되면 QueryCancelledError가 발생합니다.
+
+        Args:
+            cancel_event (threading.Event): 취소 요청 이벤트 (None이면 취소하지 않음)
+        """
+        return db.cancellable(cancel_event)
+
+    def get_posts_seek(self, limit: int, anchor: Optional[tuple] = None, backward: bool = False,
+                       offset: int = 0) -> list[PostSummary]:
+        """
+        (created_at, id) 키 기준의 키셋(seek) 방식으로 게시글 목록을 조회합니다.
+        앞선 행을 건너뛰지 않고 인덱스에서 기준점 바로 다음 행부터 읽으므로 페이지 깊이와 무관하게 빠릅니다.
+
+        Args:
+            limit (int): 조회할 게시글 수
+            anchor (tuple, optional): 기준 키 (created_at, id). None이면 목록의 처음(또는 끝)부터 조회
+            backward (bool): True면 기준 키보다 최신 글을 조회 (이전 페이지 방향)
+            offset (int): 기준 키 이후 건너뛸 게시글 수
+
+        Returns:
+            list[PostSummary]: 최신순(created_at DESC, id DESC)으로 정렬된 게시글 요약 객체 리스트
+        """
+        return self._select_seek("", limit, anchor, backward, offset)
+
+    def get_search_posts_seek(self, keyword: str, limit: int, anchor: Optional[tuple] = None,
+                              backward: bool = False, offset: int = 0) -> list[PostSummary]:
+        """
+        검색된 게시글 목록을 키셋(seek) 방식으로 조회합니다.
+
+        Args:
+            keyword (str): 검색할 키워드
+            limit (int): 조회할 게시글 수
+            anchor (tuple, optional): 기준 키 (created_at, id)
+            backward (bool): True면 기준 키보다 최신 글을 조회 (이전 페이지 방향)
+            offset (int): 기준 키 이후 건너뛸 게시글 수
+
+        Returns:
+            list[PostSummary]: 최신순으로 정렬된 검색 게시글 요약 객체 리스트
+        """
+        return self._select_seek(keyword, limit, anchor, backward, offset)
+
+    def _select_seek(self, keyword: str, limit: int, anchor: Optional[tuple], backward: bool,
+                     offset: int) -> list[PostSummary]:
+        """
+        키셋 조회 SQL을 조립하여 실행합니다. keyword가 빈 문자열이면 전체 목록을 조회합니다.
+        backward 조회는 오름차순으로 읽은 뒤 뒤집어 항상 최신순으로 반환합니다.
+        """
+        order = "created_at ASC, id ASC" if backward else "created_at DESC, id DESC"
+
+        with db.get_cursor() as cursor:
+            conditions, params = [], []
+            if keyword:
+                condition, condition_params = self._search_condition(keyword, cursor)
+                conditions.append(condition)
+                params.extend(condition_params)
+            if anchor is not None:
+                conditions.append("(created_at, id) > (?, ?)" if backward else "(created_at, id) < (?, ?)")
+                params.extend(anchor)
+            where = "WHERE " + " AND ".join(conditions) if conditions else ""
+            sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM posts {where} ORDER BY {order} LIMIT ? OFFSET ?"
+            cursor.execute(sql, (*params, limit, offset))
+            posts_obj = self._fetch_models(cursor, PostSummary)
+
+        if backward:
+            posts_obj.reverse()
+        return posts_obj
+
+    def _search_condition(self, keyword: str, cursor) -> tuple[str, tuple]:
+        """
+        검색 키워드에 대한 WHERE 조건과 파라미터를 만듭니다.
+        FTS5 검색 인덱스가 있으면 키워드가 충분히 길 때는 구문 검색을, 짧을 때는 trigram 목록 검색을 사용하고,
+        인덱스가 없으면 LIKE 전체 검색을 사용합니다.
+
+        Args:
+            keyword (str): 검색할 키워드
+            cursor: 조건을 사용할 쿼리를 실행할 커서 (검색 인덱스 확인에 사용)
+
+        Returns:
+            tuple[str, tuple]: (WHERE 조건 SQL, 파라미터)
+        """
+        if self._can_use_search_index(keyword, cursor):
+            return f"id IN (SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?)", (self._fts_phrase(keyword),)
+        if self._has_search_index(cursor):
+            # 짧은 검색어: 제목은 LIKE로, (압축되어 있을 수 있는) 본문은 검색 인덱스의 trigram 목록으로 찾음
+            # 인덱스 검색과 같이 와일드카드(%, _)도 글자 그대로 찾음
+            condition, params = short_keyword_condition(keyword)
+            escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return f"(title LIKE ? ESCAPE '\\' OR {condition})", (f"%{escaped}%", *params)
+        # 검색 인덱스가 없는 DB는 본문을 압축하지 않으므로 원문에 바로 LIKE 검색
+        param = f"%{keyword}%"
+        return "(title LIKE ? OR content LIKE ?)", (param, param)
+
+    def _search_select_sql(self, keyword: str, order: str, cursor, with_count: bool = False,
+                           columns: tuple = SUMMARY_COLUMNS) -> tuple[str, tuple]:
+        """
+        정렬 기준에 맞는 검색 SELECT 문과 파라미터를 만듭니다.
+        관련도순(BM25)은 검색 인덱스를 사용할 수 있을 때만 적용되고, 그 외에는 최신순으로 정렬합니다.
+        with_count가 True면 검색 결과 전체 개수를 total_count 컬럼으로 함께 조회합니다.
+        """
+        if order == SEARCH_ORDER_RELEVANCE and self._can_use_search_index(keyword, cursor):
+            phrase = self._fts_phrase(keyword)
+            if with_count:
+                count_column = f", (SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ?) AS total_count"
+                params = (phrase, phrase)
+            else:
+                count_column, params = "", (phrase,)
+            sql = f"""
+                  SELECT {_select_list(columns, 'posts')}{count_column}
+                  FROM {FTS_TABLE}
+                           JOIN posts ON posts.id = {FTS_TABLE}.rowid
+                  WHERE {FTS_TABLE} MATCH ?
+                  ORDER BY bm25({FTS_TABLE}), posts.id DESC
+                  """
+            return sql, params
+
+        condition, params = self._search_condition(keyword, cursor)
+        if with_count:
+            sql = f"""
+                  SELECT {_select_list(columns)}, (SELECT COUNT(*) FROM posts WHERE {condition}) AS total_count
                   FROM posts
-                  WHERE title LIKE ?
-                     OR content LIKE ?
-                  ORDER BY created_at DESC LIMIT ?
-                  OFFSET ? \
+                  WHERE {condition}
+                  ORDER BY created_at DESC, id DESC
                   """
-            param = f"%{keyword}%"
-            cursor.execute(sql, (param, param, limit, offset))
-            rows = cursor.fetchall()
-            posts_obj = []
-            for row in rows:
-                post = Post(
-                    id=row['id'],
-                    title=row['title'],
-                    content=row['content'],
-                    author=row['author'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                posts_obj.append(post)
-            return posts_obj
+            return sql, params + params
+        sql = f"SELECT {_select_list(columns)} FROM posts WHERE {condition} ORDER BY created_at DESC, id DESC"
+        return sql, params
+
+    @staticmethod
+    def _can_narrow(base: str, keyword: str) -> bool:
+        """
+        keyword의 검색 결과가 항상 base 검색 결과에 포함되는지 판단합니다.
+        base가 keyword의 부분 문자열이면 포함되지만, LIKE 와일드카드가 있거나
+        대소문자 구분이 검색 방식(LIKE/FTS)마다 다른 비ASCII 문자가 있으면 판단하지 않습니다.
+        """
+        if base == keyword or base not in keyword or '%' in base or '_' in base:
+            return False
+        return all(char.isascii() or char.lower() == char.upper() for char in base)
+
+    @staticmethod
+    def matches_keyword(post: Post, keyword: str) -> bool:
+        """
+        게시글이 키워드 검색 결과에 포함될 수 있는지 메모리에서 판단합니다. (캐시 무효화용)
+        DB 검색보다 넓게 판단하므로, False면 해당 검색 결과에 절대 포함되지 않습니다.
+
+        Args:
+            post (Post): 제목과 본문이 있는 게시글 객체
+            keyword (str): 검색 키워드
+
+        Returns:
+            bool: 검색 결과에 포함될 수 있으면 True
+        """
+        # LIKE 와일드카드가 들어간 키워드는 부분 문자열 비교로 판단할 수 없음
+        if '%' in keyword or '_' in keyword:
+            return True
+        keyword = keyword.casefold()
+        return keyword in post.title.casefold() or keyword in post.content.casefold()
+
+    def _can_use_search_index(self, keyword: str, cursor) -> bool:
+        """
+        키워드 검색에 FTS5 검색 인덱스의 구문(MATCH) 검색을 사용할 수 있는지 확인합니다.
+        """
+        return self._has_search_index(cursor) and len(keyword) >= FTS_MIN_KEYWORD_LENGTH
+
+    def _has_search_index(self, cursor) -> bool:
+        """
+        DB에 검색 인덱스가 있는지 확인합니다.
+        인덱스 존재 여부는 DAO 인스턴스마다 한 번만, 호출자가 이미 사용 중인 커서의 연결로 조회합니다.
+        (연결을 따로 빌리면 쿼리 하나에 풀의 연결 두 개를 쓰게 되어 풀이 바쁠 때 멈출 수 있음)
+        """
+        if self._search_index_ready is None:
+            self._search_index_ready = has_search_index(cursor.connection)
+        return self._search_index_ready
+
+    @staticmethod
+    def _stored_content(content: str, search_index: bool):
+        """
+        본문을 저장할 값으로 바꿉니다. 검색 인덱스가 없는 DB는 본문 LIKE 검색을 위해 압축하지 않습니다.
+        """
+        return compress_content(content) if search_index else content
+
+    @staticmethod
+    def _select_indexed(cursor, ids: list[int]) -> list[tuple[int, str, str]]:
+        """
+        검색 인덱스에서 지우는 데 필요한 게시글의 (id, 제목, 원문 본문)을 조회합니다.
+        앱 밖의 도구로 추가되어 색인되지 않은 게시글은 지우면 인덱스가 손상되므로 제외합니다.
+        """
+        placeholders = ', '.join(['?'] * len(ids))
+        sql = f"""
+              SELECT id, title, {unzip_sql()}
+              FROM posts
+              WHERE id IN ({placeholders})
+                AND EXISTS (SELECT 1 FROM {FTS_TABLE} WHERE rowid = posts.id)
+              """
+        cursor.execute(sql, ids)
+        cursor.row_factory = None
+        return cursor.fetchall()
+
+    @staticmethod
+    def _fts_phrase(keyword: str) -> str:
+        """
+        키워드를 FTS5 구문(phrase) 검색어로 변환합니다. 특수 문자는 따옴표로 감싸 그대로 검색합니다.
+        """
+        return '"' + keyword.replace('"', '""') + '"'
+
+    @staticmethod
+    def _fetch_models(cursor, model) -> list:
+        """
+        커서의 남은 결과 행을 model(Post 또는 PostSummary) 객체 리스트로 변환합니다.
+        SELECT 컬럼 순서가 model의 필드 순서와 같으므로, 컬럼 이름 조회 없이
+        튜플 행을 그대로 생성자의 위치 인자로 전달합니다.
+
+        Args:
+            cursor: 조회를 실행한 커서
+            model: 변환할 모델 클래스
+
+        Returns:
+            list: 모델 객체 리스트
+        """
+        cursor.row_factory = None
+        return list(starmap(model, cursor.fetchall()))
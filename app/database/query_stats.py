@@ -0,0 +1,351 @@
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from typing import Optional
+
+# 쿼리 계측을 켜는 환경 변수와 느린 쿼리 기준(밀리초)을 바꾸는 환경 변수
+QUERY_STATS_ENV = "BOARD_QUERY_STATS"
+SLOW_QUERY_MS_ENV = "BOARD_SLOW_QUERY_MS"
+# 느린 쿼리 로그에 파라미터 값(게시글 제목/본문 등)까지 남기도록 켜는 환경 변수. 기본은 개수와 타입만 기록
+SLOW_QUERY_PARAMS_ENV = "BOARD_SLOW_QUERY_PARAMS"
+# 느린 쿼리 기준(밀리초). 이 이상 걸린 쿼리는 실행 계획과 함께 느린 쿼리 로그에 기록
+SLOW_QUERY_MS = 100.0
+# 느린 쿼리 로그 파일 이름 (DB 파일과 같은 폴더)
+SLOW_QUERY_LOG = "slow_queries.log"
+# 지연 시간 히스토그램 구간의 상한(밀리초). 마지막 구간은 상한 없음
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+# 느린 쿼리 로그에 파라미터 값을 남길 때의 문자열 최대 길이
+MAX_LOGGED_PARAMS = 200
+
+# "IN (?, ?, ?)"처럼 개수가 바뀌는 자리표시자 목록을 하나로 묶기 위한 정규식
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def is_query_stats_enabled() -> bool:
+    """
+    환경 변수(BOARD_QUERY_STATS=1)로 쿼리 계측이 켜졌는지 확인합니다.
+    """
+    return os.environ.get(QUERY_STATS_ENV, "") not in ("", "0")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    같은 쿼리가 하나의 항목으로 집계되도록 공백과 가변 길이 자리표시자 목록을 정리합니다.
+
+    Args:
+        sql (str): 실행한 SQL
+
+    Returns:
+        str: 정리된 SQL (예: "... WHERE id IN (?, ...)")
+    """
+    return _PLACEHOLDER_LIST.sub("(?, ...)", _WHITESPACE.sub(" ", sql).strip())
+
+
+def describe_params(params) -> str:
+    """
+    파라미터 값을 드러내지 않도록 개수와 타입만 문자열로 만듭니다.
+
+    Args:
+        params: 바인딩한 파라미터 (시퀀스 또는 이름이 있는 dict, executemany면 None)
+
+    Returns:
+        str: 예) "3 (str, int, NoneType)", "2 (:title str, :id int)"
+    """
+    if params is None:
+        return "executemany"
+    if isinstance(params, dict):
+        types = [f":{name} {type(value).__name__}" for name, value in params.items()]
+    else:
+        types = [type(value).__name__ for value in params]
+    return f"{len(types)} ({', '.join(types)})"
+
+
+class LatencyHistogram:
+    """
+    지연 시간을 HISTOGRAM_BOUNDS_MS 구간별 개수로 모으는 히스토그램입니다.
+    모든 값을 보관하지 않으므로 실행 횟수와 무관하게 메모리 사용량이 일정합니다.
+    """
+
+    def __init__(self):
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+
+    def add(self, elapsed_ms: float, rows: int = 0) -> None:
+        self.buckets[bisect_left(HISTOGRAM_BOUNDS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows
+
+    def percentile(self, fraction: float) -> float:
+        """
+        fraction(0~1) 백분위가 속한 구간의 상한(밀리초)을 반환합니다. 최댓값보다 크면(또는 마지막 구간이면) 최댓값을 반환합니다.
+        """
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(HISTOGRAM_BOUNDS_MS[index], self.max_ms) if index < len(HISTOGRAM_BOUNDS_MS) \
+                    else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p90_ms": self.percentile(0.90),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+            "buckets": dict(zip([*map(str, HISTOGRAM_BOUNDS_MS), "inf"], self.buckets)),
+        }
+
+
+class QueryStats:
+    """
+    DatabaseManager를 거쳐 실행되는 SQL의 실행 시간, 행 수, 연결 대기 시간을 모으는 클래스입니다.
+    쿼리별(정리한 SQL 기준) 지연 시간 히스토그램을 유지하고, 느린 쿼리는 실행 계획(EXPLAIN QUERY PLAN)과 함께
+    느린 쿼리 로그 파일에 기록합니다. 꺼져 있으면 DatabaseManager가 계측용 커서를 쓰지 않으므로 비용이 없습니다.
+    enable/disable로 실행 중에 켜고 끌 수 있습니다.
+    """
+
+    def __init__(self, enabled: bool = False, slow_query_ms: Optional[float] = None,
+                 slow_log_path: Optional[str] = None, log_param_values: Optional[bool] = None):
+        """
+        QueryStats 초기화 메서드입니다.
+
+        Args:
+            enabled (bool): 처음부터 계측할지 여부
+            slow_query_ms (float, optional): 느린 쿼리 기준(밀리초). None이면 환경 변수 또는 SLOW_QUERY_MS
+            slow_log_path (str, optional): 느린 쿼리 로그 파일 경로. None이면 로그 파일을 쓰지 않음
+            log_param_values (bool, optional): 느린 쿼리 로그에 파라미터 값까지 기록할지 여부.
+                None이면 환경 변수(BOARD_SLOW_QUERY_PARAMS=1)를 따르며, 꺼져 있으면 개수와 타입만 기록
+        """
+        self.enabled = enabled
+        if slow_query_ms is None:
+            slow_query_ms = float(os.environ.get(SLOW_QUERY_MS_ENV) or SLOW_QUERY_MS)
+        self.slow_query_ms = slow_query_ms
+        self.slow_log_path = slow_log_path
+        if log_param_values is None:
+            log_param_values = os.environ.get(SLOW_QUERY_PARAMS_ENV, "") not in ("", "0")
+        self.log_param_values = log_param_values
+        self._lock = threading.Lock()
+        # 정리한 SQL -> LatencyHistogram
+        self._statements = {}
+        self._wait = LatencyHistogram()
+        self.slow_queries = 0
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """
+        지금까지 모은 통계를 모두 버립니다.
+        """
+        with self._lock:
+            self._statements.clear()
+            self._wait = LatencyHistogram()
+            self.slow_queries = 0
+
+    def cursor(self, conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """
+        conn에서 실행 시간을 기록하는 커서를 만듭니다.
+        """
+        return conn.cursor(lambda connection: InstrumentedCursor(connection, self))
+
+    def record_wait(self, elapsed: float) -> None:
+        """
+        커넥션 풀에서 연결을 받기까지 기다린 시간을 기록합니다.
+
+        Args:
+            elapsed (float): 대기 시간(초)
+        """
+        with self._lock:
+            self._wait.add(elapsed * 1000)
+
+    def record_statement(self, sql: str, params, elapsed: float, rows: int,
+                         conn: Optional[sqlite3.Connection] = None) -> None:
+        """
+        SQL 하나의 실행 시간과 행 수를 기록합니다. 느린 쿼리면 실행 계획과 함께 로그에 남깁니다.
+
+        Args:
+            sql (str): 실행한 SQL
+            params: 바인딩한 파라미터 (executemany면 None)
+            elapsed (float): 실행과 결과 읽기에 걸린 시간(초)
+            rows (int): 읽은 행 수 (변경 쿼리는 변경된 행 수)
+            conn (sqlite3.Connection, optional): 실행 계획을 조회할 연결
+        """
+        elapsed_ms = elapsed * 1000
+        key = normalize_sql(sql)
+        with self._lock:
+            histogram = self._statements.get(key)
+            if histogram is None:
+                histogram = self._statements[key] = LatencyHistogram()
+            histogram.add(elapsed_ms, rows)
+            slow = elapsed_ms >= self.slow_query_ms
+            if slow:
+                self.slow_queries += 1
+        if slow and self.slow_log_path:
+            plan = self._explain(conn, sql, params) if conn is not None and params is not None else []
+            self._write_slow_query(key, params, elapsed_ms, rows, plan)
+
+    @staticmethod
+    def _explain(conn: sqlite3.Connection, sql: str, params) -> list[str]:
+        """
+        EXPLAIN QUERY PLAN 결과를 들여쓴 문자열 리스트로 반환합니다. 실패하면 빈 리스트를 반환합니다.
+        """
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        except (sqlite3.Error, ValueError):
+            return []
+        depth = {0: -1}
+        lines = []
+        for node_id, parent, _, detail in rows:
+            depth[node_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node_id] + detail)
+        return lines
+
+    def _write_slow_query(self, sql: str, params, elapsed_ms: float, rows: int, plan: list[str]) -> None:
+        # 파라미터에는 게시글 제목/본문이 들어가므로 명시적으로 켠 경우에만 값을 기록
+        if self.log_param_values:
+            params_text = repr(params)
+            if len(params_text) > MAX_LOGGED_PARAMS:
+                params_text = params_text[:MAX_LOGGED_PARAMS] + "..."
+        else:
+            params_text = describe_params(params)
+        lines = [
+            f"{datetime.now().isoformat(sep=' ', timespec='seconds')}  {elapsed_ms:.1f} ms  rows={rows}",
+            f"  sql: {sql}",
+            f"  params: {params_text}",
+            *(f"  plan: {line}" for line in plan),
+            "",
+        ]
+        try:
+            with self._lock, open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"Failed to write slow query log: {e}", file=sys.stderr)
+
+    def snapshot(self) -> dict:
+        """
+        지금까지 모은 통계를 반환합니다.
+
+        Returns:
+            dict: {"statements": {SQL: 통계}, "connection_wait": 통계, "slow_queries": 개수}
+        """
+        with self._lock:
+            return {
+                "statements": {sql: histogram.to_dict() for sql, histogram in self._statements.items()},
+                "connection_wait": self._wait.to_dict(),
+                "slow_queries": self.slow_queries,
+            }
+
+    def format_report(self, limit: int = 20) -> str:
+        """
+        총 실행 시간이 긴 순서로 쿼리별 통계를 표 형태의 문자열로 만듭니다.
+
+        Args:
+            limit (int): 출력할 최대 쿼리 수
+
+        Returns:
+            str: 보고서 문자열
+        """
+        data = self.snapshot()
+        wait = data["connection_wait"]
+        lines = [
+            f"{'count':>8}{'total ms':>11}{'mean':>9}{'p90':>9}{'max':>9}{'rows':>10}  sql",
+        ]
+        statements = sorted(data["statements"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for sql, stats in statements[:limit]:
+            lines.append(f"{stats['count']:>8}{stats['total_ms']:>11.1f}{stats['mean_ms']:>9.2f}"
+                         f"{stats['p90_ms']:>9.2f}{stats['max_ms']:>9.1f}{stats['rows']:>10}  {sql[:100]}")
+        lines.append(f"connection wait: {wait['count']} checkouts, mean {wait['mean_ms']:.3f} ms, "
+                     f"max {wait['max_ms']:.1f} ms; slow queries (>= {self.slow_query_ms:g} ms): "
+                     f"{data['slow_queries']}")
+        return "\n".join(lines)
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """
+    실행한 SQL마다 실행 시간과 행 수를 QueryStats에 기록하는 커서입니다.
+    SQLite는 결과를 읽는 동안 쿼리를 실행하므로, execute부터 마지막 fetch까지 커서 메서드 안에서 보낸 시간을 합산합니다.
+    (fetchmany로 나누어 읽는 동안 호출자가 다른 일을 한 시간은 포함하지 않음)
+    다음 execute, close 시점에 이전 SQL의 기록을 마칩니다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, stats: QueryStats):
+        super().__init__(conn)
+        self._stats = stats
+        self._sql = None
+        self._params = None
+        self._elapsed = 0.0
+        self._rows = 0
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        self._sql, self._params = sql, parameters
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._elapsed += time.perf_counter() - start
+            if not self.description:
+                # 결과 행이 없는 쿼리(INSERT/UPDATE/DELETE)는 변경된 행 수를 기록
+                self._rows = max(self.rowcount, 0)
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        self._sql, self._params = sql, None
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._elapsed += time.perf_counter() - start
+            self._rows = max(self.rowcount, 0)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._elapsed += time.perf_counter() - start
+        self._rows += row is not None
+        return row
+
+    def fetchmany(self, size=None):
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._elapsed += time.perf_counter() - start
+        self._rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._elapsed += time.perf_counter() - start
+        self._rows += len(rows)
+        return rows
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def _finish(self) -> None:
+        if self._sql is None:
+            return
+        sql, params, elapsed, rows = self._sql, self._params, self._elapsed, self._rows
+        self._sql, self._params, self._elapsed, self._rows = None, None, 0.0, 0
+        self._stats.record_statement(sql, params, elapsed, rows, self.connection)
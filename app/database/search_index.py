@@ -0,0 +1,158 @@
+import sqlite3
+from typing import Iterable
+
+from app.database.compression import decompress_content
+
+# 검색 인덱스로 사용하는 FTS5 가상 테이블 이름
+FTS_TABLE = "posts_fts"
+# 검색 인덱스의 trigram 목록(fts5vocab, 게시글별 위치 포함). 3글자 미만의 짧은 검색어를 인덱스에서 찾을 때 사용
+FTS_TERMS_TABLE = "posts_fts_terms"
+# trigram 토크나이저는 3글자 이상의 부분 문자열 검색만 인덱스로 처리할 수 있습니다.
+FTS_MIN_KEYWORD_LENGTH = 3
+# 색인하는 본문 뒤에 붙이는 문자. 본문 끝의 1~2글자도 어떤 trigram의 앞부분이 되어 짧은 검색어로 찾을 수 있음
+_CONTENT_PADDING = "\n" * (FTS_MIN_KEYWORD_LENGTH - 1)
+
+# 본문은 압축되어 저장될 수 있으므로(compression 참고) posts를 내용 테이블로 쓰지 않는 contentless 테이블입니다.
+# 색인할 원문은 PostDao가 posts 변경과 같은 트랜잭션에서 직접 넣고 지웁니다. (index_posts, unindex_posts)
+# 트리거나 SQL 함수에 의존하지 않으므로 앱 밖의 도구로 DB를 열어도 posts 변경이 실패하지 않지만,
+# 그런 도구로 바꾼 게시글은 검색 인덱스에 반영되지 않으므로 import_posts.py --repair로 다시 만들어야 합니다.
+_CREATE_FTS_TABLE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE}
+    USING fts5(title, content, content='', tokenize='trigram')
+"""
+
+_CREATE_TERMS_TABLE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TERMS_TABLE} USING fts5vocab({FTS_TABLE}, instance)
+"""
+
+# 이전 형식(스키마 버전 3, 4)에서 posts를 내용 테이블로 쓰던 검색 인덱스의 동기화 트리거
+_LEGACY_TRIGGER_NAMES = ("posts_fts_ai", "posts_fts_ad", "posts_fts_au")
+
+
+def is_fts5_available(conn: sqlite3.Connection) -> bool:
+    """
+    현재 Python 빌드의 SQLite가 FTS5와 trigram 토크나이저를 지원하는지 확인합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        bool: 지원하면 True
+    """
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp.fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+    return row is not None
+
+
+def has_search_index(conn: sqlite3.Connection) -> bool:
+    """
+    데이터베이스에 검색 인덱스(FTS5 테이블)가 만들어져 있는지 확인합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        bool: 검색 인덱스가 있으면 True
+    """
+    return _table_exists(conn, FTS_TABLE)
+
+
+def is_search_index_current(conn: sqlite3.Connection) -> bool:
+    """
+    검색 인덱스가 현재 형식(contentless 테이블과 trigram 목록)인지 확인합니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        bool: 현재 형식의 검색 인덱스가 있으면 True
+    """
+    return _table_exists(conn, FTS_TERMS_TABLE)
+
+
+def create_search_index(conn: sqlite3.Connection) -> bool:
+    """
+    검색 인덱스를 만들고 기존 게시글을 색인합니다. 이미 있으면(이전 형식 포함) 지우고 다시 만듭니다.
+    FTS5를 지원하지 않는 환경에서는 아무 작업도 하지 않습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+
+    Returns:
+        bool: 검색 인덱스가 준비되었으면 True
+    """
+    if not is_fts5_available(conn):
+        return False
+    for name in _LEGACY_TRIGGER_NAMES:
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    conn.execute(f"DROP TABLE IF EXISTS {FTS_TERMS_TABLE}")
+    conn.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+    conn.execute(_CREATE_FTS_TABLE_SQL)
+    conn.execute(_CREATE_TERMS_TABLE_SQL)
+    rebuild_search_index(conn)
+    return True
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> None:
+    """
+    posts 테이블 전체를 기준으로 검색 인덱스를 다시 만듭니다.
+    contentless 테이블은 FTS5의 'rebuild'를 쓸 수 없으므로, 비운 뒤 본문을 원문으로 풀어서 다시 넣습니다.
+
+    Args:
+        conn: 데이터베이스 연결 객체
+    """
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')")
+    rows = conn.execute("SELECT id, title, content FROM posts")
+    index_posts(conn, ((id, title, decompress_content(content)) for id, title, content in rows))
+
+
+def index_posts(conn: sqlite3.Connection | sqlite3.Cursor, posts: Iterable[tuple[int, str, str]]) -> None:
+    """
+    게시글을 검색 인덱스에 추가합니다. posts 테이블 변경과 같은 트랜잭션에서 호출해야 합니다.
+
+    Args:
+        conn: 데이터베이스 연결 또는 커서
+        posts (Iterable[tuple[int, str, str]]): (id, 제목, 원문 본문)
+    """
+    conn.executemany(f"INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (?, ?, ?)",
+                     ((id, title, content + _CONTENT_PADDING) for id, title, content in posts))
+
+
+def unindex_posts(conn: sqlite3.Connection | sqlite3.Cursor, posts: Iterable[tuple[int, str, str]]) -> None:
+    """
+    게시글을 검색 인덱스에서 지웁니다.
+    contentless 테이블은 색인한 내용을 보관하지 않으므로, 색인할 때와 같은 제목과 원문 본문을 넘겨야 합니다.
+
+    Args:
+        conn: 데이터베이스 연결 또는 커서
+        posts (Iterable[tuple[int, str, str]]): 색인되어 있는 (id, 제목, 원문 본문)
+    """
+    conn.executemany(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content) VALUES ('delete', ?, ?, ?)",
+                     ((id, title, content + _CONTENT_PADDING) for id, title, content in posts))
+
+
+def short_keyword_condition(keyword: str) -> tuple[str, tuple]:
+    """
+    FTS_MIN_KEYWORD_LENGTH보다 짧은 검색어로 본문을 찾는 WHERE 조건(posts.id 기준)과 파라미터를 만듭니다.
+    본문에 나오는 모든 1~2글자는 그 위치에서 시작하는 trigram의 앞부분이므로(_CONTENT_PADDING 참고),
+    검색어로 시작하는 trigram을 trigram 목록에서 범위로 찾아 해당 게시글을 구합니다.
+    본문을 읽거나 압축을 풀지 않으므로 비용은 게시판 크기가 아니라 검색어가 나온 횟수에 비례합니다.
+
+    Args:
+        keyword (str): 검색어 (1~2글자)
+
+    Returns:
+        tuple[str, tuple]: (WHERE 조건 SQL, 파라미터)
+    """
+    # trigram 토크나이저가 대소문자를 구분하지 않도록 소문자로 저장하므로 검색어도 소문자로 비교
+    prefix = keyword.lower()
+    condition = f"id IN (SELECT doc FROM {FTS_TERMS_TABLE} WHERE term >= ? AND term < ? AND col = 'content')"
+    return condition, (prefix, prefix + "\U0010ffff")
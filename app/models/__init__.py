@@ -1 +1 @@
-from .post_model import Post
\ No newline at end of file
+from .post_model import Post, PostSummary
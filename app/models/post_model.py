@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     """
     게시글 데이터를 담는 데이터 클래스입니다.
+    인스턴스별 __dict__ 없이 슬롯에 저장하여 대량 조회 시 메모리와 생성 비용을 줄입니다.
+    필드 순서는 PostDao의 조회 컬럼 순서와 같습니다.
     """
     title: str
     content: str
@@ -13,6 +15,19 @@ class Post:
     created_at: str = None
     updated_at: str = None
 
+    # posts 테이블 생성 SQL (스키마 마이그레이션에서도 사용)
+    CREATE_TABLE_SQL = '''
+                       CREATE TABLE IF NOT EXISTS posts
+                       (
+                           id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                           title      TEXT NOT NULL,
+                           content    TEXT NOT NULL,
+                           author     TEXT NOT NULL,
+                           created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                           updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                       )
+                       '''
+
     @staticmethod
     def create_table(conn):
         """
@@ -23,15 +38,18 @@ class Post:
             conn: 데이터베이스 연결 객체
         """
         cursor = conn.cursor()
-        cursor.execute('''
-                       CREATE TABLE IF NOT EXISTS posts
-                       (
-                           id         INTEGER PRIMARY KEY AUTOINCREMENT,
-                           title      TEXT NOT NULL,
-                           content    TEXT NOT NULL,
-                           author     TEXT NOT NULL,
-                           created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                           updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                       )
-                       ''')
+        cursor.execute(Post.CREATE_TABLE_SQL)
         conn.commit()
+
+
+@dataclass(slots=True)
+class PostSummary:
+    """
+    게시글 목록 표시에 필요한 정보만 담는 데이터 클래스입니다.
+    본문(content)은 포함하지 않으며, 필요할 때 id로 전체 게시글을 조회합니다.
+    """
+    id: int
+    title: str
+    author: str
+    created_at: str = None
+    updated_at: str = None
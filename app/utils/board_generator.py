@@ -0,0 +1,191 @@
+"""
+app/utils/board_generator.py
+
+부하 테스트용 가상 게시글을 만드는 모듈입니다.
+같은 시드(seed)와 개수로 만들면 항상 같은 게시글이 같은 순서로 만들어집니다.
+
+실제 게시판과 비슷하도록 다음 분포를 따릅니다.
+- 제목: 한국어/영어/혼합 제목, 단어 빈도는 소수의 단어가 자주 쓰이는 지프(Zipf) 분포
+- 본문 길이: 대부분 짧고 일부만 매우 긴 로그 정규 분포 (긴 꼬리)
+- 작성자: 소수의 작성자가 많은 글을 쓰는 지프 분포
+- 작성 시간: 시작 시각부터 시간 순서대로 증가, 일부 게시글만 작성 후 수정됨(updated_at)
+"""
+import bisect
+import math
+import random
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Iterator
+
+from app.models import Post
+
+# 기본 난수 시드
+DEFAULT_SEED = 42
+# 기본 작성 기간 시작 시각과 기간(일)
+DEFAULT_START = datetime(2022, 1, 1)
+DEFAULT_DAYS = 3 * 365
+# 작성자 수와 인기 편중 정도 (지프 지수, 클수록 소수 작성자에게 몰림)
+AUTHOR_COUNT = 5000
+AUTHOR_SKEW = 0.8
+# 단어 빈도 편중 정도 (지프 지수)
+WORD_SKEW = 1.0
+# 본문 길이(글자 수) 분포: 로그 정규 분포의 중앙값과 퍼짐 정도, 최소/최대 길이
+CONTENT_MEDIAN_LENGTH = 300
+CONTENT_LENGTH_SIGMA = 1.0
+CONTENT_MIN_LENGTH = 10
+CONTENT_MAX_LENGTH = 64 * 1024
+# 작성 후 수정된 게시글 비율과 작성~수정 평균 간격(초)
+EDITED_RATE = 0.15
+EDIT_DELAY_MEAN = 2 * 24 * 3600
+# 제목 종류 비율 (한국어, 영어, 혼합)
+TITLE_KIND_WEIGHTS = (0.45, 0.30, 0.25)
+# 본문을 잘라 쓰는 원본 텍스트 크기(글자 수). 게시글마다 이 안의 임의 위치에서 필요한 길이만큼 잘라 씀
+TEXT_POOL_SIZE = 2 * CONTENT_MAX_LENGTH
+# 제목 끝에 붙는 태그의 종류 수, 붙는 비율, 빈도 편중 정도.
+# 순위가 낮은 태그일수록 드물게 쓰이므로, 검색 결과 수가 다양한 검색어로 사용할 수 있음 (tag_word 참고)
+TAG_COUNT = 100_000
+TAG_RATE = 0.3
+TAG_SKEW = 1.0
+# 제목 앞에 붙는 말머리와 그 비율
+TITLE_PREFIXES = ("[질문]", "[정보]", "[후기]", "[공지]", "[잡담]", "[Q&A]", "[Tip]")
+TITLE_PREFIX_RATE = 0.2
+
+# 빈도순(앞쪽일수록 자주 사용) 단어 목록
+KOREAN_WORDS = (
+    "게시판", "질문", "있나요", "오늘", "방법", "문제", "정말", "추천", "후기", "좋은", "공유", "해결", "설치", "오류",
+    "안녕하세요", "감사합니다", "도와주세요", "업데이트", "버전", "사용", "처음", "자료", "정리", "프로젝트",
+    "개발", "데이터베이스", "화면", "검색", "속도", "개선", "리뷰", "궁금합니다", "이벤트", "모임", "스터디",
+    "주말", "날씨", "점심", "커피", "회사", "학교", "여행", "사진", "음악", "영화", "게임", "운동", "맛집",
+    "자유", "공지", "정보", "잡담", "문의", "안내", "변경", "일정", "결과", "테스트", "설정", "백업", "복구",
+)
+ENGLISH_WORDS = (
+    "python", "the", "how", "to", "error", "help", "with", "update", "new", "question", "best", "using", "issue",
+    "release", "guide", "tips", "performance", "board", "review", "first", "fix", "install", "windows", "linux",
+    "data", "table", "query", "slow", "fast", "memory", "thread", "cache", "index", "page", "search", "export",
+    "import", "build", "test", "bug", "feature", "version", "support", "mac", "qt", "pyside", "gui", "crash",
+    "database", "backup", "weekend", "coffee", "music", "travel", "photo", "game", "sqlite", "benchmark",
+)
+
+
+def tag_word(rank: int) -> str:
+    """
+    빈도 순위가 rank인 태그를 반환합니다. (1이 가장 자주 쓰임)
+    다른 태그의 부분 문자열이 되지 않도록 자릿수를 맞춥니다.
+
+    Args:
+        rank (int): 빈도 순위 (1 ~ TAG_COUNT)
+
+    Returns:
+        str: 태그 (예: "#tag00042")
+    """
+    return f"#tag{rank:05d}"
+
+
+def _zipf_cum_weights(count: int, skew: float) -> list[float]:
+    return list(accumulate(1.0 / (rank ** skew) for rank in range(1, count + 1)))
+
+
+def _timestamp_formatter(start: datetime):
+    """
+    시작 시각으로부터의 초를 "YYYY-MM-DD HH:MM:SS"(SQLite CURRENT_TIMESTAMP 형식)로 바꾸는 함수를 반환합니다.
+    게시글마다 strftime을 호출하지 않도록 날짜 문자열은 하루에 한 번만 만듭니다.
+    """
+    midnight = datetime(start.year, start.month, start.day)
+    start_offset = int((start - midnight).total_seconds())
+    dates = {}
+
+    def timestamp(seconds: float) -> str:
+        day, rest = divmod(int(seconds) + start_offset, 86400)
+        date = dates.get(day)
+        if date is None:
+            date = dates[day] = (midnight + timedelta(days=day)).strftime("%Y-%m-%d")
+        hour, rest = divmod(rest, 3600)
+        minute, second = divmod(rest, 60)
+        return f"{date} {hour:02d}:{minute:02d}:{second:02d}"
+
+    return timestamp
+
+
+def _make_text_pool(rng: random.Random, words: tuple, cum_weights: list[float], size: int) -> str:
+    """
+    본문을 잘라 쓸 원본 텍스트를 만듭니다. 문장과 문단 구분(줄바꿈)이 섞인 size 글자 이상의 문자열입니다.
+    """
+    parts = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(4, 14))) + "."
+        sentence += "\n\n" if rng.random() < 0.15 else " "
+        parts.append(sentence)
+        length += len(sentence)
+    return "".join(parts)
+
+
+def generate_posts(count: int, seed: int = DEFAULT_SEED, start: datetime = DEFAULT_START,
+                   days: int = DEFAULT_DAYS) -> Iterator[Post]:
+    """
+    가상 게시글을 작성 시간 순서대로 만드는 제너레이터입니다.
+    한 번에 메모리에 올리지 않으므로 PostDao.insert_posts에 그대로 넘겨 수백만 건을 적재할 수 있습니다.
+
+    Args:
+        count (int): 만들 게시글 수
+        seed (int): 난수 시드 (같은 시드와 개수면 같은 결과)
+        start (datetime): 첫 게시글 작성 시각 부근
+        days (int): 게시글 작성 기간(일). 게시글은 이 기간에 고르게 흩어짐
+
+    Yields:
+        Post: 게시글 객체 (id 없음, created_at/updated_at 지정)
+    """
+    rng = random.Random(seed)
+    korean_weights = _zipf_cum_weights(len(KOREAN_WORDS), WORD_SKEW)
+    english_weights = _zipf_cum_weights(len(ENGLISH_WORDS), WORD_SKEW)
+    mixed_words = KOREAN_WORDS + ENGLISH_WORDS
+    mixed_weights = _zipf_cum_weights(len(mixed_words), WORD_SKEW)
+    vocabularies = (
+        (KOREAN_WORDS, korean_weights),
+        (ENGLISH_WORDS, english_weights),
+        (mixed_words, mixed_weights),
+    )
+    kind_weights = list(accumulate(TITLE_KIND_WEIGHTS))
+    author_weights = _zipf_cum_weights(AUTHOR_COUNT, AUTHOR_SKEW)
+    author_total = author_weights[-1]
+    # 인기 순위와 이름이 겹치지 않도록 작성자 이름 순서를 섞음
+    authors = [f"user{number:04d}" for number in range(1, AUTHOR_COUNT + 1)]
+    rng.shuffle(authors)
+    text_pool = _make_text_pool(rng, mixed_words, mixed_weights, TEXT_POOL_SIZE)
+    text_pool_span = len(text_pool) - CONTENT_MAX_LENGTH
+    tag_weights = _zipf_cum_weights(TAG_COUNT, TAG_SKEW)
+    tag_total = tag_weights[-1]
+
+    mean_gap = days * 24 * 3600 / max(count, 1)
+    log_median = math.log(CONTENT_MEDIAN_LENGTH)
+    # 시간대(로컬 시간) 영향 없이 같은 결과가 나오도록 시작 시각으로부터의 초 단위로 계산
+    created = 0.0
+    timestamp = _timestamp_formatter(start)
+    random_value = rng.random
+    choices = rng.choices
+
+    for _ in range(count):
+        # 작성 간격은 지수 분포 (게시글이 무작위 시각에 올라오는 것과 같음)
+        created += rng.expovariate(1.0 / mean_gap)
+        created_at = timestamp(created)
+        if random_value() < EDITED_RATE:
+            updated_at = timestamp(created + rng.expovariate(1.0 / EDIT_DELAY_MEAN))
+        else:
+            updated_at = created_at
+
+        words, weights = vocabularies[bisect.bisect(kind_weights, random_value() * kind_weights[-1])]
+        title = " ".join(choices(words, cum_weights=weights, k=rng.randint(2, 9)))
+        if random_value() < TITLE_PREFIX_RATE:
+            title = f"{TITLE_PREFIXES[int(random_value() * len(TITLE_PREFIXES))]} {title}"
+        if random_value() < TAG_RATE:
+            title = f"{title} {tag_word(bisect.bisect(tag_weights, random_value() * tag_total) + 1)}"
+
+        length = int(rng.lognormvariate(log_median, CONTENT_LENGTH_SIGMA))
+        length = min(max(length, CONTENT_MIN_LENGTH), CONTENT_MAX_LENGTH)
+        # 단어 중간에서 시작하거나 끝나지 않도록 공백 기준으로 자름
+        offset = text_pool.find(" ", int(random_value() * text_pool_span)) + 1
+        end = text_pool.rfind(" ", offset, offset + length)
+        content = text_pool[offset:end if end > offset else offset + length].strip()
+
+        author = authors[bisect.bisect(author_weights, random_value() * author_total)]
+        yield Post(title=title, content=content, author=author, created_at=created_at, updated_at=updated_at)
@@ -0,0 +1,190 @@
+"""
+app/utils/post_io.py
+
+게시글을 CSV / JSONL 파일로 읽고 쓰는 모듈입니다.
+파일을 한 줄(한 행)씩 스트리밍으로 처리하므로 파일 크기와 무관하게 메모리 사용량이 일정합니다.
+파일 이름이 .gz로 끝나면 gzip 압축 파일로 처리합니다.
+"""
+import csv
+import gzip
+import json
+import os
+import time
+from typing import Callable, Iterable, Iterator, Optional
+
+from app.models import Post
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+# 파일에 기록하는 게시글 필드 순서
+FIELDS = ("id", "title", "content", "author", "created_at", "updated_at")
+
+# 대량 적재 진행 상황을 출력하는 최소 간격(초)
+REPORT_INTERVAL = 2.0
+
+# 본문이 긴 게시글도 읽을 수 있도록 CSV 필드 크기 제한을 늘립니다. (Windows C long 범위 내 최대값)
+csv.field_size_limit(2 ** 31 - 1)
+
+
+def detect_format(path: str) -> str:
+    """
+    파일 확장자로 파일 형식을 판별합니다.
+
+    Args:
+        path (str): 파일 경로 (예: posts.csv, posts.jsonl.gz)
+
+    Returns:
+        str: FORMAT_CSV 또는 FORMAT_JSONL
+    """
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return FORMAT_CSV
+    if name.endswith(".jsonl") or name.endswith(".ndjson"):
+        return FORMAT_JSONL
+    raise ValueError(f"Unsupported file format: {path} (use .csv or .jsonl, optionally .gz)")
+
+
+def open_text(path: str, mode: str = "r", compressed: Optional[bool] = None):
+    """
+    UTF-8 텍스트 파일을 엽니다. .gz 파일은 gzip으로 압축/해제합니다.
+
+    Args:
+        path (str): 파일 경로
+        mode (str): "r" 또는 "w"
+        compressed (bool, optional): gzip 사용 여부. None이면 확장자로 판단합니다.
+    """
+    if compressed is None:
+        compressed = path.lower().endswith(".gz")
+    # 읽을 때는 엑셀 등에서 저장한 BOM을 건너뜁니다.
+    encoding = "utf-8-sig" if mode == "r" else "utf-8"
+    if compressed:
+        return gzip.open(path, mode + "t", encoding=encoding, newline="")
+    return open(path, mode, encoding=encoding, newline="")
+
+
+def read_posts(path: str) -> Iterator[Post]:
+    """
+    CSV(헤더 필요) 또는 JSONL 파일에서 게시글을 하나씩 읽어 반환합니다.
+    title, content는 필수이며 author가 없으면 "anonymous"로 저장합니다.
+    id는 읽지 않으며 새 게시글 번호가 부여됩니다.
+    잘못된 레코드를 만나면 파일 경로와 줄 번호가 들어간 ValueError가 발생합니다.
+
+    Args:
+        path (str): 읽을 파일 경로
+
+    Yields:
+        Post: 읽은 게시글 객체
+    """
+    file_format = detect_format(path)
+    with open_text(path) as f:
+        for line_no, record in _read_records(path, f, file_format):
+            title = record.get("title")
+            content = record.get("content")
+            if not title or not content:
+                raise ValueError(f"{path}: line {line_no}: record has no title or content")
+            yield Post(
+                title=title,
+                content=content,
+                author=record.get("author") or "anonymous",
+                created_at=record.get("created_at") or None,
+                updated_at=record.get("updated_at") or None,
+            )
+
+
+def _read_records(path: str, f, file_format: str) -> Iterator[tuple[int, dict]]:
+    """
+    파일의 레코드를 (줄 번호, 레코드 dict)로 하나씩 반환합니다.
+    CSV의 줄 번호는 레코드가 끝나는 줄입니다. (본문에 줄바꿈이 있으면 여러 줄에 걸침)
+    """
+    if file_format == FORMAT_CSV:
+        reader = csv.DictReader(f)
+        for record in reader:
+            yield reader.line_num, record
+        return
+
+    for line_no, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}: line {line_no}: invalid JSON ({e.msg})") from e
+        if not isinstance(record, dict):
+            raise ValueError(f"{path}: line {line_no}: record is not a JSON object")
+        yield line_no, record
+
+
+def write_posts(chunks: Iterable[list[Post]], path: str,
+                on_progress: Optional[Callable[[int], None]] = None) -> int:
+    """
+    게시글 묶음을 받는 즉시 CSV 또는 JSONL 파일에 기록합니다.
+    임시 파일(.part)에 쓴 뒤 완료되면 대상 파일로 교체하므로, 도중에 실패해도 불완전한 파일이 남지 않습니다.
+
+    Args:
+        chunks (Iterable[list[Post]]): 게시글 리스트를 차례로 반환하는 이터러블 (예: PostDao.iter_posts())
+        path (str): 저장할 파일 경로 (.csv / .jsonl, .gz면 gzip 압축)
+        on_progress (Callable[[int], None], optional): 묶음을 기록할 때마다 누적 건수로 호출되는 함수
+
+    Returns:
+        int: 기록한 게시글 수
+    """
+    file_format = detect_format(path)
+    temp_path = path + ".part"
+    count = 0
+    try:
+        with open_text(temp_path, "w", compressed=path.lower().endswith(".gz")) as f:
+            if file_format == FORMAT_CSV:
+                writer = csv.writer(f)
+                writer.writerow(FIELDS)
+            for chunk in chunks:
+                if file_format == FORMAT_CSV:
+                    writer.writerows(
+                        (post.id, post.title, post.content, post.author, post.created_at, post.updated_at)
+                        for post in chunk
+                    )
+                else:
+                    f.writelines(
+                        json.dumps({field: getattr(post, field) for field in FIELDS}, ensure_ascii=False) + "\n"
+                        for post in chunk
+                    )
+                count += len(chunk)
+                if on_progress:
+                    on_progress(count)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return count
+
+
+class ThroughputReporter:
+    """
+    적재 건수와 초당 처리량을 주기적으로 출력하는 클래스입니다.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.start = time.perf_counter()
+        self.last_report = self.start
+        # 지금까지 커밋된 건수
+        self.count = 0
+
+    def __call__(self, count: int) -> None:
+        """
+        배치가 커밋될 때마다 호출되며, REPORT_INTERVAL마다 진행 상황을 출력합니다.
+        """
+        self.count = count
+        now = time.perf_counter()
+        if now - self.last_report >= REPORT_INTERVAL:
+            self.last_report = now
+            self.report(count, final=False)
+
+    def report(self, count: int, final: bool = True) -> None:
+        elapsed = time.perf_counter() - self.start
+        rate = count / elapsed if elapsed > 0 else 0
+        status = "done" if final else "..."
+        print(f"[{self.label}] {count:,} posts, {elapsed:.1f}s, {rate:,.0f} posts/s {status}", flush=True)
@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+from typing import Optional
+
+from PySide6.QtCore import QObject, QEvent
+
+# 시작 시간 측정을 켜는 환경 변수와 실행 인자
+STARTUP_PROFILE_ENV = "BOARD_PROFILE_STARTUP"
+STARTUP_PROFILE_FLAG = "--profile-startup"
+
+
+def is_startup_profiling_enabled(argv: Optional[list[str]] = None) -> bool:
+    """
+    환경 변수(BOARD_PROFILE_STARTUP=1) 또는 실행 인자(--profile-startup)로 시작 시간 측정이 켜졌는지 확인합니다.
+    """
+    argv = sys.argv if argv is None else argv
+    return os.environ.get(STARTUP_PROFILE_ENV, "") not in ("", "0") or STARTUP_PROFILE_FLAG in argv
+
+
+class StartupProfiler(QObject):
+    """
+    앱 시작 단계별 소요 시간을 기록하고 출력하는 클래스입니다.
+    꺼져 있으면 아무것도 기록하지 않습니다.
+    """
+
+    def __init__(self, start: float, enabled: Optional[bool] = None):
+        """
+        StartupProfiler 초기화 메서드입니다.
+
+        Args:
+            start (float): 측정 시작 시각 (time.perf_counter 값, 보통 main 모듈 로드 직후)
+            enabled (bool, optional): 측정 여부. None이면 환경 변수/실행 인자로 판단
+        """
+        super().__init__()
+        self.enabled = is_startup_profiling_enabled() if enabled is None else enabled
+        self.start = start
+        self._last = start
+        # (단계 이름, 단계 소요 시간(초), 시작부터 누적 시간(초))
+        self.phases = []
+        # 그리기(Paint) 이벤트를 기다리는 위젯 -> 단계 이름
+        self._paint_watches = {}
+
+    def mark(self, phase: str) -> None:
+        """
+        직전 기록 이후의 시간을 phase 단계의 소요 시간으로 기록합니다.
+
+        Args:
+            phase (str): 단계 이름
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last, now - self.start))
+        self._last = now
+
+    def mark_on_paint(self, widget, phase: str, on_done=None) -> None:
+        """
+        위젯이 다음에 그려질 때 phase 단계를 기록합니다.
+        이미 기록했거나 기다리는 중인 단계면 무시하므로, 여러 번 발생하는 시그널에 연결해도 한 번만 기록됩니다.
+
+        Args:
+            widget (QWidget): 그려지기를 기다릴 위젯
+            phase (str): 단계 이름
+            on_done (Callable, optional): 기록한 뒤 호출할 함수
+        """
+        if not self.enabled or self.has_phase(phase):
+            return
+        self._paint_watches[widget] = (phase, on_done)
+        widget.installEventFilter(self)
+        # 내용이 바뀌지 않아 다시 그려지지 않는 경우에도 기록되도록 그리기를 요청
+        widget.update()
+
+    def has_phase(self, phase: str) -> bool:
+        return any(name == phase for name, _, _ in self.phases) \
+            or any(name == phase for name, _ in self._paint_watches.values())
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() == QEvent.Paint and watched in self._paint_watches:
+            phase, on_done = self._paint_watches.pop(watched)
+            watched.removeEventFilter(self)
+            self.mark(phase)
+            if on_done:
+                on_done()
+        return False
+
+    def report(self, stream=None) -> None:
+        """
+        기록한 단계별 소요 시간을 출력합니다. (기본: 표준 에러)
+        """
+        if not self.enabled:
+            return
+        stream = stream or sys.stderr
+        for phase, elapsed, total in self.phases:
+            print(f"[startup] {phase:<16} {elapsed * 1000:8.1f} ms  (total {total * 1000:8.1f} ms)", file=stream)
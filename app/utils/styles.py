@@ -46,7 +46,7 @@ _BTN_POST_STYLE = f"""
 
 # 입력창(LineEdit, TextEdit) 기본 패딩
 _INPUT_BASE_STYLE = """
-    QLineEdit, QTextEdit {
+    QLineEdit, QTextEdit, QPlainTextEdit {
         padding: 10px;
     }
 """
@@ -83,11 +83,21 @@ LIST_STYLE = _BASE_STYLE + _BTN_POST_STYLE + f"""
         background-color: {COLOR_TRANSPARENT};
         border: none;
     }}
+
+    QPushButton#btn_page {{
+        color: gray;
+    }}
+
+    /* 현재 페이지 버튼 */
+    QPushButton#btn_page:disabled {{
+        color: white;
+        font-weight: bold;
+    }}
 """
 
 # [Editor] 게시글 작성/수정 화면
 EDITOR_STYLE = _BASE_STYLE + _BTN_POST_STYLE + _INPUT_BASE_STYLE + f"""
-    QLineEdit:focus, QTextEdit:focus {{
+    QLineEdit:focus, QTextEdit:focus, QPlainTextEdit:focus {{
         border: 1px solid {COLOR_PRIMARY};
     }}
     
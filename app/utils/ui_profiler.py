@@ -0,0 +1,274 @@
+import json
+import os
+import sys
+import time
+from collections import deque
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QEvent, QTimer, Qt, QCoreApplication
+from PySide6.QtWidgets import QLabel, QWidget
+
+from app.database.query_stats import LatencyHistogram
+
+# UI 응답성 계측을 켜는 환경 변수
+UI_PROFILE_ENV = "BOARD_UI_PROFILE"
+# 계측 결과(JSON)를 저장하는 파일 이름 (DB 파일과 같은 폴더)
+UI_PROFILE_REPORT = "ui_profile.json"
+# 이벤트 루프 지연을 재는 타이머 간격(밀리초). 타이머가 이 간격보다 늦게 불린 만큼을 지연으로 봄
+LAG_TIMER_INTERVAL_MS = 20
+# 이 이상(밀리초) 이벤트 루프가 멈추면 사용자가 느낄 수 있는 끊김(stall)으로 기록
+STALL_THRESHOLD_MS = 50
+# 보고서에 남기는 최근 끊김 개수
+MAX_RECORDED_STALLS = 100
+# 오버레이 갱신 간격(밀리초)
+OVERLAY_REFRESH_MS = 500
+
+
+def is_ui_profiling_enabled() -> bool:
+    """
+    환경 변수(BOARD_UI_PROFILE=1)로 UI 응답성 계측이 켜졌는지 확인합니다.
+    """
+    return os.environ.get(UI_PROFILE_ENV, "") not in ("", "0")
+
+
+class UiProfiler(QObject):
+    """
+    GUI 스레드의 응답성을 측정하는 클래스입니다.
+    - 이벤트 루프 지연: 짧은 간격의 타이머가 예정보다 늦게 불린 시간 (GUI 스레드가 막혀 있던 시간)
+    - 시그널 -> 그리기 지연: 시그널이 방출된 시점부터 대상 위젯이 다시 그려질 때까지의 시간
+    - 페이지 전환 시간: 전환을 시작한 시점부터 새 페이지가 그려질 때까지의 시간
+    지연 시간은 이름별 히스토그램으로 모으며, 꺼져 있으면 아무것도 기록하지 않습니다.
+    """
+
+    def __init__(self, enabled: Optional[bool] = None, report_path: Optional[str] = None):
+        """
+        UiProfiler 초기화 메서드입니다.
+
+        Args:
+            enabled (bool, optional): 처음부터 계측할지 여부. None이면 환경 변수로 판단
+            report_path (str, optional): dump가 결과를 저장할 JSON 파일 경로
+        """
+        super().__init__()
+        self.enabled = False
+        self.report_path = report_path
+        self._lag_timer = QTimer(self)
+        self._lag_timer.setTimerType(Qt.PreciseTimer)
+        self._lag_timer.setInterval(LAG_TIMER_INTERVAL_MS)
+        self._lag_timer.timeout.connect(self._on_lag_timer)
+        # 위젯 -> 그리기를 기다리는 구간 이름 목록
+        self._paint_watches = {}
+        self.reset()
+        if is_ui_profiling_enabled() if enabled is None else enabled:
+            self.enable()
+
+    def enable(self) -> None:
+        if self.enabled:
+            return
+        self.enabled = True
+        self._last_tick = time.perf_counter()
+        self._lag_timer.start()
+
+    def disable(self) -> None:
+        self.enabled = False
+        self._lag_timer.stop()
+        # 기다리던 그리기는 더 이상 기록하지 않음
+        for widget in self._paint_watches:
+            widget.removeEventFilter(self)
+        self._paint_watches.clear()
+        self._pending.clear()
+
+    def reset(self) -> None:
+        """
+        지금까지 모은 측정값을 모두 버립니다.
+        """
+        self.started_at = time.time()
+        self._last_tick = time.perf_counter()
+        self.lag = LatencyHistogram()
+        # (시작 후 경과 시간(초), 멈춘 시간(밀리초))
+        self.stalls = deque(maxlen=MAX_RECORDED_STALLS)
+        self.stall_count = 0
+        # 이름 -> LatencyHistogram, 이름 -> 마지막 측정값(밀리초)
+        self.latencies = {}
+        self.last_latency = {}
+        # 이름 -> 측정 시작 시각
+        self._pending = {}
+
+    def _on_lag_timer(self) -> None:
+        now = time.perf_counter()
+        lag_ms = max((now - self._last_tick) * 1000 - LAG_TIMER_INTERVAL_MS, 0.0)
+        self._last_tick = now
+        self.lag.add(lag_ms)
+        if lag_ms >= STALL_THRESHOLD_MS:
+            self.stall_count += 1
+            self.stalls.append((round(time.time() - self.started_at, 3), round(lag_ms, 1)))
+
+    def begin(self, name: str) -> None:
+        """
+        name 구간의 측정을 시작합니다. 이미 시작한 구간이면 처음 시작한 시각을 유지합니다.
+        (끝나기 전에 같은 시그널이 여러 번 방출되어도 첫 방출부터 잽니다.)
+
+        Args:
+            name (str): 구간 이름
+        """
+        if self.enabled:
+            self._pending.setdefault(name, time.perf_counter())
+
+    def end_on_paint(self, name: str, widget: QWidget) -> None:
+        """
+        widget이 다음에 다 그려졌을 때 name 구간을 끝내고 소요 시간을 기록합니다.
+        내용이 바뀌지 않아 다시 그려지지 않는 경우에도 끝나도록 그리기를 요청합니다.
+
+        Args:
+            name (str): begin으로 시작한 구간 이름
+            widget (QWidget): 그려지기를 기다릴 위젯
+        """
+        if not self.enabled or name not in self._pending:
+            return
+        names = self._paint_watches.get(widget)
+        if names is None:
+            names = self._paint_watches[widget] = set()
+            widget.installEventFilter(self)
+        names.add(name)
+        widget.update()
+
+    def watch_signal(self, signal, name: str, widget: Callable[[], QWidget]) -> None:
+        """
+        signal이 방출될 때부터 위젯이 다시 그려질 때까지의 시간을 "signal <name>" 이름으로 기록합니다.
+        방출 시각부터 재려면 시그널을 처리하는 다른 슬롯보다 먼저 연결해야 하므로,
+        위젯이 아직 없을 수 있어 위젯 대신 위젯을 반환하는 함수를 받습니다.
+
+        Args:
+            signal (SignalInstance): 관찰할 시그널
+            name (str): 기록할 이름
+            widget (Callable[[], QWidget]): 그려지기를 기다릴 위젯을 반환하는 함수
+        """
+        name = f"signal {name}"
+
+        def on_emitted(*args):
+            if self.enabled:
+                self.begin(name)
+                # 뒤이어 실행되는 슬롯들의 그리기 요청과 합쳐져 한 번에 그려지므로 바로 기다려도 됨
+                self.end_on_paint(name, widget())
+
+        signal.connect(on_emitted)
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() != QEvent.Paint or watched not in self._paint_watches:
+            return False
+        names = self._paint_watches.pop(watched)
+        watched.removeEventFilter(self)
+        # 그리기가 끝난 시점까지 재기 위해 필터를 뗀 상태로 이벤트를 직접 전달하고 원래 전달은 막음
+        QCoreApplication.sendEvent(watched, event)
+        now = time.perf_counter()
+        for name in names:
+            start = self._pending.pop(name, None)
+            if start is not None:
+                self._record(name, (now - start) * 1000)
+        return True
+
+    def _record(self, name: str, elapsed_ms: float) -> None:
+        histogram = self.latencies.get(name)
+        if histogram is None:
+            histogram = self.latencies[name] = LatencyHistogram()
+        histogram.add(elapsed_ms)
+        self.last_latency[name] = elapsed_ms
+
+    def to_dict(self) -> dict:
+        """
+        측정 결과를 JSON으로 저장할 수 있는 dict로 반환합니다.
+        """
+        return {
+            "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)),
+            "duration_s": round(time.time() - self.started_at, 3),
+            "event_loop": {
+                "timer_interval_ms": LAG_TIMER_INTERVAL_MS,
+                "stall_threshold_ms": STALL_THRESHOLD_MS,
+                "stall_count": self.stall_count,
+                "recent_stalls": [{"at_s": at, "ms": ms} for at, ms in self.stalls],
+                "lag": self.lag.to_dict(),
+            },
+            "latencies": {name: histogram.to_dict() for name, histogram in sorted(self.latencies.items())},
+        }
+
+    def summary(self) -> str:
+        """
+        측정 결과를 사람이 읽기 쉬운 여러 줄의 문자열로 반환합니다. (오버레이와 콘솔 출력에 사용)
+        """
+        lines = [
+            f"event loop lag  p50 {self.lag.percentile(0.5):.1f}  p99 {self.lag.percentile(0.99):.1f}  "
+            f"max {self.lag.max_ms:.1f} ms",
+            f"stalls >= {STALL_THRESHOLD_MS} ms: {self.stall_count}",
+        ]
+        for name, histogram in sorted(self.latencies.items()):
+            lines.append(f"{name}  last {self.last_latency[name]:.1f}  p90 {histogram.percentile(0.9):.1f}  "
+                         f"max {histogram.max_ms:.1f} ms  (n={histogram.count})")
+        return "\n".join(lines)
+
+    def dump(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        측정 결과를 JSON 파일로 저장하고 요약을 표준 에러로 출력합니다.
+
+        Args:
+            path (str, optional): 저장할 파일 경로. None이면 report_path
+
+        Returns:
+            str | None: 저장한 파일 경로 (경로가 없으면 None)
+        """
+        print("[ui profile]", self.summary(), sep="\n", file=sys.stderr)
+        path = path or self.report_path
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+
+class UiProfilerOverlay(QLabel):
+    """
+    UiProfiler의 측정값을 부모 위젯 오른쪽 위에 반투명하게 표시하는 디버그 오버레이입니다.
+    마우스 입력은 아래 위젯으로 그대로 전달됩니다.
+    """
+
+    def __init__(self, profiler: UiProfiler, parent: QWidget):
+        """
+        UiProfilerOverlay 초기화 메서드입니다.
+
+        Args:
+            profiler (UiProfiler): 표시할 측정값을 가진 객체
+            parent (QWidget): 오버레이를 표시할 위젯 (보통 메인 윈도우)
+        """
+        super().__init__(parent)
+        self.profiler = profiler
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setStyleSheet("background-color: rgba(0, 0, 0, 160); color: #9f9; "
+                           "font-family: monospace; font-size: 11px; padding: 6px;")
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(OVERLAY_REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def set_active(self, active: bool) -> None:
+        """
+        오버레이를 표시하거나 숨깁니다. 숨긴 동안에는 갱신하지 않습니다.
+        """
+        if active:
+            self.refresh()
+            self.show()
+            self.raise_()
+            self._refresh_timer.start()
+        else:
+            self._refresh_timer.stop()
+            self.hide()
+
+    def refresh(self) -> None:
+        self.setText(self.profiler.summary())
+        self.adjustSize()
+        self._reposition()
+
+    def _reposition(self) -> None:
+        self.move(max(self.parentWidget().width() - self.width() - 8, 0), 8)
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() == QEvent.Resize and self.isVisible():
+            self._reposition()
+        return False
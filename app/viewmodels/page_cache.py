@@ -0,0 +1,182 @@
+import sys
+from collections import OrderedDict
+from typing import Optional
+
+from app.database import PostDao, SEARCH_ORDER_RELEVANCE
+from app.models import Post, PostSummary
+
+# 페이지 캐시가 사용할 최대 메모리(바이트, 추정치)
+PAGE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+
+def estimate_size(posts: list[PostSummary]) -> int:
+    """
+    게시글 요약 리스트가 차지하는 메모리를 대략적으로 계산합니다.
+
+    Args:
+        posts (list[PostSummary]): 게시글 요약 리스트
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    size = sys.getsizeof(posts)
+    for post in posts:
+        size += sys.getsizeof(post) + sum(sys.getsizeof(getattr(post, name)) for name in post.__slots__)
+    return size
+
+
+class PageCache:
+    """
+    조회한 목록 페이지를 (검색어, 정렬 기준, 페이지 번호, 페이지 크기) 키로 보관하는 LRU 캐시입니다.
+    검색어별 전체 게시글 수도 함께 보관합니다.
+
+    게시글이 추가/수정/삭제되면 영향을 받는 페이지만 골라서 버립니다.
+    캐시 내용이 바뀔 때마다 generation이 증가하므로, 그 전에 시작한 조회 결과는 저장하지 않아야 합니다.
+    """
+
+    def __init__(self, max_bytes: int = PAGE_CACHE_MAX_BYTES):
+        """
+        PageCache 초기화 메서드입니다.
+
+        Args:
+            max_bytes (int): 캐시가 사용할 최대 메모리(바이트, 추정치)
+        """
+        self.max_bytes = max_bytes
+        # 페이지 키 -> (게시글 요약 리스트, 추정 크기), 오래 사용하지 않은 순서
+        self._pages = OrderedDict()
+        # 검색어 -> 전체 게시글 수
+        self._counts = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        # 캐시가 반영하고 있는 DB 데이터 버전
+        self.version = None
+        self.generation = 0
+
+    def get_page(self, key: tuple) -> Optional[list[PostSummary]]:
+        """
+        캐시된 페이지를 반환합니다.
+
+        Args:
+            key (tuple): (검색어, 정렬 기준, 페이지 번호, 페이지 크기)
+
+        Returns:
+            Optional[list[PostSummary]]: 게시글 요약 리스트, 캐시에 없으면 None
+        """
+        entry = self._pages.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._pages.move_to_end(key)
+        return entry[0]
+
+    def has_page(self, key: tuple) -> bool:
+        return key in self._pages
+
+    def put_page(self, key: tuple, posts: list[PostSummary]) -> None:
+        """
+        페이지를 캐시에 저장하고, 최대 메모리를 넘으면 가장 오래 사용하지 않은 페이지부터 버립니다.
+
+        Args:
+            key (tuple): (검색어, 정렬 기준, 페이지 번호, 페이지 크기)
+            posts (list[PostSummary]): 게시글 요약 리스트
+        """
+        self._remove(key)
+        size = estimate_size(posts)
+        self._pages[key] = (posts, size)
+        self.size += size
+        while self.size > self.max_bytes and len(self._pages) > 1:
+            self._remove(next(iter(self._pages)))
+
+    def get_count(self, keyword: str) -> Optional[int]:
+        return self._counts.get(keyword)
+
+    def set_count(self, keyword: str, count: int) -> None:
+        self._counts[keyword] = count
+
+    def clear(self) -> None:
+        """
+        캐시를 모두 비웁니다.
+        """
+        self._pages.clear()
+        self._counts.clear()
+        self.size = 0
+        self.generation += 1
+
+    def invalidate_insert(self, post: Post) -> None:
+        """
+        새 게시글은 최신순 목록의 맨 앞에 들어가므로 전체 목록과 이 글이 검색되는 검색어의 페이지를 모두 버립니다.
+
+        Args:
+            post (Post): 추가된 게시글
+        """
+        self._invalidate_keywords(lambda keyword: not keyword or PostDao.matches_keyword(post, keyword))
+
+    def invalidate_update(self, old_post: Optional[Post], new_post: Post) -> None:
+        """
+        수정된 게시글이 들어 있는 페이지와, 수정 전후 내용이 검색되는 검색어의 페이지를 버립니다.
+        작성 시간은 바뀌지 않으므로 다른 페이지의 순서는 그대로입니다.
+
+        Args:
+            old_post (Optional[Post]): 수정 전 게시글 (알 수 없으면 None)
+            new_post (Post): 수정 후 게시글
+        """
+        if old_post is None:
+            self.clear()
+            return
+
+        def affected(keyword):
+            return bool(keyword) and (PostDao.matches_keyword(old_post, keyword)
+                                      or PostDao.matches_keyword(new_post, keyword))
+
+        for key in list(self._pages):
+            posts = self._pages[key][0]
+            if affected(key[0]) or any(post.id == new_post.id for post in posts):
+                self._remove(key)
+        for keyword in list(self._counts):
+            if affected(keyword):
+                del self._counts[keyword]
+        self.generation += 1
+
+    def invalidate_delete(self, deleted_posts: list[Post]) -> None:
+        """
+        삭제된 게시글보다 모든 글이 최신인 페이지는 순서가 그대로이므로 남기고, 나머지 영향을 받는 페이지를 버립니다.
+        관련도순 페이지는 순서를 알 수 없으므로 삭제된 글이 검색되는 검색어면 모두 버립니다.
+
+        Args:
+            deleted_posts (list[Post]): 삭제된 게시글 리스트
+        """
+        def affected_posts(keyword):
+            return [post for post in deleted_posts if not keyword or PostDao.matches_keyword(post, keyword)]
+
+        for key in list(self._pages):
+            keyword, order = key[0], key[1]
+            affected = affected_posts(keyword)
+            if not affected:
+                continue
+            posts = self._pages[key][0]
+            if keyword and order == SEARCH_ORDER_RELEVANCE or not posts:
+                self._remove(key)
+                continue
+            newest_deleted = max((post.created_at, post.id) for post in affected)
+            if (posts[-1].created_at, posts[-1].id) <= newest_deleted:
+                self._remove(key)
+        for keyword in list(self._counts):
+            if affected_posts(keyword):
+                del self._counts[keyword]
+        self.generation += 1
+
+    def _invalidate_keywords(self, predicate) -> None:
+        for key in list(self._pages):
+            if predicate(key[0]):
+                self._remove(key)
+        for keyword in list(self._counts):
+            if predicate(keyword):
+                del self._counts[keyword]
+        self.generation += 1
+
+    def _remove(self, key: tuple) -> None:
+        entry = self._pages.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Optional
+
+from app.models import Post
+
+# 메모리에 보관할 최대 게시글 수
+POST_CACHE_SIZE = 256
+
+
+class PostCache:
+    """
+    본문까지 조회한 게시글(Post)을 id로 보관하는 LRU 캐시(identity map)입니다.
+    같은 게시글은 같은 Post 객체로 반환되며, 목록의 게시글 요약과 수정 시간(updated_at)이
+    다르면 오래된 것으로 보고 다시 조회하도록 합니다.
+    """
+
+    def __init__(self, max_size: int = POST_CACHE_SIZE):
+        """
+        PostCache 초기화 메서드입니다.
+
+        Args:
+            max_size (int): 보관할 최대 게시글 수
+        """
+        self.max_size = max_size
+        self._posts = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, id: int, updated_at: Optional[str] = None) -> Optional[Post]:
+        """
+        캐시된 게시글을 반환합니다.
+
+        Args:
+            id (int): 게시글 ID
+            updated_at (str, optional): 알고 있는 최신 수정 시간. 캐시된 게시글과 다르면 캐시를 버림
+
+        Returns:
+            Optional[Post]: 게시글 객체, 캐시에 없거나 오래되었으면 None
+        """
+        post = self._posts.get(id)
+        if post is not None and updated_at is not None and post.updated_at != updated_at:
+            del self._posts[id]
+            post = None
+        if post is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._posts.move_to_end(id)
+        return post
+
+    def put(self, post: Post) -> None:
+        """
+        게시글을 캐시에 저장하고, 최대 개수를 넘으면 가장 오래 사용하지 않은 게시글부터 버립니다.
+
+        Args:
+            post (Post): 본문까지 조회한 게시글 객체
+        """
+        self._posts[post.id] = post
+        self._posts.move_to_end(post.id)
+        while len(self._posts) > self.max_size:
+            self._posts.popitem(last=False)
+
+    def invalidate(self, ids: list[int]) -> None:
+        """
+        수정/삭제된 게시글을 캐시에서 버립니다.
+
+        Args:
+            ids (list[int]): 게시글 ID 리스트
+        """
+        for id in ids:
+            self._posts.pop(id, None)
+
+    def clear(self) -> None:
+        self._posts.clear()
@@ -1,10 +1,48 @@
 import math
+import threading
+from dataclasses import dataclass, field
 from typing import Optional
 
 from PySide6.QtCore import QObject, Signal
 
-from app.database import PostDao
-from app.models import Post
+from app.database import PostDao, SEARCH_ORDER_RECENT, SEARCH_ORDER_RELEVANCE
+from app.models import Post, PostSummary
+from app.viewmodels.page_cache import PageCache
+from app.viewmodels.post_cache import PostCache
+from app.viewmodels.task_runner import TaskRunner
+
+# 동시에 실행할 조회 작업 수 (내보내기 1개 + 목록 조회 1개)
+READ_THREADS = 2
+# 이웃 페이지 미리 읽기 작업의 우선순위 (화면에 표시할 조회보다 나중에 실행)
+PREFETCH_PRIORITY = -1
+# 기존 게시글 압축 같은 유지보수 작업의 우선순위 (사용자의 저장/삭제보다 나중에 실행)
+MAINTENANCE_PRIORITY = -1
+
+# 목록 표시 방식: 페이지 버튼 / 무한 스크롤
+LIST_MODE_PAGED = "paged"
+LIST_MODE_SCROLL = "scroll"
+# 무한 스크롤 모드에서 한 번에 읽는 게시글 수
+SCROLL_CHUNK_SIZE = 200
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """
+    백그라운드 스레드에 넘기는 페이지 조회 조건입니다.
+    요청 시점의 ViewModel 상태를 복사해 두므로 조회 중에 상태가 바뀌어도 안전합니다.
+    """
+    keyword: str
+    page: int
+    limit: int
+    order: str
+    # 알고 있는 전체 게시글 수. None이면 목록과 함께 조회
+    total_count: Optional[int]
+    # 키셋 페이징 기준점 캐시의 사본
+    anchors: dict = field(default_factory=dict)
+    # 요청 시점의 페이지 캐시 세대 (그 사이 캐시가 무효화되었으면 결과를 저장하지 않음)
+    generation: int = 0
+    # 무한 스크롤 묶음을 이어 읽을 기준 키 (created_at, id). None이면 목록의 처음부터
+    anchor: Optional[tuple] = None
 
 
 class PostViewModel(QObject):
@@ -22,51 +60,329 @@ class PostViewModel(QObject):
     error_message_signal = Signal(str)
     # 일반 알림 메시지를 전달하는 시그널
     message_signal = Signal(str)
+    # 내보내기 진행 상황 시그널 (내보낸 게시글 수, 전체 게시글 수)
+    export_progress = Signal(int, int)
+    # 내보내기 실행 상태 시그널 (실행 중 여부)
+    export_running_changed = Signal(bool)
+    # 목록 조회 상태 시그널 (조회 중 여부)
+    loading_changed = Signal(bool)
+    # 게시글 추가/수정이 저장되었을 때 발생하는 시그널
+    post_saved = Signal()
+    # 게시글 추가/수정 저장이 실패했을 때 발생하는 시그널 (에러 메시지는 error_message_signal로 전달)
+    post_save_failed = Signal()
+    # 무한 스크롤 목록을 처음부터 다시 읽어야 할 때 발생하는 시그널 (스크롤 목록 세대)
+    scroll_reset = Signal(int)
+    # 무한 스크롤 목록의 묶음(chunk) 조회가 끝났을 때 발생하는 시그널 (스크롤 목록 세대, 묶음 번호, 게시글 리스트)
+    scroll_chunk_loaded = Signal(int, int, list)
+    # 무한 스크롤 목록의 묶음 조회가 실패했을 때 발생하는 시그널 (스크롤 목록 세대, 묶음 번호)
+    scroll_chunk_failed = Signal(int, int)
 
     def __init__(self):
         """
         ViewModel 초기화 메서드입니다.
         DAO 인스턴스 생성 및 페이징 관련 변수를 초기화합니다.
+        DB 작업은 GUI 스레드가 아닌 백그라운드 스레드에서 실행되며, 쓰기 작업은 요청 순서대로 하나씩 실행됩니다.
         """
         super().__init__()
         self.post_dao = PostDao()
+        self._reader = TaskRunner(READ_THREADS, self)
+        self._writer = TaskRunner(1, self)
         self.current_page = 1
         self.items_per_page = 16
         self.total_count = 0
         self.total_pages = 1
 
         self.current_keyword = ""
+        # 검색 결과 정렬 기준 (최신순 / 관련도순)
+        self.search_order = SEARCH_ORDER_RECENT
+
+        # 키셋 페이징용 기준점 캐시: 페이지 번호 -> (첫 글의 키, 마지막 글의 키), 키는 (created_at, id)
+        self._page_anchors = {}
+        # 기준점 캐시가 유효한 조건 (검색어, DB 데이터 버전)
+        self._anchor_scope = None
+
+        # 조회한 페이지와 검색어별 전체 게시글 수 캐시
+        self.page_cache = PageCache()
+        # 미리 읽는 중인 페이지 키
+        self._prefetching = set()
+        # 본문까지 조회한 게시글 캐시 (목록/상세/에디터에서 공유)
+        self.post_cache = PostCache()
+
+        # 목록 표시 방식 (기본은 페이지 버튼)
+        self.list_mode = LIST_MODE_PAGED
+        self.scroll_chunk_size = SCROLL_CHUNK_SIZE
+        # 무한 스크롤 목록 세대. 목록을 처음부터 다시 읽을 때마다 증가하며, 이전 세대의 조회 결과는 버림
+        self.scroll_generation = 0
+
+        # 가장 최근 목록 조회 작업 id (이보다 오래된 조회 결과는 버림)
+        self._latest_fetch_id = 0
+        # 가장 최근 목록 조회 작업의 취소 이벤트
+        self._fetch_cancel = None
+        self.is_loading = False
+        # 실행 중인 내보내기 작업 id (없으면 None)
+        self._export_task_id = None
+        # 기존 게시글 압축이 진행 중인지 여부
+        self._compressing = False
 
     def fetch_posts(self) -> None:
         """
-        현재 페이지와 검색어(있는 경우)에 맞춰 게시글 목록을 불러옵니다.
-        데이터 로드 후 post_list_updated 및 paging_info_updated 시그널을 방출합니다.
-        """
-        try:
-            # 검색한 결과 fetch
-            if self.current_keyword:
-                self.total_count = self.post_dao.get_search_count(self.current_keyword)
-                posts = self.post_dao.get_search_posts_paginated(
-                    self.current_keyword, self.current_page, self.items_per_page
-                )
-            # 전체 리스트 fetch
-            else:
-                self.total_count = self.post_dao.get_total_count()
-                posts = self.post_dao.get_posts_paginated(
-                    self.current_page, self.items_per_page
-                )
+        현재 페이지와 검색어(있는 경우)에 맞춰 게시글 목록을 가져옵니다.
+        페이지 캐시에 있으면 바로 표시하고, 없으면 백그라운드에서 조회합니다.
+        전체 게시글 수는 검색어별로 캐시하며, 모를 때만 목록과 같은 쿼리로 함께 조회합니다.
+        표시가 끝나면 post_list_updated 및 paging_info_updated 시그널을 방출하고 이웃 페이지를 미리 읽습니다.
+        조회 중 새 조회가 요청되었다면 이전 결과는 버립니다.
+        """
+        version = self._sync_cache_version()
+
+        if self.list_mode == LIST_MODE_SCROLL:
+            if not self.current_keyword:
                 self.post_list_updated_initialized.emit()
+            self.scroll_generation += 1
+            self.scroll_reset.emit(self.scroll_generation)
+            return
+
+        # 검색어나 데이터가 바뀌면(다른 프로세스의 변경 포함) 기준점 캐시를 다시 구해야 함
+        scope = (self.current_keyword, version)
+        if scope != self._anchor_scope:
+            self._page_anchors.clear()
+            self._anchor_scope = scope
+
+        # 전체 리스트 fetch
+        if not self.current_keyword:
+            self.post_list_updated_initialized.emit()
+
+        request = self._make_request(self.current_page)
+        posts = self.page_cache.get_page(self._cache_key(request))
+        # 진행 중인 조회 결과는 더 이상 필요 없으므로 취소
+        self._cancel_fetch()
+        if posts is not None and request.total_count is not None:
+            self._latest_fetch_id = 0
+            self._show_page(request, posts, None)
+            return
+
+        self._fetch_cancel = threading.Event()
+        self._latest_fetch_id = self._reader.submit(
+            self._load_page, request, self._fetch_cancel,
+            on_finished=self._on_page_loaded, on_error=self._on_page_load_failed, on_partial=self._on_page_partial
+        )
+        self._set_loading(True)
+
+    def _cancel_fetch(self) -> None:
+        if self._fetch_cancel is not None:
+            self._fetch_cancel.set()
+            self._fetch_cancel = None
+
+    def _sync_cache_version(self) -> int:
+        """
+        이 ViewModel이 모르는 변경이 DB에 있었으면(다른 프로세스의 변경 포함) 페이지 캐시, 게시글 캐시와
+        페이지 기준점 캐시를 모두 버립니다. 전체 게시글 수도 페이지 캐시와 함께 버려지므로 다음 조회에서 다시 셉니다.
 
-            if self.total_count == 0:
-                self.total_pages = 1
-            else:
-                self.total_pages = math.ceil(self.total_count / self.items_per_page)
+        Returns:
+            int: 현재 DB 데이터 버전
+        """
+        version = self.post_dao.get_data_version()
+        if version != self.page_cache.version:
+            self.page_cache.clear()
+            self.post_cache.clear()
+            self.page_cache.version = version
+            # 추가/삭제된 글만큼 페이지 경계가 밀리므로 기준점으로 이어 읽으면 겹치거나 빠진 페이지가 나옴
+            self._page_anchors.clear()
+        return version
+
+    def _make_request(self, page: int) -> PageRequest:
+        return PageRequest(
+            keyword=self.current_keyword,
+            page=page,
+            limit=self.items_per_page,
+            order=self.search_order,
+            total_count=self.page_cache.get_count(self.current_keyword),
+            anchors=dict(self._page_anchors),
+            generation=self.page_cache.generation,
+        )
+
+    @staticmethod
+    def _cache_key(request: PageRequest) -> tuple:
+        # 검색어가 없으면 정렬 기준은 결과에 영향이 없음
+        order = request.order if request.keyword else None
+        return request.keyword, order, request.page, request.limit
+
+    def _on_page_loaded(self, task_id: int, result: tuple) -> None:
+        """
+        목록 조회가 끝났을 때 GUI 스레드에서 호출됩니다. 최신 요청의 결과만 화면에 반영합니다.
+        """
+        if task_id != self._latest_fetch_id:
+            return
+        request, posts, total_count = result
+        self._store_page(request, posts, total_count)
+        self._show_page(request, posts, total_count)
+
+    def _store_page(self, request: PageRequest, posts: list[PostSummary], total_count: Optional[int]) -> None:
+        """
+        조회 결과를 페이지 캐시에 저장합니다. 조회 중 캐시가 무효화되었으면 저장하지 않습니다.
+        """
+        if request.generation != self.page_cache.generation:
+            return
+        self.page_cache.put_page(self._cache_key(request), posts)
+        if total_count is not None:
+            self.page_cache.set_count(request.keyword, total_count)
 
+    def _show_page(self, request: PageRequest, posts: list[PostSummary], total_count: Optional[int]) -> None:
+        """
+        조회한 페이지를 화면에 반영하고 이웃 페이지를 미리 읽습니다.
+        """
+        self.total_count = total_count if total_count is not None else request.total_count
+        if posts and not self._is_relevance_search(request):
+            self._page_anchors[request.page] = (
+                (posts[0].created_at, posts[0].id),
+                (posts[-1].created_at, posts[-1].id),
+            )
+
+        if self.total_count == 0:
+            self.total_pages = 1
+        else:
+            self.total_pages = math.ceil(self.total_count / self.items_per_page)
+
+        self._set_loading(False)
+        self.post_list_updated.emit(posts)
+        self.paging_info_updated.emit(self.current_page, self.total_pages)
+        self._prefetch_neighbors()
+
+    def _prefetch_neighbors(self) -> None:
+        """
+        현재 페이지의 앞뒤 페이지를 캐시에 없으면 백그라운드에서 미리 읽습니다.
+        """
+        for page in (self.current_page + 1, self.current_page - 1):
+            if not 1 <= page <= self.total_pages:
+                continue
+            request = self._make_request(page)
+            key = self._cache_key(request)
+            if request.total_count is None or key in self._prefetching or self.page_cache.has_page(key):
+                continue
+            self._prefetching.add(key)
+            self._reader.submit(self._load_page, request, on_finished=self._on_prefetched,
+                                on_error=self._on_prefetch_failed, priority=PREFETCH_PRIORITY)
+
+    def _on_prefetched(self, task_id: int, result: tuple) -> None:
+        request, posts, total_count = result
+        self._prefetching.discard(self._cache_key(request))
+        self._store_page(request, posts, total_count)
+
+    def _on_prefetch_failed(self, task_id: int, message: str) -> None:
+        # 미리 읽기는 실패해도 실제로 이동할 때 다시 조회하므로 무시
+        self._prefetching.clear()
+
+    def _on_page_partial(self, task_id: int, posts: list[PostSummary]) -> None:
+        """
+        검색 결과의 일부를 찾았을 때 GUI 스레드에서 호출됩니다. 페이지가 다 차기 전에 먼저 표시합니다.
+        """
+        if task_id == self._latest_fetch_id:
             self.post_list_updated.emit(posts)
-            self.paging_info_updated.emit(self.current_page, self.total_pages)
 
-        except Exception as e:
-            self.error_message_signal.emit(f"Data Load Failed: {e}")
+    def _on_page_load_failed(self, task_id: int, message: str) -> None:
+        """
+        목록 조회가 실패했을 때 GUI 스레드에서 호출됩니다. (취소된 이전 조회는 무시)
+        """
+        if task_id != self._latest_fetch_id:
+            return
+        self._set_loading(False)
+        self.error_message_signal.emit(f"Data Load Failed: {message}")
+
+    def _set_loading(self, loading: bool) -> None:
+        if loading != self.is_loading:
+            self.is_loading = loading
+            self.loading_changed.emit(loading)
+
+    @staticmethod
+    def _is_relevance_search(request: PageRequest) -> bool:
+        return bool(request.keyword) and request.order == SEARCH_ORDER_RELEVANCE
+
+    def _load_page(self, request: PageRequest, cancel_event: threading.Event = None, progress=None,
+                   partial=None) -> tuple:
+        """
+        요청한 페이지의 게시글을 조회합니다. (백그라운드 스레드에서 실행)
+        전체 게시글 수를 모르면 목록과 개수를 한 번의 쿼리로 함께 조회하고,
+        알고 있으면 캐시된 이웃 페이지의 기준점에서 가장 적게 건너뛰는 키셋(seek) 경로를 고릅니다.
+        기준점이 없는 먼 페이지는 목록의 처음 또는 끝에서부터 OFFSET으로 조회합니다.
+        cancel_event가 설정되면 실행 중인 쿼리를 중단합니다.
+
+        Args:
+            request (PageRequest): 조회 조건
+            cancel_event (threading.Event, optional): 취소 요청 이벤트
+            partial (Callable, optional): 새 검색어의 결과를 찾는 대로 전달받을 함수
+
+        Returns:
+            tuple: (요청, 게시글 요약 리스트, 새로 조회한 전체 게시글 수 또는 None)
+        """
+        with self.post_dao.cancellable(cancel_event):
+            if request.keyword and not self._is_relevance_search(request):
+                # 같은 검색어나 포함된 검색어의 결과 id를 기억하고 있으면 그 안에서만 조회
+                ids = self.post_dao.get_search_ids(request.keyword, narrow_only=True)
+                if ids is not None:
+                    return request, self._page_from_ids(request, ids), len(ids)
+            if request.total_count is None and request.keyword and partial is not None:
+                return self._stream_search_page(request, partial)
+            return self._query_page(request)
+
+    def _page_from_ids(self, request: PageRequest, ids: list[int]) -> list[PostSummary]:
+        offset = (request.page - 1) * request.limit
+        return self.post_dao.get_posts_by_ordered_ids(ids[offset:offset + request.limit])
+
+    def _stream_search_page(self, request: PageRequest, partial) -> tuple:
+        """
+        새 검색어의 페이지를 찾는 대로 partial로 전달한 뒤 전체 개수를 조회합니다.
+        전체 검색은 개수를 세느라 첫 글이 늦게 나오므로, 목록과 개수를 한 쿼리로 묶지 않습니다.
+        최신순 검색이면 개수 대신 결과 id 전체를 구해 두어, 이어지는 페이지 이동과 검색어를 늘려 가는 검색에 사용합니다.
+        """
+        posts = []
+        for batch in self.post_dao.iter_search_page(request.keyword, request.page, request.limit, request.order):
+            posts.extend(batch)
+            partial(list(posts))
+        ids = None if self._is_relevance_search(request) else self.post_dao.get_search_ids(request.keyword)
+        total_count = len(ids) if ids is not None else self.post_dao.get_search_count(request.keyword)
+        return request, posts, total_count
+
+    def _query_page(self, request: PageRequest) -> tuple:
+        if request.total_count is None:
+            posts, total_count = self.post_dao.get_page_with_count(
+                request.keyword, request.page, request.limit, request.order
+            )
+            return request, posts, total_count
+
+        # 관련도순 검색은 (created_at, id) 키 순서가 아니므로 OFFSET 방식으로 조회
+        if self._is_relevance_search(request):
+            posts = self.post_dao.get_search_posts_paginated(request.keyword, request.page, request.limit,
+                                                             request.order)
+        else:
+            posts = self._seek_page(request)
+        return request, posts, None
+
+    def _seek_page(self, request: PageRequest) -> list[PostSummary]:
+        """
+        기준점 캐시를 이용해 요청한 페이지를 키셋(seek) 방식으로 조회합니다.
+
+        Args:
+            request (PageRequest): 조회 조건 (total_count가 있어야 함)
+
+        Returns:
+            list[PostSummary]: 해당 페이지의 게시글 요약 리스트
+        """
+        page, limit, total_count = request.page, request.limit, request.total_count
+
+        # (건너뛸 행 수, 기준 키, 역방향 여부, 조회 개수) 후보 중 건너뛰는 행이 가장 적은 경로 선택
+        plans = [((page - 1) * limit, None, False, limit)]
+        last_index = min(page * limit, total_count)
+        if last_index > (page - 1) * limit:
+            plans.append((total_count - last_index, None, True, last_index - (page - 1) * limit))
+        for cached_page, (first_key, last_key) in request.anchors.items():
+            if cached_page < page:
+                plans.append(((page - cached_page - 1) * limit, last_key, False, limit))
+            elif cached_page > page:
+                plans.append(((cached_page - page - 1) * limit, first_key, True, limit))
+        offset, anchor, backward, count = min(plans, key=lambda plan: plan[0])
+
+        if request.keyword:
+            return self.post_dao.get_search_posts_seek(request.keyword, count, anchor, backward, offset)
+        return self.post_dao.get_posts_seek(count, anchor, backward, offset)
 
     def go_prev_page(self, step: int = 1):
         """
@@ -107,119 +423,316 @@ class PostViewModel(QObject):
             self.current_page = page
             self.fetch_posts()
 
-    def get_post(self, id: int) -> Optional[Post]:
+    def get_post(self, id: int, updated_at: Optional[str] = None) -> Optional[Post]:
         """
         특정 ID의 게시글 상세 정보를 가져옵니다.
+        게시글 캐시에 있으면 DB를 조회하지 않습니다.
 
         Args:
             id (int): 게시글 ID
+            updated_at (str, optional): 알고 있는 최신 수정 시간. 캐시된 게시글과 다르면 다시 조회
 
         Returns:
             Optional[Post]: 게시글 객체 또는 None
         """
-        data = self.post_dao.get_post(id)
-        return data
+        self._sync_cache_version()
+        post = self.post_cache.get(id, updated_at)
+        if post is None:
+            post = self.post_dao.get_post(id)
+            if post is not None:
+                self.post_cache.put(post)
+        return post
+
+    def get_full_post(self, post: Post | PostSummary) -> Optional[Post]:
+        """
+        목록에서 받은 게시글 요약이면 본문을 포함한 전체 게시글을 조회하고,
+        이미 전체 게시글이면 그대로 반환합니다.
+
+        Args:
+            post (Post | PostSummary): 게시글 또는 게시글 요약 객체
 
-    def add_post(self, title: str, content: str, author: str = None) -> bool:
+        Returns:
+            Optional[Post]: 전체 게시글 객체. 그 사이 삭제되었으면 None
         """
-        새로운 게시글을 추가합니다.
+        if isinstance(post, Post):
+            return post
+        full_post = self.get_post(post.id, post.updated_at)
+        if full_post is None:
+            self.error_message_signal.emit("The post no longer exists.")
+        return full_post
+
+    def add_post(self, title: str, content: str, author: str = None) -> None:
+        """
+        새로운 게시글 추가를 백그라운드에서 실행합니다.
+        저장되면 post_saved 시그널을 방출하고 첫 페이지를 다시 조회합니다.
 
         Args:
             title (str): 제목
             content (str): 내용
             author (str, optional): 작성자 (기본값 "anonymous")
-
-        Returns:
-            bool: 성공 시 True, 실패 시 False
         """
-        try:
-            author = author if author else "anonymous"
-            post = Post(title=title, content=content, author=author)
-            self.post_dao.insert_post(post)
-            self.message_signal.emit("Post Added.")
-            self.reset_and_fetch()
-            return True
-        except Exception as e:
-            self.error_message_signal.emit(str(e))
-            return False
+        author = author if author else "anonymous"
+        post = Post(title=title, content=content, author=author)
+        self._run_write(lambda: self.post_dao.insert_post(post),
+                        lambda result: self.page_cache.invalidate_insert(post),
+                        message="Post Added.", saved=True)
 
-    def update_post(self, id: int, title: str, content: str, author: str = None) -> bool:
+    def update_post(self, id: int, title: str, content: str, author: str = None) -> None:
         """
-        기존 게시글을 수정합니다.
+        기존 게시글 수정을 백그라운드에서 실행합니다.
+        저장되면 post_saved 시그널을 방출하고 첫 페이지를 다시 조회합니다.
 
         Args:
             id (int): 수정할 게시글 ID
             title (str): 제목
             content (str): 내용
             author (str, optional): 작성자
-
-        Returns:
-            bool: 성공 시 True, 실패 시 False
         """
-        try:
-            author = author if author else "anonymous"
-            updated_post = Post(id=id, title=title, content=content, author=author)
+        author = author if author else "anonymous"
+        updated_post = Post(id=id, title=title, content=content, author=author)
+
+        def task():
+            # 캐시 무효화 범위를 정하기 위해 수정 전 내용을 먼저 읽어 둠
+            old_post = self.post_dao.get_post(id)
             self.post_dao.update_post(updated_post)
-            self.message_signal.emit("Post Updated.")
-            self.reset_and_fetch()
-            return True
-        except Exception as e:
-            self.error_message_signal.emit(str(e))
-            return False
+            return old_post
+
+        def invalidate(old_post):
+            self.post_cache.invalidate([id])
+            self.page_cache.invalidate_update(old_post, updated_post)
 
-    def delete_post(self, id: int) -> bool:
+        self._run_write(task, invalidate, message="Post Updated.", saved=True)
+
+    def delete_post(self, id: int) -> None:
         """
-        게시글을 삭제합니다.
+        게시글 삭제를 백그라운드에서 실행합니다.
 
         Args:
             id (int): 삭제할 게시글 ID
-
-        Returns:
-            bool: 성공 시 True, 실패 시 False
         """
-        try:
-            self.post_dao.delete_post(id)
-            self.reset_and_fetch()
-            return True
-        except Exception as e:
-            self.error_message_signal.emit(str(e))
-            return False
+        self.delete_posts([id])
 
-    def delete_posts(self, ids: list[int]) -> bool:
+    def delete_posts(self, ids: list[int]) -> None:
         """
-        여러 게시글을 일괄 삭제합니다.
+        여러 게시글의 일괄 삭제를 백그라운드에서 실행합니다.
 
         Args:
             ids (list[int]): 삭제할 게시글 ID 리스트
-
-        Returns:
-            bool: 성공 시 True, 실패 시 False
         """
-        try:
+        def task():
+            # 캐시 무효화 범위를 정하기 위해 삭제할 게시글을 먼저 읽어 둠
+            deleted_posts = self.post_dao.get_posts_by_ids(ids)
             self.post_dao.delete_posts(ids)
+            return deleted_posts
+
+        def invalidate(deleted_posts):
+            self.post_cache.invalidate(ids)
+            self.page_cache.invalidate_delete(deleted_posts)
+
+        self._run_write(task, invalidate)
+
+    def _run_write(self, task, invalidate, message: str = None, saved: bool = False) -> None:
+        """
+        쓰기 작업을 쓰기 전용 스레드에서 실행합니다.
+        성공하면 페이지 캐시에서 영향을 받는 부분을 버리고, 알림 메시지와
+        post_saved 시그널(saved가 True일 때)을 방출한 뒤 첫 페이지를 다시 조회합니다.
+        실패하면 에러 메시지와 post_save_failed 시그널(saved가 True일 때)을 방출합니다.
+
+        Args:
+            task (Callable): 백그라운드에서 실행할 함수
+            invalidate (Callable): task의 반환값을 받아 페이지 캐시를 무효화하는 함수
+            message (str, optional): 성공 시 표시할 알림 메시지
+            saved (bool): 완료 시 post_saved / post_save_failed 시그널 방출 여부
+        """
+        def run(progress):
+            result = task()
+            # 이 쓰기까지 반영된 데이터 버전
+            return result, self.post_dao.get_data_version()
+
+        def on_finished(task_id, result):
+            result, version = result
+            invalidate(result)
+            # 캐시가 반영한 버전보다 한 번 더 바뀌었다면 다른 변경이 있었던 것이므로 다음 조회에서 전체를 버림
+            if self.page_cache.version is not None and version == self.page_cache.version + 1:
+                self.page_cache.version = version
+            if message:
+                self.message_signal.emit(message)
+            if saved:
+                self.post_saved.emit()
             self.reset_and_fetch()
-            return True
-        except Exception as e:
-            self.error_message_signal.emit(str(e))
-            return False
 
-    def search_posts(self, keyword: str) -> list[Post] | None:
+        def on_error(task_id, error_message):
+            self.error_message_signal.emit(error_message)
+            if saved:
+                self.post_save_failed.emit()
+
+        self._writer.submit(run, on_finished=on_finished, on_error=on_error)
+
+    def search_posts(self, keyword: str) -> None:
         """
         키워드로 게시글을 검색합니다. 검색 후 첫 페이지로 이동합니다.
+        검색 결과는 fetch_posts를 통해 시그널로 전달됩니다.
 
         Args:
             keyword (str): 검색어
+        """
+        self.current_keyword = keyword.strip()
+        self.current_page = 1
+        self.fetch_posts()
 
-        Returns:9
-            list[Post] | None: 검색 결과 리스트 (실제 반환값은 fetch_posts를 통해 시그널로 전달됨)
+    def set_search_order(self, order: str) -> None:
+        """
+        검색 결과 정렬 기준을 변경합니다. 검색 중이면 첫 페이지부터 다시 조회합니다.
+
+        Args:
+            order (str): SEARCH_ORDER_RECENT(최신순) 또는 SEARCH_ORDER_RELEVANCE(관련도순)
         """
-        try:
-            self.current_keyword = keyword.strip()
+        if order == self.search_order:
+            return
+        self.search_order = order
+        if self.current_keyword:
             self.current_page = 1
             self.fetch_posts()
-        except Exception as e:
-            self.error_message_signal.emit(str(e))
-            return []
+
+    def set_list_mode(self, mode: str) -> None:
+        """
+        목록 표시 방식을 바꾸고 목록을 처음부터 다시 조회합니다.
+
+        Args:
+            mode (str): LIST_MODE_PAGED(페이지 버튼) 또는 LIST_MODE_SCROLL(무한 스크롤)
+        """
+        if mode == self.list_mode:
+            return
+        self.list_mode = mode
+        self.current_page = 1
+        self.fetch_posts()
+
+    def load_scroll_chunk(self, generation: int, index: int, anchor: Optional[tuple]) -> None:
+        """
+        무한 스크롤 목록의 묶음(chunk) 하나를 백그라운드에서 조회합니다.
+        조회가 끝나면 scroll_chunk_loaded 시그널을, 실패하면 에러 메시지와 scroll_chunk_failed 시그널을 방출합니다.
+
+        Args:
+            generation (int): 요청한 스크롤 목록 세대
+            index (int): 묶음 번호 (0부터)
+            anchor (tuple, optional): 이전 묶음 마지막 글의 키 (created_at, id). 첫 묶음이면 None
+        """
+        if generation != self.scroll_generation:
+            return
+        request = PageRequest(
+            keyword=self.current_keyword,
+            page=index + 1,
+            limit=self.scroll_chunk_size,
+            order=self.search_order,
+            total_count=None,
+            generation=generation,
+            anchor=anchor,
+        )
+        self._reader.submit(self._load_scroll_chunk, request, on_finished=self._on_scroll_chunk_loaded,
+                            on_error=lambda task_id, message: self._on_scroll_chunk_failed(request, message))
+
+    def _load_scroll_chunk(self, request: PageRequest, progress=None) -> tuple:
+        """
+        무한 스크롤 묶음을 조회합니다. (백그라운드 스레드에서 실행)
+        이전 묶음의 마지막 키에서 이어 읽으므로 목록 깊이와 무관하게 빠르며,
+        관련도순 검색만 (created_at, id) 순서가 아니므로 OFFSET 방식으로 조회합니다.
+        """
+        if self._is_relevance_search(request):
+            posts = self.post_dao.get_search_posts_paginated(request.keyword, request.page, request.limit,
+                                                             request.order)
+            return request, posts
+        if request.keyword:
+            return request, self.post_dao.get_search_posts_seek(request.keyword, request.limit, request.anchor)
+        return request, self.post_dao.get_posts_seek(request.limit, request.anchor)
+
+    def _on_scroll_chunk_loaded(self, task_id: int, result: tuple) -> None:
+        request, posts = result
+        if request.generation == self.scroll_generation:
+            self.scroll_chunk_loaded.emit(request.generation, request.page - 1, posts)
+
+    def _on_scroll_chunk_failed(self, request: PageRequest, message: str) -> None:
+        self.error_message_signal.emit(f"Data Load Failed: {message}")
+        if request.generation == self.scroll_generation:
+            self.scroll_chunk_failed.emit(request.generation, request.page - 1)
+
+    def compress_existing_posts(self) -> None:
+        """
+        압축 기능 도입 전에 저장된 게시글의 본문 압축을 백그라운드에서 시작합니다.
+        한 묶음씩 쓰기 스레드에 낮은 우선순위로 제출하므로, 그 사이 사용자의 저장/삭제가 먼저 실행됩니다.
+        진행 상태는 DB에 저장되어 다음 실행 때 이어서 진행하며, 모두 압축한 뒤에는 아무 작업도 하지 않습니다.
+        """
+        if self._compressing:
+            return
+        self._compressing = True
+        self._submit_compression_batch()
+
+    def _submit_compression_batch(self) -> None:
+        self._writer.submit(lambda progress: self.post_dao.compress_existing_posts(),
+                            on_finished=self._on_compression_batch_finished,
+                            on_error=self._on_compression_failed, priority=MAINTENANCE_PRIORITY)
+
+    def _on_compression_batch_finished(self, task_id: int, result: Optional[tuple[int, int]]) -> None:
+        if result is None:
+            self._compressing = False
+            return
+        self._submit_compression_batch()
+
+    def _on_compression_failed(self, task_id: int, message: str) -> None:
+        # 압축은 저장 공간만 줄이는 작업이므로 실패해도 알리지 않고 다음 실행 때 다시 시도
+        self._compressing = False
+
+    def export_posts(self, path: str) -> None:
+        """
+        전체 게시글을 파일로 내보내는 작업을 백그라운드 스레드에서 시작합니다.
+        진행 상황은 export_progress 시그널로, 완료/실패는 알림 시그널로 전달됩니다.
+
+        Args:
+            path (str): 저장할 파일 경로 (.csv / .jsonl, .gz면 gzip 압축)
+        """
+        if self._export_task_id is not None:
+            self.message_signal.emit("Export is already running.")
+            return
+
+        self._export_task_id = self._reader.submit(
+            self._export_task, path,
+            on_finished=self._on_export_finished, on_error=self._on_export_error, on_progress=self._on_export_progress
+        )
+        self.export_running_changed.emit(True)
+
+    def _export_task(self, path: str, progress) -> tuple[str, int]:
+        """
+        백그라운드 스레드에서 실행되는 내보내기 작업입니다.
+        """
+        total = self.post_dao.get_total_count()
+        progress(0, total)
+        # zipfile/csv 등을 불러오므로 시작 시간을 줄이기 위해 내보낼 때 import
+        from app.utils.post_io import write_posts
+
+        count = write_posts(self.post_dao.iter_posts(), path, on_progress=lambda done: progress(done, total))
+        return path, count
+
+    def _on_export_progress(self, task_id: int, done: int, total: int) -> None:
+        self.export_progress.emit(done, total)
+
+    def _on_export_finished(self, task_id: int, result: tuple[str, int]) -> None:
+        path, count = result
+        self._export_task_id = None
+        self.export_running_changed.emit(False)
+        self.message_signal.emit(f"Exported {count} posts to {path}")
+
+    def _on_export_error(self, task_id: int, message: str) -> None:
+        self._export_task_id = None
+        self.export_running_changed.emit(False)
+        self.error_message_signal.emit(f"Export Failed: {message}")
+
+    def wait_for_tasks(self, timeout_ms: int = -1) -> bool:
+        """
+        실행 중인 백그라운드 작업이 모두 끝날 때까지 기다립니다. (종료 처리 등에서 사용)
+
+        Returns:
+            bool: 시간 내에 모두 끝났으면 True
+        """
+        return self._writer.wait(timeout_ms) and self._reader.wait(timeout_ms)
 
     def reset_and_fetch(self):
         self.current_keyword = ""
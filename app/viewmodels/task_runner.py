@@ -0,0 +1,105 @@
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QThreadPool
+
+from app.viewmodels.worker import Worker
+
+
+class TaskRunner(QObject):
+    """
+    DAO 호출 등 오래 걸릴 수 있는 작업을 GUI 스레드 밖(QThreadPool)에서 실행하는 클래스입니다.
+    작업마다 증가하는 id를 부여하며, 완료/에러/진행 콜백은 항상 GUI 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, max_threads: int = 1, parent: Optional[QObject] = None):
+        """
+        TaskRunner 초기화 메서드입니다.
+
+        Args:
+            max_threads (int): 동시에 실행할 최대 작업 수 (1이면 제출 순서대로 하나씩 실행)
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._next_id = 0
+        # 실행 중인 작업: 작업 id -> (Worker, 시그널 이름별 콜백)
+        self._tasks = {}
+
+    def submit(self, fn: Callable, *args, on_finished: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, on_progress: Optional[Callable] = None,
+               on_partial: Optional[Callable] = None, priority: int = 0, **kwargs) -> int:
+        """
+        작업을 스레드 풀에 제출합니다.
+        fn은 백그라운드 스레드에서 fn(*args, progress=..., **kwargs) 형태로 호출되므로
+        Qt 위젯이나 GUI 상태를 건드리지 않아야 합니다.
+        on_partial을 지정하면 fn에 중간 결과 보고 함수 partial(result)도 함께 전달됩니다.
+
+        Args:
+            fn (Callable): 실행할 함수
+            on_finished (Callable, optional): on_finished(task_id, result) 형태의 완료 콜백
+            on_error (Callable, optional): on_error(task_id, message) 형태의 에러 콜백
+            on_progress (Callable, optional): on_progress(task_id, done, total) 형태의 진행 콜백
+            on_partial (Callable, optional): on_partial(task_id, result) 형태의 중간 결과 콜백
+            priority (int): 대기열 우선순위 (높을수록 먼저 실행, 미리 읽기 같은 작업은 음수)
+
+        Returns:
+            int: 작업 id
+        """
+        self._next_id += 1
+        task_id = self._next_id
+        worker = Worker(task_id, fn, *args, **kwargs)
+        if on_partial is not None:
+            worker.kwargs["partial"] = worker.report_partial
+        # 시그널은 이 객체(GUI 스레드)의 메서드로 연결되어 큐를 거쳐 GUI 스레드에서 처리됩니다.
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.error.connect(self._on_error)
+        worker.signals.progress.connect(self._on_progress)
+        worker.signals.partial.connect(self._on_partial)
+        self._tasks[task_id] = (worker, {
+            "finished": on_finished,
+            "error": on_error,
+            "progress": on_progress,
+            "partial": on_partial,
+        })
+        self.pool.start(worker, priority)
+        return task_id
+
+    def is_running(self, task_id: int) -> bool:
+        """
+        작업이 아직 완료되지 않았는지 확인합니다.
+        """
+        return task_id in self._tasks
+
+    def wait(self, timeout_ms: int = -1) -> bool:
+        """
+        제출된 작업이 모두 끝날 때까지 기다립니다. (종료 처리 등에서 사용)
+
+        Returns:
+            bool: 시간 내에 모두 끝났으면 True
+        """
+        return self.pool.waitForDone(timeout_ms)
+
+    def _callback(self, task_id: int, name: str, done: bool = False) -> Optional[Callable]:
+        task = self._tasks.pop(task_id, None) if done else self._tasks.get(task_id)
+        return task[1][name] if task else None
+
+    def _on_finished(self, task_id: int, result) -> None:
+        callback = self._callback(task_id, "finished", done=True)
+        if callback:
+            callback(task_id, result)
+
+    def _on_error(self, task_id: int, message: str) -> None:
+        callback = self._callback(task_id, "error", done=True)
+        if callback:
+            callback(task_id, message)
+
+    def _on_progress(self, task_id: int, done: int, total: int) -> None:
+        callback = self._callback(task_id, "progress")
+        if callback:
+            callback(task_id, done, total)
+
+    def _on_partial(self, task_id: int, result) -> None:
+        callback = self._callback(task_id, "partial")
+        if callback:
+            callback(task_id, result)
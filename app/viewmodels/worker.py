@@ -0,0 +1,64 @@
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+class WorkerSignals(QObject):
+    """
+    백그라운드 작업의 결과를 GUI 스레드로 전달하는 시그널 모음입니다.
+    GUI 스레드에서 생성되므로, 연결된 QObject 슬롯은 GUI 스레드에서 실행됩니다.
+    """
+    # (작업 id, 결과)
+    finished = Signal(int, object)
+    # (작업 id, 에러 메시지)
+    error = Signal(int, str)
+    # (작업 id, 처리한 개수, 전체 개수)
+    progress = Signal(int, int, int)
+    # (작업 id, 중간 결과)
+    partial = Signal(int, object)
+
+
+class Worker(QRunnable):
+    """
+    함수를 QThreadPool의 스레드에서 실행하는 작업 클래스입니다.
+    실행할 함수는 마지막 인자로 진행 상황 보고 함수 progress(done, total)를 받습니다.
+    """
+
+    def __init__(self, task_id: int, fn: Callable, *args, **kwargs):
+        """
+        Worker 초기화 메서드입니다.
+
+        Args:
+            task_id (int): 결과 시그널과 함께 전달할 작업 id
+            fn (Callable): 백그라운드에서 실행할 함수
+            *args, **kwargs: fn에 전달할 인자
+        """
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        스레드 풀에서 호출되어 함수를 실행하고 결과 또는 에러 시그널을 방출합니다.
+        """
+        try:
+            result = self.fn(*self.args, progress=self.report_progress, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(self.task_id, str(e))
+        else:
+            self.signals.finished.emit(self.task_id, result)
+
+    def report_progress(self, done: int, total: int) -> None:
+        """
+        작업 진행 상황을 progress 시그널로 보고합니다.
+        """
+        self.signals.progress.emit(self.task_id, done, total)
+
+    def report_partial(self, result) -> None:
+        """
+        작업이 끝나기 전의 중간 결과를 partial 시그널로 보고합니다.
+        """
+        self.signals.partial.emit(self.task_id, result)
@@ -1,4 +1,17 @@
+import importlib
+
 from .post_table_model import *
+from .post_scroll_model import *
 from .post_list import *
-from .post_detail import *
-from .post_editor import *
\ No newline at end of file
+
+# 상세/에디터 페이지는 처음 사용할 때 import하여 시작 시간을 줄입니다. (이름 -> 모듈)
+_LAZY_PAGES = {
+    "PostDetailPage": ".post_detail",
+    "PostEditorPage": ".post_editor",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PAGES:
+        return getattr(importlib.import_module(_LAZY_PAGES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
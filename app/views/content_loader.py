@@ -0,0 +1,123 @@
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtGui import QTextCursor, Qt
+from PySide6.QtWidgets import QTextEdit, QPlainTextEdit
+
+# 이 길이(글자 수) 미만의 본문은 한 번에 넣음
+PROGRESSIVE_THRESHOLD = 64 * 1024
+# 나눠 넣을 때 처음 바로 넣는 길이. 첫 화면을 채우기에 충분한 크기
+FIRST_CHUNK_SIZE = 16 * 1024
+# 이후 한 번에 이어 붙이는 길이와, 한 번의 유휴 시간 조각에서 이어 붙이기에 쓰는 최대 시간(밀리초)
+CHUNK_SIZE = 16 * 1024
+SLICE_BUDGET_MS = 8
+# 이 길이 이상의 본문은 서식 없는 가벼운 위젯(QPlainTextEdit)으로 표시
+PLAIN_VIEWER_THRESHOLD = 1024 * 1024
+# 서식 있는 텍스트(HTML)인지 판단할 때 보는 앞부분 길이
+RICH_TEXT_PROBE_SIZE = 4096
+
+
+def is_plain_text(text: str) -> bool:
+    """
+    본문이 서식 없는 텍스트인지 확인합니다. (QTextEdit.setText와 같은 기준)
+    HTML 파싱 없이 바로 넣어도 되는지 판단하는 데 사용하며, 앞부분만 검사합니다.
+    """
+    return not Qt.mightBeRichText(text[:RICH_TEXT_PROBE_SIZE])
+
+
+def _split_point(text: str, start: int, size: int) -> int:
+    """
+    start부터 size 글자 부근에서 줄바꿈 바로 뒤의 위치를 찾아 반환합니다. 줄바꿈이 없으면 size 글자에서 자릅니다.
+    """
+    end = start + size
+    if end >= len(text):
+        return len(text)
+    newline = text.rfind("\n", start, end)
+    return newline + 1 if newline > start else end
+
+
+class ContentLoader(QObject):
+    """
+    큰 본문을 텍스트 위젯(QTextEdit/QPlainTextEdit)에 나눠 넣는 클래스입니다.
+    첫 조각은 바로 넣어 첫 화면을 즉시 그리고, 나머지는 이벤트 루프가 한가할 때 시간 예산만큼씩 이어 붙여
+    수 MB의 본문도 화면을 멈추지 않고 표시합니다. 작은 본문이나 서식 있는 텍스트(HTML)는 기존처럼 한 번에 넣습니다.
+    """
+    loading_changed = Signal(bool)
+
+    def __init__(self, parent=None):
+        """
+        ContentLoader 초기화 메서드입니다.
+
+        Args:
+            parent (QObject, optional): 부모 객체
+        """
+        super().__init__(parent)
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._append_slice)
+        self._widget = None
+        self._text = ""
+        self._position = 0
+        self._read_only = False
+
+    @property
+    def loading(self) -> bool:
+        return self._widget is not None
+
+    def load(self, widget: QTextEdit | QPlainTextEdit, text: str) -> None:
+        """
+        widget의 내용을 text로 바꿉니다. 진행 중인 이전 로딩은 취소됩니다.
+        나눠 넣는 동안에는 widget을 읽기 전용으로 두고 실행 취소(undo) 기록을 남기지 않습니다.
+
+        Args:
+            widget (QTextEdit | QPlainTextEdit): 내용을 넣을 위젯
+            text (str): 넣을 본문
+        """
+        self.cancel()
+        plain = is_plain_text(text)
+        if len(text) < PROGRESSIVE_THRESHOLD or (not plain and isinstance(widget, QTextEdit)):
+            if isinstance(widget, QPlainTextEdit) or plain:
+                widget.setPlainText(text)
+            else:
+                widget.setText(text)
+            return
+
+        first_end = _split_point(text, 0, FIRST_CHUNK_SIZE)
+        widget.setPlainText(text[:first_end])
+        self._widget = widget
+        self._text = text
+        self._position = first_end
+        self._read_only = widget.isReadOnly()
+        widget.setReadOnly(True)
+        widget.document().setUndoRedoEnabled(False)
+        self._timer.start()
+        self.loading_changed.emit(True)
+
+    def cancel(self) -> None:
+        """
+        진행 중인 로딩을 멈춥니다. 이미 넣은 부분은 그대로 남습니다.
+        """
+        if self._widget is None:
+            return
+        self._timer.stop()
+        widget = self._widget
+        self._widget = None
+        self._text = ""
+        widget.setReadOnly(self._read_only)
+        widget.document().setUndoRedoEnabled(True)
+        self.loading_changed.emit(False)
+
+    def _append_slice(self) -> None:
+        """
+        SLICE_BUDGET_MS 동안 남은 본문을 CHUNK_SIZE씩 이어 붙이고, 다 붙이면 로딩을 끝냅니다.
+        """
+        cursor = QTextCursor(self._widget.document())
+        cursor.movePosition(QTextCursor.End)
+        text = self._text
+        deadline = time.perf_counter() + SLICE_BUDGET_MS / 1000
+        while self._position < len(text) and time.perf_counter() < deadline:
+            end = _split_point(text, self._position, CHUNK_SIZE)
+            cursor.insertText(text[self._position:end])
+            self._position = end
+        if self._position >= len(text):
+            self.cancel()
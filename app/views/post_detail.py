@@ -1,8 +1,10 @@
 from PySide6.QtCore import Signal, QSize
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTextBrowser, QMessageBox
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTextBrowser, QMessageBox, \
+    QPlainTextEdit
 
-from app.models import Post
+from app.models import Post, PostSummary
 from app.utils import IconManager, DETAIL_STYLE
+from app.views.content_loader import ContentLoader, PLAIN_VIEWER_THRESHOLD
 
 
 class PostDetailPage(QWidget):
@@ -24,6 +26,9 @@ class PostDetailPage(QWidget):
         super().__init__()
         self.view_model = view_model
         self.current_post = None
+        # 큰 본문을 나눠 넣는 로더와, 매우 큰 본문용 가벼운 뷰어 (처음 필요할 때 만듦)
+        self.content_loader = ContentLoader(self)
+        self.plain_viewer = None
         self.init_ui()
 
         self.setStyleSheet(DETAIL_STYLE)
@@ -83,19 +88,24 @@ class PostDetailPage(QWidget):
         layout.addWidget(self.text_content)
 
         self.setLayout(layout)
+        self.content_layout = layout
 
         # 시그널 연결
         self.btn_go_list.clicked.connect(self.request_go_list.emit)
         self.btn_edit.clicked.connect(self.on_edit_clicked)
         self.btn_delete.clicked.connect(self.on_delete_clicked)
 
-    def set_data(self, post: Post):
+    def set_data(self, post: Post | PostSummary):
         """
         화면에 표시할 게시글 데이터를 설정합니다.
+        목록에서 받은 게시글 요약이면 이 시점에 본문을 포함한 게시글을 조회합니다.
 
         Args:
-            post (Post): 표시할 게시글 객체
+            post (Post | PostSummary): 표시할 게시글 객체
         """
+        post = self.view_model.get_full_post(post)
+        if post is None:
+            return
         self.current_post = post
 
         self.lable_title.setText(post.title)
@@ -104,7 +114,35 @@ class PostDetailPage(QWidget):
         self.label_author_info.setText(post.author)
         self.label_date_info.setText(date_str)
 
-        self.text_content.setText(post.content)
+        content = post.content or ""
+        self.content_loader.load(self.use_content_view(len(content)), content)
+
+    def use_content_view(self, length: int) -> QTextBrowser | QPlainTextEdit:
+        """
+        본문 길이에 맞는 표시 위젯을 보이게 하고 반환합니다.
+        PLAIN_VIEWER_THRESHOLD 이상이면 문서 전체의 서식 배치를 하지 않는 QPlainTextEdit(읽기 전용)를 사용합니다.
+
+        Args:
+            length (int): 본문 길이(글자 수)
+
+        Returns:
+            QTextBrowser | QPlainTextEdit: 본문을 넣을 위젯
+        """
+        if length < PLAIN_VIEWER_THRESHOLD:
+            if self.plain_viewer is not None:
+                self.plain_viewer.hide()
+                self.plain_viewer.clear()
+            self.text_content.show()
+            return self.text_content
+
+        if self.plain_viewer is None:
+            self.plain_viewer = QPlainTextEdit()
+            self.plain_viewer.setReadOnly(True)
+            self.content_layout.addWidget(self.plain_viewer)
+        self.text_content.hide()
+        self.text_content.clear()
+        self.plain_viewer.show()
+        return self.plain_viewer
 
     def on_edit_clicked(self):
         """
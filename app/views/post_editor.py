@@ -1,7 +1,9 @@
 from PySide6.QtCore import Signal
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QHBoxLayout, QPushButton, QLineEdit
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTextEdit, QHBoxLayout, QPushButton, QLineEdit, \
+    QPlainTextEdit
 
 from app.utils import EDITOR_STYLE
+from app.views.content_loader import ContentLoader, PLAIN_VIEWER_THRESHOLD
 
 
 class PostEditorPage(QWidget):
@@ -21,6 +23,9 @@ class PostEditorPage(QWidget):
         super().__init__()
         self.view_model = view_model
         self.current_post_id = None
+        # 큰 본문을 나눠 넣는 로더와, 매우 큰 본문용 가벼운 입력창 (처음 필요할 때 만듦)
+        self.content_loader = ContentLoader(self)
+        self.large_input = None
         self.init_ui()
 
         self.setStyleSheet(EDITOR_STYLE)
@@ -73,24 +78,35 @@ class PostEditorPage(QWidget):
         layout.addWidget(self.input_content)
 
         self.setLayout(layout)
+        self.content_layout = layout
 
         # 시그널 연결
         self.btn_save.clicked.connect(self.save_post)
         self.btn_go_list.clicked.connect(self.request_go_list.emit)
         self.btn_cancel.clicked.connect(self.back_to_post)
+        self.view_model.post_saved.connect(self.request_go_list.emit)
+        # 저장이 끝나기 전에 다시 눌러 같은 글이 두 번 저장되지 않도록, 저장 중에는 저장 버튼을 막음
+        self.view_model.post_saved.connect(self.on_save_finished)
+        self.view_model.post_save_failed.connect(self.on_save_finished)
+        # 본문을 다 넣기 전에는 잘린 본문이 저장되지 않도록 저장 버튼을 막음
+        self.content_loader.loading_changed.connect(self.btn_save.setDisabled)
 
     def set_data(self, post=None):
         """
         에디터의 입력 필드를 초기화하거나 기존 게시글 데이터로 채웁니다.
 
         Args:
-            post (Post, optional): 수정할 게시글 객체. None이면 새 글 작성 모드.
+            post (Post | PostSummary, optional): 수정할 게시글 객체. None이면 새 글 작성 모드.
+                게시글 요약이면 이 시점에 본문을 포함한 게시글을 조회합니다.
         """
+        if post:
+            post = self.view_model.get_full_post(post)
         if post:
             self.current_post_id = post.id
             self.input_title.setText(post.title)
             self.input_author.setText(post.author)
-            self.input_content.setText(post.content)
+            content = post.content or ""
+            self.content_loader.load(self.use_content_input(len(content)), content)
 
             self.input_author.setDisabled(True)
             self.btn_cancel.setVisible(True)
@@ -99,34 +115,77 @@ class PostEditorPage(QWidget):
             self.current_post_id = None
             self.input_title.clear()
             self.input_author.clear()
-            self.input_content.clear()
+            self.content_loader.cancel()
+            self.use_content_input(0).clear()
 
             self.input_author.setDisabled(False)
             self.btn_cancel.setVisible(False)
             self.btn_save.setText("Post")
 
+    @property
+    def content_input(self) -> QTextEdit | QPlainTextEdit:
+        """
+        현재 보이는 본문 입력 위젯을 반환합니다.
+        """
+        if self.large_input is not None and self.large_input.isVisibleTo(self):
+            return self.large_input
+        return self.input_content
+
+    def use_content_input(self, length: int) -> QTextEdit | QPlainTextEdit:
+        """
+        본문 길이에 맞는 입력 위젯을 보이게 하고 반환합니다.
+        PLAIN_VIEWER_THRESHOLD 이상이면 문서 전체의 서식 배치를 하지 않는 QPlainTextEdit를 사용합니다.
+        (본문은 서식 없는 텍스트로 저장되므로 저장 결과는 같음)
+
+        Args:
+            length (int): 본문 길이(글자 수)
+
+        Returns:
+            QTextEdit | QPlainTextEdit: 본문을 넣을 위젯
+        """
+        if length < PLAIN_VIEWER_THRESHOLD:
+            if self.large_input is not None:
+                self.large_input.hide()
+                self.large_input.clear()
+            self.input_content.show()
+            return self.input_content
+
+        if self.large_input is None:
+            self.large_input = QPlainTextEdit()
+            self.large_input.setTabChangesFocus(True)
+            self.content_layout.addWidget(self.large_input)
+        self.input_content.hide()
+        self.input_content.clear()
+        self.large_input.show()
+        return self.large_input
+
     def save_post(self):
         """
         작성된 내용을 저장합니다.
-        새 글이면 추가(add), 기존 글이면 수정(update)을 수행합니다.
+        새 글이면 추가(add), 기존 글이면 수정(update)을 요청합니다.
         """
         id = self.current_post_id
         title = self.input_title.text().strip()
-        content = self.input_content.toPlainText().strip()
+        content = self.content_input.toPlainText().strip()
         author = self.input_author.text().strip()
 
         if not title or not content:
             self.view_model.message_signal.emit("Please enter title and content")
             return
 
-        is_pass = False
+        # 저장은 백그라운드에서 실행되며, 완료되면 post_saved 시그널로 목록 화면으로 이동합니다.
+        self.btn_save.setDisabled(True)
         if id:
-            is_pass = self.view_model.update_post(id, title, content, author)
+            self.view_model.update_post(id, title, content, author)
         else:
-            is_pass = self.view_model.add_post(title, content, author)
+            self.view_model.add_post(title, content, author)
 
-        if is_pass:
-            self.request_go_list.emit()
+    def on_save_finished(self):
+        """
+        저장이 끝나면(성공 또는 실패) 저장 버튼을 다시 사용할 수 있게 합니다.
+        본문을 아직 나눠 넣는 중이면 로더가 끝날 때 풀어 주므로 그대로 둡니다.
+        """
+        self.btn_save.setDisabled(self.content_loader.loading)
 
     def back_to_post(self):
         """
@@ -1,10 +1,20 @@
-from PySide6.QtCore import Signal, QModelIndex, QSize
+from PySide6.QtCore import Signal, QModelIndex, QSize, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTableView, QPushButton, QAbstractItemView, \
-    QHeaderView, QMessageBox, QLineEdit
+    QHeaderView, QMessageBox, QLineEdit, QComboBox, QFileDialog, QProgressBar, QLabel
 
-from app.models import Post
+from app.database import SEARCH_ORDER_RECENT, SEARCH_ORDER_RELEVANCE
+
+from app.models import PostSummary
 from app.utils import IconManager, LIST_STYLE
-from app.views import PostTableModel
+from app.viewmodels import LIST_MODE_PAGED, LIST_MODE_SCROLL
+from app.views import PostTableModel, PostScrollModel
+
+# 한 화면에 보여질 페이지 버튼 개수 (1~10 이면 10개)
+PAGE_BUTTONS_PER_BLOCK = 10
+# 입력하는 대로 검색할 때 마지막 입력 후 기다리는 시간(ms)
+LIVE_SEARCH_DEBOUNCE_MS = 300
+# 조회가 이 시간(ms)보다 오래 걸릴 때만 로딩 표시 (짧은 조회에서 깜빡임 방지)
+LOADING_INDICATOR_DELAY_MS = 200
 
 
 class PostListPage(QWidget):
@@ -47,15 +57,51 @@ class PostListPage(QWidget):
         self.btn_post = QPushButton("Post")
         self.btn_post.setObjectName("btn_post")
 
+        # 전체 게시글 내보내기 버튼과 진행 표시줄 (내보내기 중에만 표시)
+        self.btn_export = QPushButton("Export")
+        self.progress_export = QProgressBar()
+        self.progress_export.setFixedWidth(120)
+        self.progress_export.setVisible(False)
+
         btn_layout.addWidget(self.btn_post)
+        btn_layout.addWidget(self.btn_export)
+        btn_layout.addWidget(self.progress_export)
+
+        # 목록 조회 중 표시
+        self.label_loading = QLabel("Loading...")
+        self.label_loading.setVisible(False)
+        self.loading_timer = QTimer(self)
+        self.loading_timer.setSingleShot(True)
+        self.loading_timer.setInterval(LOADING_INDICATOR_DELAY_MS)
+        self.loading_timer.timeout.connect(lambda: self.label_loading.setVisible(True))
+        btn_layout.addWidget(self.label_loading)
         nav_layout.addLayout(btn_layout)
 
         # 상단 검색 영역 / 삭제 버튼
         search_layout = QHBoxLayout()
         self.input_search = QLineEdit()
         self.input_search.returnPressed.connect(lambda: self.search_by_keyword(self.input_search.text()))
+
+        # 입력하는 대로 검색 (입력이 멈추면 검색하고, 이전 검색은 ViewModel에서 취소)
+        self.live_search = True
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(LIVE_SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.on_search_input_idle)
+        self.input_search.textEdited.connect(self.on_search_text_edited)
+        # 입력하는 대로 검색한 요청을 처리하는 중인지 여부 (검색창을 비워도 입력 중이므로 초기화하지 않음)
+        self._live_searching = False
         self.btn_search = QPushButton("Search")
 
+        # 목록 표시 방식 전환 (페이지 버튼 / 무한 스크롤)
+        self.btn_scroll_mode = QPushButton("Scroll")
+        self.btn_scroll_mode.setCheckable(True)
+
+        # 검색 결과 정렬 기준 (최신순 / 관련도순)
+        self.combo_search_order = QComboBox()
+        self.combo_search_order.addItem("Recent", SEARCH_ORDER_RECENT)
+        self.combo_search_order.addItem("Relevance", SEARCH_ORDER_RELEVANCE)
+
         self.btn_delete = QPushButton()
         self.btn_delete.setObjectName("btn_delete")
         self.btn_delete.setEnabled(False)
@@ -63,7 +109,9 @@ class PostListPage(QWidget):
         self.btn_delete.setIconSize(QSize(20, 20))
         search_layout.addStretch()
         search_layout.addWidget(self.input_search)
+        search_layout.addWidget(self.combo_search_order)
         search_layout.addWidget(self.btn_search)
+        search_layout.addWidget(self.btn_scroll_mode)
         search_layout.addWidget(self.btn_delete)
 
         nav_layout.addLayout(search_layout)
@@ -76,10 +124,19 @@ class PostListPage(QWidget):
         self.table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
+
+        # 행 높이를 모두 같게 두어 행이 많아도 스크롤 계산이 가볍도록 함
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         layout.addWidget(self.table)
 
-        # 페이징 영역
-        pagination_layout = QHBoxLayout()
+        # 테이블 모델은 표시 방식별로 한 번만 만들고 목록이 바뀌면 내용만 갱신
+        self.model = PostTableModel()
+        self.scroll_model = PostScrollModel(self.view_model)
+
+        # 페이징 영역 (무한 스크롤 모드에서는 숨김)
+        self.pagination_widget = QWidget()
+        pagination_layout = QHBoxLayout(self.pagination_widget)
+        pagination_layout.setContentsMargins(0, 0, 0, 0)
         pagination_layout.addStretch()
 
         self.btn_prev_jump = QPushButton("<<")
@@ -93,6 +150,17 @@ class PostListPage(QWidget):
         self.page_buttons_layout.setSpacing(5)  # 버튼 사이 간격 5px
         pagination_layout.addLayout(self.page_buttons_layout)
 
+        # 페이지 버튼은 미리 만들어 두고, 페이지가 바뀌면 번호만 바꿔서 재사용
+        self.page_buttons = []
+        self.page_block_start = 1
+        for _ in range(PAGE_BUTTONS_PER_BLOCK):
+            btn = QPushButton()
+            btn.setObjectName("btn_page")
+            btn.setFixedSize(30, 30)
+            btn.setVisible(False)
+            self.page_buttons_layout.addWidget(btn)
+            self.page_buttons.append(btn)
+
         self.btn_next_jump = QPushButton(">>")
         self.btn_next = QPushButton(">")
         self.btn_next_jump.setFixedSize(30, 30)
@@ -101,9 +169,36 @@ class PostListPage(QWidget):
         pagination_layout.addWidget(self.btn_next_jump)
         pagination_layout.addStretch()  # 오른쪽 여백 밀기 (가운데 정렬됨)
 
-        layout.addLayout(pagination_layout)
+        layout.addWidget(self.pagination_widget)
         self.setLayout(layout)
 
+        self.set_table_model(self.model)
+
+    def set_table_model(self, model: PostTableModel):
+        """
+        테이블에 모델을 연결하고 헤더 크기와 선택 변경 이벤트를 설정합니다. (표시 방식을 바꿀 때만 호출)
+
+        Args:
+            model (PostTableModel): 연결할 테이블 모델
+        """
+        self.table.setModel(model)
+
+        header = self.table.horizontalHeader()
+        header.setHighlightSections(False)
+
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        header.setSectionResizeMode(3, QHeaderView.Interactive)
+
+        self.table.setColumnWidth(0, 50)
+        self.table.setColumnWidth(2, 100)
+        self.table.setColumnWidth(3, 150)
+
+        # 모델을 바꾸면 선택 모델도 새로 만들어지므로 다시 연결
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        self.btn_delete.setEnabled(False)
+
     def init_signals(self):
         """
         ViewModel의 시그널과 UI 이벤트를 연결합니다.
@@ -113,6 +208,9 @@ class PostListPage(QWidget):
         self.view_model.post_list_updated.connect(self.update_table)
         self.view_model.paging_info_updated.connect(self.update_paging_ui)
         self.view_model.post_list_updated_initialized.connect(self.reset_search_input)
+        self.view_model.export_progress.connect(self.update_export_progress)
+        self.view_model.export_running_changed.connect(self.on_export_running_changed)
+        self.view_model.loading_changed.connect(self.on_loading_changed)
 
         # Table Double click event 연결
         self.table.doubleClicked.connect(self.on_double_click)
@@ -122,41 +220,30 @@ class PostListPage(QWidget):
         self.btn_prev.clicked.connect(lambda checked: self.view_model.go_prev_page(1))
         self.btn_next_jump.clicked.connect(lambda checked: self.view_model.go_next_page(10))
         self.btn_next.clicked.connect(lambda checked: self.view_model.go_next_page(1))
+        for i, btn in enumerate(self.page_buttons):
+            btn.clicked.connect(lambda checked, i=i: self.view_model.go_to_page(self.page_block_start + i))
 
         # 작성, 삭제, 검색 기능 event 연결
         self.btn_post.clicked.connect(self.request_post_signal.emit)
+        self.btn_export.clicked.connect(self.export_posts)
         self.btn_delete.clicked.connect(self.delete_selected_posts)
         self.btn_search.clicked.connect(lambda checked: self.search_by_keyword(self.input_search.text()))
+        self.btn_scroll_mode.toggled.connect(self.on_scroll_mode_toggled)
+        self.combo_search_order.currentIndexChanged.connect(
+            lambda index: self.view_model.set_search_order(self.combo_search_order.itemData(index))
+        )
 
-    def update_table(self, posts: list[Post]):
+    def update_table(self, posts: list[PostSummary]):
         """
         ViewModel로부터 전달받은 게시글 목록으로 테이블을 갱신합니다.
+        모델은 그대로 두고 달라진 행만 반영하므로 선택 상태와 스크롤 위치가 유지됩니다.
 
         Args:
-            posts (list[Post]): 게시글 객체 리스트
+            posts (list[PostSummary]): 게시글 요약 객체 리스트
         """
         self.current_posts = posts
-        self.model = PostTableModel(posts)
-        self.table.setModel(self.model)
-
-        header = self.table.horizontalHeader()
-        header.setHighlightSections(False)
-
-        header.setSectionResizeMode(0, QHeaderView.Interactive)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.Interactive)
-        header.setSectionResizeMode(3, QHeaderView.Interactive)
-
-        self.table.setColumnWidth(0, 50)
-        self.table.setColumnWidth(2, 100)
-        self.table.setColumnWidth(3, 150)
-
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-
-        selection_model = self.table.selectionModel()
-        selection_model.selectionChanged.connect(self.on_selection_changed)
-
-        self.btn_delete.setEnabled(False)
+        self.model.set_posts(posts)
+        self.btn_delete.setEnabled(self.table.selectionModel().hasSelection())
 
     def update_paging_ui(self, current, total):
         """
@@ -167,35 +254,24 @@ class PostListPage(QWidget):
             total (int): 전체 페이지 수
         """
 
-        while self.page_buttons_layout.count():
-            child = self.page_buttons_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        # 한 화면에 보여질 페이지 버튼 개수 (1~10 이면 10개)
-        items_per_block = 10
-
         # 현재 페이지가 속한 블록의 시작 번호 구하기 공식
-        current_block = (current - 1) // items_per_block
-        start_page = current_block * items_per_block + 1
+        current_block = (current - 1) // PAGE_BUTTONS_PER_BLOCK
+        self.page_block_start = current_block * PAGE_BUTTONS_PER_BLOCK + 1
 
         # 끝 번호는 시작 번호 + 9. 단, 전체 페이지(total)를 넘을 순 없음
-        end_page = min(total, start_page + items_per_block - 1)
-
-        # 계산된 범위(start_page ~ end_page)만큼 버튼 만들기
-        for page in range(start_page, end_page + 1):
-            btn = QPushButton(str(page))
-            btn.setFixedSize(30, 30)
-
-            if page == current:
-                btn.setStyleSheet("color: white; font-weight: bold;")
-                btn.setEnabled(False)
-            else:
-                btn.setStyleSheet("color:gray")
-
-            btn.clicked.connect(lambda checked, p=page: self.view_model.go_to_page(p))
-
-            self.page_buttons_layout.addWidget(btn)
+        end_page = min(total, self.page_block_start + PAGE_BUTTONS_PER_BLOCK - 1)
+
+        # 계산된 범위(page_block_start ~ end_page)만큼 버튼 번호를 바꿔서 표시 (현재 페이지는 비활성화)
+        for i, btn in enumerate(self.page_buttons):
+            page = self.page_block_start + i
+            if page > end_page:
+                btn.setVisible(False)
+                continue
+            text = str(page)
+            if btn.text() != text:
+                btn.setText(text)
+            btn.setEnabled(page != current)
+            btn.setVisible(True)
 
         # 이전/다음 버튼 활성화 여부
         self.btn_prev_jump.setEnabled(current > 1)
@@ -219,10 +295,11 @@ class PostListPage(QWidget):
             return
 
         ids_to_delete = []
+        model = self.table.model()
         for index in selected_indexes:
-            row = index.row()
-            if row < len(self.current_posts):
-                ids_to_delete.append(self.current_posts[row].id)
+            post = model.post_at(index.row())
+            if post is not None:
+                ids_to_delete.append(post.id)
 
         if ids_to_delete:
             self.view_model.delete_posts(ids_to_delete)
@@ -234,8 +311,87 @@ class PostListPage(QWidget):
         Args:
             keyword (str): 검색어
         """
+        self.search_timer.stop()
         self.view_model.search_posts(keyword)
 
+    def set_live_search(self, enabled: bool, debounce_ms: int = LIVE_SEARCH_DEBOUNCE_MS):
+        """
+        입력하는 대로 검색하는 기능을 켜거나 끄고, 입력이 멈춘 뒤 기다릴 시간을 설정합니다.
+
+        Args:
+            enabled (bool): 사용 여부
+            debounce_ms (int): 마지막 입력 후 검색까지 기다리는 시간(ms)
+        """
+        self.live_search = enabled
+        self.search_timer.setInterval(debounce_ms)
+        if not enabled:
+            self.search_timer.stop()
+
+    def on_search_text_edited(self, text: str):
+        """
+        사용자가 검색어를 고칠 때마다 호출됩니다. 입력이 멈출 때까지 검색을 미룹니다.
+        """
+        if self.live_search:
+            self.search_timer.start()
+
+    def on_search_input_idle(self):
+        """
+        검색어 입력이 멈췄을 때 호출됩니다. 검색어가 바뀌었을 때만 검색합니다.
+        """
+        keyword = self.input_search.text()
+        if keyword.strip() != self.view_model.current_keyword:
+            self._live_searching = True
+            try:
+                self.search_by_keyword(keyword)
+            finally:
+                self._live_searching = False
+
+    def export_posts(self):
+        """
+        저장할 파일을 선택받아 전체 게시글 내보내기를 요청합니다.
+        """
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Posts",
+            "posts.jsonl",
+            "JSON Lines (*.jsonl);;CSV (*.csv);;Compressed JSON Lines (*.jsonl.gz);;Compressed CSV (*.csv.gz)"
+        )
+        if path:
+            self.view_model.export_posts(path)
+
+    def update_export_progress(self, done: int, total: int):
+        """
+        내보내기 진행 표시줄을 갱신합니다.
+
+        Args:
+            done (int): 내보낸 게시글 수
+            total (int): 전체 게시글 수
+        """
+        self.progress_export.setMaximum(max(total, 1))
+        self.progress_export.setValue(min(done, max(total, 1)))
+
+    def on_loading_changed(self, loading: bool):
+        """
+        목록 조회 상태에 따라 로딩 표시를 갱신합니다. 조회가 길어질 때만 표시합니다.
+
+        Args:
+            loading (bool): 조회 중 여부
+        """
+        if loading:
+            self.loading_timer.start()
+        else:
+            self.loading_timer.stop()
+            self.label_loading.setVisible(False)
+
+    def on_export_running_changed(self, running: bool):
+        """
+        내보내기 실행 여부에 따라 버튼과 진행 표시줄을 전환합니다.
+        """
+        self.btn_export.setEnabled(not running)
+        self.progress_export.setVisible(running)
+        if running:
+            self.progress_export.setValue(0)
+
     def on_double_click(self, index: QModelIndex):
         """
         테이블의 행을 더블 클릭했을 때 상세 페이지로 이동 요청을 보냅니다.
@@ -243,15 +399,31 @@ class PostListPage(QWidget):
         Args:
             index (QModelIndex): 클릭된 셀의 인덱스
         """
-        row = index.row()
-        if row < len(self.current_posts):
-            selected_post = self.current_posts[row]
+        selected_post = self.table.model().post_at(index.row())
+        if selected_post is not None:
             self.request_read_signal.emit(selected_post)
 
+    def on_scroll_mode_toggled(self, checked: bool):
+        """
+        목록 표시 방식을 페이지 버튼과 무한 스크롤 사이에서 전환합니다.
+
+        Args:
+            checked (bool): True면 무한 스크롤 모드
+        """
+        self.set_table_model(self.scroll_model if checked else self.model)
+        self.pagination_widget.setVisible(not checked)
+        self.view_model.set_list_mode(LIST_MODE_SCROLL if checked else LIST_MODE_PAGED)
+
     def on_selection_changed(self, selected, deselected):
         has_selection = self.table.selectionModel().hasSelection()
         self.btn_delete.setEnabled(has_selection)
 
     def reset_search_input(self):
+        """
+        전체 목록으로 돌아갈 때 검색창을 비우고 포커스를 해제합니다.
+        입력하는 대로 검색하다 검색어를 모두 지운 경우에는 사용자가 계속 입력할 수 있도록 그대로 둡니다.
+        """
+        if self._live_searching:
+            return
         self.input_search.clear()
         self.input_search.clearFocus()
\ No newline at end of file
@@ -0,0 +1,170 @@
+from collections import OrderedDict
+
+from PySide6.QtCore import QModelIndex
+
+from app.views.post_table_model import PostTableModel, LOADING_ROW, to_display_row
+
+# 메모리에 유지할 최대 묶음(chunk) 수. 화면에서 먼 묶음부터 버리고, 다시 보이면 새로 읽음
+MAX_RESIDENT_CHUNKS = 10
+
+
+class PostScrollModel(PostTableModel):
+    """
+    전체 게시글을 무한 스크롤로 보여주는 테이블 모델입니다.
+    스크롤이 끝에 닿으면 canFetchMore/fetchMore로 다음 묶음을 이어 읽고,
+    메모리에는 최근에 본 묶음만 유지합니다. 버린 묶음은 저장해 둔 경계 키에서 키셋 방식으로 다시 읽습니다.
+    """
+
+    def __init__(self, view_model):
+        """
+        PostScrollModel 초기화 메서드입니다.
+
+        Args:
+            view_model: 게시글 데이터와 로직을 관리하는 ViewModel 인스턴스
+        """
+        super().__init__()
+        self.view_model = view_model
+        self.chunk_size = view_model.scroll_chunk_size
+        self._generation = view_model.scroll_generation
+        self._row_count = 0
+        self._at_end = False
+        # 묶음 번호 -> (게시글 요약 리스트, 표시 문자열 튜플 리스트), 오래 보지 않은 순서
+        self._chunks = OrderedDict()
+        # 묶음 번호 -> 그 묶음 마지막 글의 키 (created_at, id). 다음 묶음을 읽을 기준점
+        self._end_keys = {}
+        # 조회 중인 묶음 번호
+        self._pending = set()
+
+        view_model.scroll_reset.connect(self.reset_rows)
+        view_model.scroll_chunk_loaded.connect(self.on_chunk_loaded)
+        view_model.scroll_chunk_failed.connect(self.on_chunk_failed)
+
+    def reset_rows(self, generation: int) -> None:
+        """
+        목록을 비우고 첫 묶음부터 다시 읽습니다. (검색어 변경, 게시글 추가/수정/삭제 시)
+
+        Args:
+            generation (int): 새 스크롤 목록 세대
+        """
+        self.beginResetModel()
+        self._generation = generation
+        self._row_count = 0
+        self._at_end = False
+        self._chunks.clear()
+        self._end_keys.clear()
+        self._pending.clear()
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def canFetchMore(self, parent=QModelIndex()):
+        """
+        다음 묶음을 더 읽을 수 있는지 반환합니다. 이미 읽는 중이면 False를 반환합니다.
+        """
+        if parent.isValid() or self._at_end:
+            return False
+        return self._row_count // self.chunk_size not in self._pending
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        목록 끝에 이어질 다음 묶음 조회를 요청합니다.
+        """
+        if self.canFetchMore(parent):
+            self._request_chunk(self._row_count // self.chunk_size)
+
+    def post_at(self, row: int):
+        """
+        행 번호에 해당하는 게시글 요약을 반환합니다.
+        해당 묶음이 메모리에 없으면 다시 읽도록 요청하고 None을 반환합니다.
+
+        Args:
+            row (int): 행 번호
+
+        Returns:
+            Optional[PostSummary]: 게시글 요약 객체, 아직 읽지 않았으면 None
+        """
+        chunk = self._resident_chunk(row)
+        if chunk is None:
+            return None
+        posts = chunk[0]
+        offset = row % self.chunk_size
+        return posts[offset] if offset < len(posts) else None
+
+    def display_row_at(self, row: int) -> tuple:
+        """
+        행 번호에 해당하는 표시 문자열 튜플을 반환합니다.
+        해당 묶음이 메모리에 없으면 다시 읽도록 요청하고 LOADING_ROW를 반환합니다.
+        """
+        chunk = self._resident_chunk(row)
+        if chunk is None:
+            return LOADING_ROW
+        rows = chunk[1]
+        offset = row % self.chunk_size
+        return rows[offset] if offset < len(rows) else LOADING_ROW
+
+    def _resident_chunk(self, row: int):
+        if not 0 <= row < self._row_count:
+            return None
+        index = row // self.chunk_size
+        chunk = self._chunks.get(index)
+        if chunk is None:
+            self._request_chunk(index)
+            return None
+        self._chunks.move_to_end(index)
+        return chunk
+
+    def on_chunk_loaded(self, generation: int, index: int, posts: list) -> None:
+        """
+        ViewModel에서 묶음 조회가 끝났을 때 호출됩니다.
+        목록 끝의 새 묶음이면 행을 추가하고, 다시 읽은 묶음이면 해당 행을 갱신합니다.
+
+        Args:
+            generation (int): 요청한 스크롤 목록 세대
+            index (int): 묶음 번호
+            posts (list[PostSummary]): 게시글 요약 리스트
+        """
+        if generation != self._generation:
+            return
+        self._pending.discard(index)
+        first_row = index * self.chunk_size
+
+        if first_row == self._row_count:
+            if posts:
+                self._store_chunk(index, posts)
+                self.beginInsertRows(QModelIndex(), first_row, first_row + len(posts) - 1)
+                self._row_count += len(posts)
+                self.endInsertRows()
+            if len(posts) < self.chunk_size:
+                self._at_end = True
+        elif posts:
+            self._store_chunk(index, posts)
+            last_row = min(first_row + len(posts), self._row_count) - 1
+            self.dataChanged.emit(self.index(first_row, 0), self.index(last_row, self.columnCount() - 1))
+
+    def on_chunk_failed(self, generation: int, index: int) -> None:
+        """
+        ViewModel에서 묶음 조회가 실패했을 때 호출됩니다.
+        조회 중 표시를 지워, 다시 스크롤하거나 해당 행을 그릴 때 같은 묶음을 다시 요청할 수 있게 합니다.
+
+        Args:
+            generation (int): 요청한 스크롤 목록 세대
+            index (int): 묶음 번호
+        """
+        if generation == self._generation:
+            self._pending.discard(index)
+
+    def _store_chunk(self, index: int, posts: list) -> None:
+        self._chunks[index] = (posts, [to_display_row(post) for post in posts])
+        self._chunks.move_to_end(index)
+        self._end_keys[index] = (posts[-1].created_at, posts[-1].id)
+        while len(self._chunks) > MAX_RESIDENT_CHUNKS:
+            self._chunks.popitem(last=False)
+
+    def _request_chunk(self, index: int) -> None:
+        if index in self._pending:
+            return
+        self._pending.add(index)
+        anchor = self._end_keys.get(index - 1)
+        self.view_model.load_scroll_chunk(self._generation, index, anchor)
@@ -1,7 +1,33 @@
 import re
+from difflib import SequenceMatcher
 
 from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
 
+# 날짜 문자열에서 연, 월, 일만 추출하는 정규식
+DATE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+# 아직 읽지 않은 행에 표시할 값
+LOADING_ROW = ("", "Loading...", "", "")
+# 컬럼별 정렬 (제목만 기본 정렬, 나머지는 가운데 정렬)
+COLUMN_ALIGNMENTS = (Qt.AlignCenter, None, Qt.AlignCenter, Qt.AlignCenter)
+
+
+def to_display_row(post) -> tuple:
+    """
+    게시글 요약을 테이블에 표시할 문자열 튜플로 변환합니다.
+    그리기(data) 호출마다 변환하지 않도록 데이터를 받을 때 한 번만 호출합니다.
+
+    Args:
+        post (PostSummary): 게시글 요약 객체
+
+    Returns:
+        tuple: (글 번호, 제목, 작성자, 날짜)
+    """
+    date_str = str(post.updated_at or post.created_at)
+    match = DATE_PATTERN.match(date_str)
+    # 연, 월, 일만 표현 ("2025-12-26"), 실패시 원본
+    date = match.group(1) if match else date_str
+    return str(post.id), post.title, post.author, date
+
 
 class PostTableModel(QAbstractTableModel):
     """
@@ -13,12 +39,77 @@ class PostTableModel(QAbstractTableModel):
         PostTableModel 초기화 메서드입니다.
 
         Args:
-            posts (list[Post], optional): 표시할 게시글 리스트
+            posts (list[PostSummary], optional): 표시할 게시글 요약 리스트
         """
         super().__init__()
-        self.posts = posts or []
+        # 전달받은 리스트(페이지 캐시 등과 공유될 수 있음)를 직접 수정하지 않도록 복사해서 보관
+        self.posts = list(posts or [])
+        # 행별 표시 문자열 (posts와 같은 순서)
+        self.rows = [to_display_row(post) for post in self.posts]
         self._headers = ["No.", "Subject", "Author", "Date"]
 
+    def set_posts(self, posts) -> None:
+        """
+        표시할 게시글 목록을 바꿉니다.
+        모델을 초기화(reset)하지 않고 게시글 id 기준으로 달라진 행만 추가/삭제/갱신하므로
+        뷰의 선택 상태와 스크롤 위치가 유지됩니다.
+
+        Args:
+            posts (list[PostSummary]): 새로 표시할 게시글 요약 리스트
+        """
+        old_ids = [post.id for post in self.posts]
+        new_ids = [post.id for post in posts]
+        opcodes = SequenceMatcher(None, old_ids, new_ids, autojunk=False).get_opcodes()
+
+        # 뒤쪽 구간부터 적용해야 앞쪽 구간의 행 번호가 바뀌지 않음
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                for offset in range(i2 - i1):
+                    row = i1 + offset
+                    if self.posts[row] != posts[j1 + offset]:
+                        self.posts[row] = posts[j1 + offset]
+                        self.rows[row] = to_display_row(posts[j1 + offset])
+                        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self.posts[i1:i2]
+                del self.rows[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + j2 - j1 - 1)
+                self.posts[i1:i1] = posts[j1:j2]
+                self.rows[i1:i1] = [to_display_row(post) for post in posts[j1:j2]]
+                self.endInsertRows()
+
+    def post_at(self, row: int):
+        """
+        행 번호에 해당하는 게시글 요약을 반환합니다.
+
+        Args:
+            row (int): 행 번호
+
+        Returns:
+            Optional[PostSummary]: 게시글 요약 객체, 없으면 None
+        """
+        if 0 <= row < len(self.posts):
+            return self.posts[row]
+        return None
+
+    def display_row_at(self, row: int) -> tuple:
+        """
+        행 번호에 해당하는 표시 문자열 튜플을 반환합니다.
+
+        Args:
+            row (int): 행 번호
+
+        Returns:
+            tuple: (글 번호, 제목, 작성자, 날짜), 아직 읽지 않은 행이면 LOADING_ROW
+        """
+        if 0 <= row < len(self.rows):
+            return self.rows[row]
+        return LOADING_ROW
+
     def rowCount(self, parent=QModelIndex()):
         """
         행(Row)의 개수를 반환합니다.
@@ -45,33 +136,12 @@ class PostTableModel(QAbstractTableModel):
         if not index.isValid():
             return None
 
+        # 표시 문자열은 데이터를 받을 때 미리 만들어 두므로 여기서는 꺼내기만 함
         if role == Qt.DisplayRole:
-            post = self.posts[index.row()]
-            col = index.column()
-            # 0 번째 컬럼: 글 번호(id)
-            if col == 0:
-                return str(post.id)
-            # 1 번째 컬럼: 제목
-            if col == 1:
-                return post.title
-            # 2 번째 컬럼: 작성자
-            if col == 2:
-                return post.author
-            # 3 번째 컬럼: 날짜(연, 월, 일)
-            if col == 3:
-                target_date = post.updated_at or post.created_at
-                date_str = str(target_date)
-                # 연, 월, 일만 표현하도록 정규식 적용
-                match = re.match(r"^(\d{4}-\d{2}-\d{2})", date_str)
-
-                if match:
-                    return match.group(1)  # "2025-12-26" 반환
-                else:
-                    return date_str  # 실패시 원본 반환
+            return self.display_row_at(index.row())[index.column()]
 
         if role == Qt.TextAlignmentRole:
-            if index.column() != 1:
-                return Qt.AlignCenter
+            return COLUMN_ALIGNMENTS[index.column()]
 
         return None
 
@@ -0,0 +1,22 @@
+"""
+benchmarks/__main__.py
+
+DAO, ViewModel, 테이블 모델, 본문 압축 벤치마크를 한 번에 실행하고 결과를 하나의 JSON 파일로 저장합니다.
+화면 없이 실행하기 위해 QT_QPA_PLATFORM=offscreen을 기본으로 사용합니다.
+
+실행: python -m benchmarks [--sizes 1k,100k,1m] [--repeat 20] [--suite dao] [--output bench_results.json]
+비교: python -m benchmarks.compare before.json after.json
+"""
+from benchmarks import bench_compression, bench_dao, bench_table_model, bench_viewmodel
+from benchmarks.bench_utils import bench_main
+
+SUITES = {
+    bench_dao.SUITE: bench_dao.run,
+    bench_viewmodel.SUITE: bench_viewmodel.run,
+    bench_table_model.SUITE: bench_table_model.run,
+    bench_compression.SUITE: bench_compression.run,
+}
+
+
+if __name__ == '__main__':
+    bench_main("DDE Board benchmark suite", SUITES)
@@ -0,0 +1,127 @@
+"""
+benchmarks/bench_compression.py
+
+본문 압축 전후의 DB 크기와 본문 읽기 지연 시간을 게시판 크기별로 측정하는 벤치마크입니다.
+DB 복사본의 본문을 모두 원문으로 되돌린 상태(plain)에서 측정하고, 기존 게시글 압축(백그라운드 마이그레이션)을
+끝까지 실행한 시간을 잰 뒤 같은 항목을 다시 측정합니다(compressed). 크기는 VACUUM 후 파일 크기(MB)입니다.
+
+실행: python -m benchmarks.bench_compression [--sizes 1k,100k] [--repeat 20] [--output bench_results.json]
+"""
+import os
+import random
+import sqlite3
+import time
+
+from app.database import db, PostDao
+from app.database.compression import unzip_sql
+from benchmarks.bench_dao import PAGE_SIZE
+from benchmarks.bench_utils import BENCH_SEED, BenchmarkReport, bench_main, copy_board, measure, remove_board, use_board
+
+SUITE = "compression"
+# get_post 한 번의 측정에서 읽는 게시글 수
+GET_POST_COUNT = 100
+# 오래 걸리는 항목(짧은 검색어 검색, 내보내기 순회)의 최대 측정 횟수
+FULL_SCAN_REPEAT = 3
+# 구문 검색 대신 trigram 목록으로 찾는 짧은 검색어
+SHORT_KEYWORD = "ab"
+
+
+def _compact(path: str) -> float:
+    """
+    DB 파일을 VACUUM으로 정리하고 WAL을 반영한 뒤 파일 크기(MB)를 반환합니다.
+    """
+    db.close()
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+    return os.path.getsize(path) / (1024 * 1024)
+
+
+def _decompress_all(path: str) -> None:
+    """
+    path의 모든 본문을 원문(TEXT)으로 되돌리고, 기존 게시글 압축을 처음부터 다시 하도록 진행 상태를 되돌립니다.
+    """
+    use_board(path)
+    conn = db.get_connection()
+    try:
+        with conn:
+            conn.execute(f"UPDATE posts SET content = {unzip_sql()} WHERE typeof(content) = 'blob'")
+            conn.execute("""
+                         UPDATE content_compression
+                         SET next_id = 1, end_id = (SELECT COALESCE(MAX(id), 0) FROM posts)
+                         """)
+    finally:
+        conn.close()
+
+
+def run_reads(report: BenchmarkReport, label: str, rows: int, repeat: int, db_mb: float) -> None:
+    """
+    현재 DB에서 본문을 읽는 경로(상세 조회, 여러 글 조회, 짧은 검색어 검색, 전체 순회)의 시간을 측정합니다.
+
+    Args:
+        report (BenchmarkReport): 결과를 모을 객체
+        label (str): 항목 이름 뒤에 붙일 상태 이름 (plain / compressed)
+        rows (int): 게시글 수
+        repeat (int): 항목별 측정 횟수
+        db_mb (float): 현재 DB 파일 크기(MB)
+    """
+    dao = PostDao()
+    rng = random.Random(BENCH_SEED)
+    ids = [rng.randint(1, rows) for _ in range(GET_POST_COUNT)]
+    page_ids = rng.sample(range(1, rows + 1), min(PAGE_SIZE, rows))
+
+    def get_posts():
+        for id in ids:
+            dao.get_post(id)
+
+    report.add(SUITE, f"get_post x{GET_POST_COUNT} {label}", rows, measure(get_posts, repeat), db_mb=round(db_mb, 1))
+    report.add(SUITE, f"page bodies {label}", rows, measure(lambda: dao.get_posts_by_ids(page_ids), repeat))
+    full_repeat = min(repeat, FULL_SCAN_REPEAT)
+    report.add(SUITE, f"short keyword search {label}", rows,
+               measure(lambda: dao.get_search_count(SHORT_KEYWORD), full_repeat, warmup=0))
+    samples = measure(lambda: sum(len(chunk) for chunk in dao.iter_posts()), full_repeat, warmup=0)
+    report.add(SUITE, f"export scan {label}", rows, samples, posts_per_sec=rows / min(samples))
+
+
+def run(report: BenchmarkReport, path: str, rows: int, repeat: int) -> None:
+    """
+    path의 DB 복사본으로 압축 벤치마크를 실행하고 결과를 report에 추가합니다.
+
+    Args:
+        report (BenchmarkReport): 결과를 모을 객체
+        path (str): 벤치마크용 DB 경로 (rows개의 게시글)
+        rows (int): 게시글 수
+        repeat (int): 항목별 측정 횟수
+    """
+    work_path = copy_board(path, "compression")
+    try:
+        _decompress_all(work_path)
+        plain_mb = _compact(work_path)
+        use_board(work_path)
+        run_reads(report, "plain", rows, repeat, plain_mb)
+
+        dao = PostDao()
+        start = time.perf_counter()
+        while dao.compress_existing_posts() is not None:
+            pass
+        elapsed = time.perf_counter() - start
+        compressed_mb = _compact(work_path)
+        report.add(SUITE, "compress existing posts", rows, [elapsed], posts_per_sec=rows / elapsed,
+                   db_mb_before=round(plain_mb, 1), db_mb_after=round(compressed_mb, 1))
+
+        use_board(work_path)
+        run_reads(report, "compressed", rows, repeat, compressed_mb)
+    finally:
+        use_board(path)
+        remove_board(work_path)
+
+
+def main():
+    bench_main("Content compression benchmark", {SUITE: run})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+benchmarks/bench_dao.py
+
+PostDao 조회/삭제 성능을 게시판 크기별로 측정하는 벤치마크입니다.
+페이지 깊이별 목록 조회(OFFSET / 키셋), 전체/검색 개수, 검색 페이지, 여러 글 삭제의 지연 시간을 측정합니다.
+
+실행: python -m benchmarks.bench_dao [--sizes 1k,100k,1m] [--repeat 20] [--output bench_results.json]
+"""
+import random
+
+from app.database import PostDao, SEARCH_ORDER_RECENT, SEARCH_ORDER_RELEVANCE
+from benchmarks.bench_utils import (BENCH_SEED, SEARCH_KEYWORDS, BenchmarkReport, bench_main, copy_board, measure,
+                                    remove_board, use_board)
+
+SUITE = "dao"
+# 한 페이지 게시글 수 (ViewModel 기본값과 같음)
+PAGE_SIZE = 16
+# 한 번에 삭제할 최대 게시글 수
+BULK_DELETE_SIZE = 500
+
+
+def run(report: BenchmarkReport, path: str, rows: int, repeat: int) -> None:
+    """
+    path의 DB로 PostDao 벤치마크를 실행하고 결과를 report에 추가합니다.
+
+    Args:
+        report (BenchmarkReport): 결과를 모을 객체
+        path (str): 벤치마크용 DB 경로 (rows개의 게시글)
+        rows (int): 게시글 수
+        repeat (int): 항목별 측정 횟수
+    """
+    use_board(path)
+    dao = PostDao()
+    last_page = max(1, -(-rows // PAGE_SIZE))
+    depths = {"first": 1, "middle": max(1, last_page // 2), "last": last_page}
+
+    for depth, page in depths.items():
+        report.add(SUITE, f"page offset {depth}", rows,
+                   measure(lambda: dao.get_posts_paginated(page, PAGE_SIZE), repeat))
+    for depth, page in depths.items():
+        # 이전 페이지 마지막 글을 기준점으로 키셋 조회 (ViewModel이 이웃 페이지로 이동할 때와 같은 경로)
+        previous = dao.get_posts_paginated(page - 1, PAGE_SIZE) if page > 1 else []
+        anchor = (previous[-1].created_at, previous[-1].id) if previous else None
+        report.add(SUITE, f"page seek {depth}", rows,
+                   measure(lambda: dao.get_posts_seek(PAGE_SIZE, anchor), repeat))
+    report.add(SUITE, "page with count first", rows,
+               measure(lambda: dao.get_page_with_count("", 1, PAGE_SIZE), repeat))
+
+    report.add(SUITE, "total count", rows, measure(dao.get_total_count, repeat))
+    for name, keyword in SEARCH_KEYWORDS.items():
+        report.add(SUITE, f"search count {name}", rows, measure(lambda: dao.get_search_count(keyword), repeat))
+        for order in (SEARCH_ORDER_RECENT, SEARCH_ORDER_RELEVANCE):
+            report.add(SUITE, f"search page {name} {order}", rows,
+                       measure(lambda: dao.get_page_with_count(keyword, 1, PAGE_SIZE, order), repeat))
+
+    run_bulk_delete(report, path, rows, repeat)
+
+
+def run_bulk_delete(report: BenchmarkReport, path: str, rows: int, repeat: int) -> None:
+    """
+    DB 복사본에서 무작위로 고른 여러 게시글을 한 번에 삭제하는 시간을 측정합니다.
+    (인덱스, 검색 인덱스, 게시글 수 카운터 트리거 비용 포함)
+    """
+    work_path = copy_board(path)
+    try:
+        use_board(work_path)
+        dao = PostDao()
+        rng = random.Random(BENCH_SEED)
+        batch_size = max(1, min(BULK_DELETE_SIZE, rows // (2 * (repeat + 1))))
+        remaining = list(range(1, rows + 1))
+        rng.shuffle(remaining)
+        batches = iter([remaining[i:i + batch_size] for i in range(0, rows, batch_size)])
+        batch = []
+
+        def next_batch():
+            batch[:] = next(batches)
+
+        report.add(SUITE, "bulk delete", rows, measure(lambda: dao.delete_posts(batch), repeat, setup=next_batch),
+                   batch_size=batch_size)
+    finally:
+        use_board(path)
+        remove_board(work_path)
+
+
+def main():
+    bench_main("PostDao benchmark", {SUITE: run})
+
+
+if __name__ == '__main__':
+    main()
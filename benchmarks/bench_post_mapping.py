@@ -0,0 +1,140 @@
+"""
+benchmarks/bench_post_mapping.py
+
+DB 조회 결과를 Post 객체로 변환하는 비용을 측정하는 마이크로 벤치마크입니다.
+이전 방식(sqlite3.Row + 컬럼 이름 조회 + __dict__를 가진 dataclass)과
+현재 방식(튜플 행 + 위치 인자 + slots dataclass)의 초당 생성 객체 수와 객체당 메모리를 비교합니다.
+
+실행: python -m benchmarks.bench_post_mapping [--rows 100000] [--repeat 5]
+"""
+import argparse
+import sqlite3
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from app.database.post_dao import PostDao, POST_COLUMNS, SUMMARY_COLUMNS
+from app.models import Post, PostSummary
+
+
+@dataclass
+class LegacyPost:
+    """
+    비교용 이전 Post 정의 (slots 없는 dataclass)
+    """
+    title: str
+    content: str
+    author: str = "anonymous"
+    id: int = None
+    created_at: str = None
+    updated_at: str = None
+
+
+def legacy_mapping(conn: sqlite3.Connection, sql: str) -> list:
+    """
+    이전 방식: sqlite3.Row에서 컬럼 이름으로 값을 꺼내 키워드 인자로 객체를 만듭니다.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute(sql)
+    return [
+        LegacyPost(
+            id=row['id'],
+            title=row['title'],
+            content=row['content'],
+            author=row['author'],
+            created_at=row['created_at'],
+            updated_at=row['updated_at']
+        )
+        for row in cursor.fetchall()
+    ]
+
+
+def current_mapping(conn: sqlite3.Connection, sql: str, model=Post) -> list:
+    """
+    현재 방식: PostDao와 같은 경로(튜플 행 + 위치 인자)로 객체를 만듭니다.
+    """
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    return PostDao._fetch_models(cursor, model)
+
+
+def seed(rows: int) -> sqlite3.Connection:
+    """
+    메모리 DB에 벤치마크용 게시글을 생성합니다.
+    """
+    conn = sqlite3.connect(":memory:")
+    conn.execute(Post.CREATE_TABLE_SQL)
+    conn.executemany(
+        "INSERT INTO posts (title, content, author) VALUES (?, ?, ?)",
+        ((f"title {i}", f"content {i} " * 20, f"author{i % 50}") for i in range(rows)),
+    )
+    conn.commit()
+    return conn
+
+
+def measure_rate(func, repeat: int) -> float:
+    """
+    func를 repeat번 실행하여 가장 빠른 실행 기준 초당 생성 객체 수를 반환합니다.
+    """
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(func())
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def measure_bytes_per_object(make, rows: list) -> float:
+    """
+    이미 조회한 행으로 객체만 만들 때 늘어나는 메모리를 객체 수로 나눈 값을 반환합니다.
+    (문자열 값은 행과 공유되므로 객체 자체의 크기만 측정됩니다.)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = make(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Post row mapping micro-benchmark")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    conn = seed(args.rows)
+    post_sql = f"SELECT {', '.join(POST_COLUMNS)} FROM posts"
+    summary_sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM posts"
+
+    tuple_rows = conn.execute(post_sql).fetchall()
+    summary_rows = conn.execute(summary_sql).fetchall()
+    conn.row_factory = sqlite3.Row
+    named_rows = conn.execute(post_sql).fetchall()
+    conn.row_factory = None
+
+    results = [
+        ("legacy Post (Row, by name)",
+         measure_rate(lambda: legacy_mapping(conn, post_sql), args.repeat),
+         measure_bytes_per_object(lambda rows: [LegacyPost(id=row['id'], title=row['title'], content=row['content'],
+                                                           author=row['author'], created_at=row['created_at'],
+                                                           updated_at=row['updated_at']) for row in rows],
+                                  named_rows)),
+        ("Post (tuple, slots)",
+         measure_rate(lambda: current_mapping(conn, post_sql), args.repeat),
+         measure_bytes_per_object(lambda rows: [Post(*row) for row in rows], tuple_rows)),
+        ("PostSummary (tuple, slots)",
+         measure_rate(lambda: current_mapping(conn, summary_sql, PostSummary), args.repeat),
+         measure_bytes_per_object(lambda rows: [PostSummary(*row) for row in rows], summary_rows)),
+    ]
+
+    print(f"rows={args.rows}, repeat={args.repeat}")
+    print(f"{'mapping':<30}{'objects/s':>14}{'bytes/object':>14}")
+    for name, rate, size in results:
+        print(f"{name:<30}{rate:>14,.0f}{size:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+benchmarks/bench_table_model.py
+
+PostTableModel의 그리기 경로 비용을 측정하는 벤치마크입니다.
+set_posts(페이지 교체 / 같은 페이지 다시 받기)와, 뷰가 그릴 때 셀마다 호출하는 data()의
+전체 셀 1회 순회 시간 및 초당 호출 수를 측정합니다.
+
+실행: python -m benchmarks.bench_table_model [--sizes 1k] [--repeat 20] [--output bench_results.json]
+"""
+import os
+from itertools import cycle
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+
+from app.database import PostDao
+from app.viewmodels.post_viewmodel import SCROLL_CHUNK_SIZE
+from app.views import PostTableModel
+from app.views.post_scroll_model import MAX_RESIDENT_CHUNKS
+from benchmarks.bench_dao import PAGE_SIZE
+from benchmarks.bench_utils import BenchmarkReport, bench_main, measure, use_board
+from benchmarks.bench_viewmodel import get_app
+
+SUITE = "table_model"
+# 뷰가 셀마다 요청하는 역할
+DATA_ROLES = (Qt.DisplayRole, Qt.TextAlignmentRole)
+
+
+def run(report: BenchmarkReport, path: str, rows: int, repeat: int) -> None:
+    """
+    path의 DB에서 읽은 게시글로 PostTableModel 벤치마크를 실행하고 결과를 report에 추가합니다.
+    data()는 한 페이지 크기와, 무한 스크롤 모드가 메모리에 유지하는 최대 행 수 두 가지로 측정합니다.
+
+    Args:
+        report (BenchmarkReport): 결과를 모을 객체
+        path (str): 벤치마크용 DB 경로 (rows개의 게시글)
+        rows (int): 게시글 수
+        repeat (int): 항목별 측정 횟수
+    """
+    get_app()
+    use_board(path)
+    dao = PostDao()
+    pages = [dao.get_posts_paginated(page, PAGE_SIZE) for page in (1, 2)]
+
+    model = PostTableModel(pages[0])
+    # 두 페이지를 번갈아 넣어 매번 모든 행이 바뀌게 함
+    alternating = cycle(reversed(pages))
+    report.add(SUITE, "set_posts new page", rows, measure(lambda: model.set_posts(next(alternating)), repeat))
+    report.add(SUITE, "set_posts same page", rows, measure(lambda: model.set_posts(pages[0]), repeat,
+                                                           setup=lambda: model.set_posts(pages[0])))
+
+    for name, count in (("page", PAGE_SIZE), ("scroll window", SCROLL_CHUNK_SIZE * MAX_RESIDENT_CHUNKS)):
+        posts = dao.get_posts_seek(min(count, rows))
+        model = PostTableModel(posts)
+        # 뷰는 이미 만든 QModelIndex로 data()를 호출하므로 인덱스 생성은 측정에서 제외
+        indexes = [model.index(row, column) for row in range(model.rowCount()) for column in range(model.columnCount())]
+
+        def sweep():
+            data = model.data
+            for index in indexes:
+                for role in DATA_ROLES:
+                    data(index, role)
+
+        samples = measure(sweep, repeat)
+        calls = len(indexes) * len(DATA_ROLES)
+        median = sorted(samples)[len(samples) // 2]
+        report.add(SUITE, f"data sweep {name}", rows, samples, calls=calls, calls_per_sec=calls / median)
+
+
+def main():
+    bench_main("PostTableModel benchmark", {SUITE: run})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,318 @@
+"""
+benchmarks/bench_utils.py
+
+벤치마크 공통 도구입니다. 크기별 벤치마크용 DB 생성(한 번 만든 DB는 재사용), 반복 측정,
+백분위 요약, 결과를 JSON으로 저장하는 BenchmarkReport를 제공합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from app.database import db, migrate, PostDao
+from app.database.bulk_load import deferred_maintenance
+from app.utils.board_generator import generate_posts, tag_word
+
+# 기본으로 측정할 게시판 크기 (게시글 수)
+BENCH_SIZES = (1_000, 100_000, 1_000_000)
+# 벤치마크용 DB 파일을 보관할 기본 폴더 (한 번 만든 DB는 다음 실행에서 재사용)
+BENCH_DATA_DIR = os.path.join(tempfile.gettempdir(), "dde_board_bench")
+# 결과 JSON 기본 경로
+BENCH_OUTPUT = "bench_results.json"
+# 같은 데이터를 다시 만들 수 있도록 고정한 난수 시드
+BENCH_SEED = 20240101
+# 생성 데이터 형식 버전. 생성 방식이 바뀌면 올려서 기존 DB 파일을 다시 만들게 함
+BENCH_DATA_FORMAT = 4
+# 검색 벤치마크에 사용하는 검색어 (이름 -> 검색어). 생성 데이터에서 검색되는 비율이 크게 다른 것들로 고름
+SEARCH_KEYWORDS = {
+    "common": "게시판",
+    "english": "python",
+    "tag": tag_word(10),
+    "rare": tag_word(1000),
+}
+
+
+def parse_sizes(text: str) -> list[int]:
+    """
+    "1k,100k,1m" 형식의 크기 목록을 게시글 수 리스트로 변환합니다.
+
+    Args:
+        text (str): 쉼표로 구분한 크기 (k: 천, m: 백만)
+
+    Returns:
+        list[int]: 게시글 수 리스트
+    """
+    sizes = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        scale = {"k": 1_000, "m": 1_000_000}.get(part[-1], 1)
+        sizes.append(int(float(part[:-1] if scale != 1 else part) * scale))
+    return sizes
+
+
+def format_size(rows: int) -> str:
+    if rows >= 1_000_000 and rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}m"
+    if rows >= 1_000 and rows % 1_000 == 0:
+        return f"{rows // 1_000}k"
+    return str(rows)
+
+
+def seed_board(rows: int, data_dir: str = BENCH_DATA_DIR, quiet: bool = False) -> str:
+    """
+    rows개의 게시글이 있는 벤치마크용 DB 파일을 만들고 경로를 반환합니다.
+    같은 크기/형식의 DB가 이미 있으면 다시 만들지 않습니다.
+    만드는 동안 db의 경로가 바뀌므로, 사용할 때는 use_board로 다시 지정해야 합니다.
+
+    Args:
+        rows (int): 게시글 수
+        data_dir (str): DB 파일을 보관할 폴더
+        quiet (bool): True면 진행 상황을 출력하지 않음
+
+    Returns:
+        str: DB 파일 경로
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"board_{format_size(rows)}_v{BENCH_DATA_FORMAT}.db")
+    if os.path.exists(path) and _count_posts(path) == rows:
+        return path
+
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    start = time.perf_counter()
+    db.set_path(path)
+    conn = db.get_connection()
+    try:
+        migrate(conn)
+        with deferred_maintenance(conn):
+            PostDao().insert_posts(generate_posts(rows, seed=BENCH_SEED))
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        conn.close()
+        db.close()
+    if not quiet:
+        print(f"seeded {rows:,} posts into {path} in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return path
+
+
+def _count_posts(path: str) -> Optional[int]:
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("SELECT total FROM post_counter WHERE id = 1").fetchone()[0]
+        finally:
+            conn.close()
+    except (sqlite3.Error, TypeError):
+        return None
+
+
+def use_board(path: str) -> None:
+    """
+    앱의 DB 연결(db)이 path의 DB를 사용하도록 바꿉니다.
+    """
+    db.set_path(path)
+
+
+def copy_board(path: str, suffix: str = "work") -> str:
+    """
+    쓰기 벤치마크가 원본을 바꾸지 않도록 DB 파일을 복사합니다.
+
+    Args:
+        path (str): 원본 DB 경로
+        suffix (str): 복사본 파일 이름에 붙일 문자열
+
+    Returns:
+        str: 복사본 경로
+    """
+    target = f"{os.path.splitext(path)[0]}_{suffix}.db"
+    remove_board(target)
+    src = sqlite3.connect(path)
+    dst = sqlite3.connect(target)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+    return target
+
+
+def remove_board(path: str) -> None:
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: int = 1,
+            setup: Optional[Callable[[], None]] = None) -> list[float]:
+    """
+    func를 warmup번 실행한 뒤 repeat번 실행하여 각 실행 시간(초)을 반환합니다.
+    setup은 매 실행 전에 호출되며 측정 시간에 포함되지 않습니다.
+
+    Args:
+        func (Callable): 측정할 함수
+        repeat (int): 측정 횟수
+        warmup (int): 측정 전에 버리는 실행 횟수
+        setup (Callable, optional): 매 실행 전에 호출할 준비 함수
+
+    Returns:
+        list[float]: 실행 시간(초) 리스트
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def percentile(sorted_samples: list[float], fraction: float) -> float:
+    """
+    정렬된 값에서 선형 보간으로 백분위 값을 구합니다.
+
+    Args:
+        sorted_samples (list[float]): 오름차순으로 정렬된 값
+        fraction (float): 0~1 사이의 백분위 (예: 0.99)
+
+    Returns:
+        float: 백분위 값
+    """
+    if len(sorted_samples) == 1:
+        return sorted_samples[0]
+    position = (len(sorted_samples) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_samples) - 1)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+
+def summarize(samples: list[float]) -> dict:
+    """
+    실행 시간(초) 리스트를 밀리초 단위 통계로 요약합니다.
+
+    Returns:
+        dict: n, min, mean, p50, p90, p99, max (밀리초)
+    """
+    ordered = sorted(samples)
+    to_ms = 1000.0
+    return {
+        "n": len(ordered),
+        "min": ordered[0] * to_ms,
+        "mean": sum(ordered) / len(ordered) * to_ms,
+        "p50": percentile(ordered, 0.50) * to_ms,
+        "p90": percentile(ordered, 0.90) * to_ms,
+        "p99": percentile(ordered, 0.99) * to_ms,
+        "max": ordered[-1] * to_ms,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+class BenchmarkReport:
+    """
+    벤치마크 결과를 모아 표로 출력하고 JSON 파일로 저장하는 클래스입니다.
+    결과는 (suite, name, rows)로 구분되며, compare.py로 두 결과 파일을 비교할 수 있습니다.
+    """
+
+    def __init__(self):
+        self.results = []
+        self.meta = {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        }
+
+    def add(self, suite: str, name: str, rows: int, samples: list[float], **extra) -> dict:
+        """
+        측정 결과를 추가하고 한 줄로 출력합니다.
+
+        Args:
+            suite (str): 벤치마크 묶음 이름 (dao, viewmodel, table_model)
+            name (str): 측정 항목 이름
+            rows (int): 게시판 크기 (게시글 수)
+            samples (list[float]): 실행 시간(초) 리스트
+            **extra: 함께 기록할 값 (처리량 등)
+
+        Returns:
+            dict: 저장된 결과
+        """
+        result = {"suite": suite, "name": name, "rows": rows, **summarize(samples), **extra}
+        self.results.append(result)
+        extras = "".join(f"  {key}={value:,.0f}" if isinstance(value, (int, float)) else f"  {key}={value}"
+                         for key, value in extra.items())
+        print(f"{suite:<12}{format_size(rows):>6}  {name:<34}"
+              f"{result['p50']:>10.3f}{result['p90']:>10.3f}{result['p99']:>10.3f} ms{extras}", flush=True)
+        return result
+
+    @staticmethod
+    def print_header() -> None:
+        print(f"{'suite':<12}{'rows':>6}  {'benchmark':<34}{'p50':>10}{'p90':>10}{'p99':>10}", flush=True)
+
+    def save(self, path: str) -> None:
+        """
+        결과를 JSON 파일로 저장합니다.
+
+        Args:
+            path (str): 저장할 파일 경로
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"meta": self.meta, "results": self.results}, f, ensure_ascii=False, indent=2)
+
+
+def bench_main(description: str, suites: dict, argv: Optional[list[str]] = None) -> BenchmarkReport:
+    """
+    벤치마크 실행 인자를 해석하여 크기별 DB를 준비하고 suites를 차례로 실행한 뒤 결과를 저장합니다.
+
+    Args:
+        description (str): 실행 인자 도움말에 표시할 설명
+        suites (dict): 묶음 이름 -> run(report, path, rows, repeat) 함수
+        argv (list[str], optional): 실행 인자 (None이면 sys.argv)
+
+    Returns:
+        BenchmarkReport: 측정 결과
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--sizes", default=",".join(format_size(size) for size in BENCH_SIZES),
+                        help="board sizes to benchmark, e.g. 1k,100k,1m")
+    parser.add_argument("--repeat", type=int, default=20, help="measured runs per benchmark")
+    parser.add_argument("--suite", action="append", choices=list(suites),
+                        help="run only this suite (can be repeated)")
+    parser.add_argument("--data-dir", default=BENCH_DATA_DIR, help="folder for the generated benchmark databases")
+    parser.add_argument("--output", default=BENCH_OUTPUT, help="JSON result file")
+    args = parser.parse_args(argv)
+
+    sizes = parse_sizes(args.sizes)
+    paths = {rows: seed_board(rows, args.data_dir) for rows in sizes}
+    report = BenchmarkReport()
+    report.meta["repeat"] = args.repeat
+    report.print_header()
+    for name, run in suites.items():
+        if args.suite and name not in args.suite:
+            continue
+        for rows in sizes:
+            run(report, paths[rows], rows, args.repeat)
+    db.close()
+    report.save(args.output)
+    print(f"saved {len(report.results)} results to {args.output}", file=sys.stderr)
+    return report
@@ -0,0 +1,140 @@
+"""
+benchmarks/bench_viewmodel.py
+
+PostViewModel.fetch_posts의 전체 경로(백그라운드 조회 -> GUI 스레드 콜백 -> 시그널 방출)를 측정하는 벤치마크입니다.
+화면 없이 실행하기 위해 QT_QPA_PLATFORM=offscreen을 기본으로 사용합니다.
+호출부터 paging_info_updated 시그널(페이지 표시 완료)까지의 시간을 측정합니다.
+
+실행: python -m benchmarks.bench_viewmodel [--sizes 1k,100k,1m] [--repeat 20] [--output bench_results.json]
+"""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+from app.viewmodels import PostViewModel
+from benchmarks.bench_utils import SEARCH_KEYWORDS, BenchmarkReport, bench_main, use_board
+
+SUITE = "viewmodel"
+# 페이지 표시를 기다리는 최대 시간(밀리초)
+PAGE_TIMEOUT_MS = 60_000
+
+
+def get_app() -> QCoreApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def wait_for_page(view_model: PostViewModel, action) -> float:
+    """
+    action을 실행하고 페이지 표시가 끝날 때(paging_info_updated)까지 이벤트 루프를 돌립니다.
+
+    Args:
+        view_model (PostViewModel): 측정할 ViewModel
+        action (Callable): 목록 조회를 시작하는 함수
+
+    Returns:
+        float: 표시까지 걸린 시간(초)
+    """
+    loop = QEventLoop()
+    shown = []
+
+    def on_shown(*args):
+        shown.append(time.perf_counter())
+        loop.quit()
+
+    view_model.paging_info_updated.connect(on_shown)
+    start = time.perf_counter()
+    try:
+        action()
+        # 캐시된 페이지는 action 안에서 바로 표시됨
+        if not shown:
+            QTimer.singleShot(PAGE_TIMEOUT_MS, loop.quit)
+            loop.exec()
+    finally:
+        view_model.paging_info_updated.disconnect(on_shown)
+    if not shown:
+        raise TimeoutError("page was not shown in time")
+    return shown[0] - start
+
+
+def settle(view_model: PostViewModel) -> None:
+    """
+    미리 읽기 등 남은 백그라운드 작업을 끝내고 결과 콜백까지 처리합니다.
+    """
+    view_model.wait_for_tasks()
+    QCoreApplication.processEvents()
+
+
+def clear_caches(view_model: PostViewModel) -> None:
+    """
+    페이지/게시글/검색 결과 캐시와 페이지 기준점을 모두 버려 처음 조회하는 상태로 만듭니다.
+    """
+    settle(view_model)
+    view_model.page_cache.clear()
+    view_model.post_cache.clear()
+    view_model._page_anchors.clear()
+    view_model.post_dao._search_ids.clear()
+
+
+def run(report: BenchmarkReport, path: str, rows: int, repeat: int) -> None:
+    """
+    path의 DB로 PostViewModel 벤치마크를 실행하고 결과를 report에 추가합니다.
+
+    Args:
+        report (BenchmarkReport): 결과를 모을 객체
+        path (str): 벤치마크용 DB 경로 (rows개의 게시글)
+        rows (int): 게시글 수
+        repeat (int): 항목별 측정 횟수
+    """
+    get_app()
+    use_board(path)
+    view_model = PostViewModel()
+    try:
+        wait_for_page(view_model, view_model.fetch_posts)
+        last_page = view_model.total_pages
+
+        def measure_page(name, action, setup):
+            # 첫 실행은 버리고(warmup) 이후 repeat번의 표시 시간을 기록
+            samples = []
+            for i in range(repeat + 1):
+                setup()
+                elapsed = wait_for_page(view_model, action)
+                if i:
+                    samples.append(elapsed)
+            report.add(SUITE, name, rows, samples)
+
+        def go_to(page):
+            view_model.current_keyword = ""
+            view_model.current_page = page
+            view_model.fetch_posts()
+
+        for depth, page in (("first", 1), ("middle", max(1, last_page // 2)), ("last", last_page)):
+            measure_page(f"fetch {depth} page cold", lambda: go_to(page), lambda: clear_caches(view_model))
+
+        # 이웃 페이지는 미리 읽어 두므로 다음 페이지 이동은 캐시에서 바로 표시되어야 함
+        def show_first_page():
+            clear_caches(view_model)
+            wait_for_page(view_model, lambda: go_to(1))
+            settle(view_model)
+
+        measure_page("next page prefetched", view_model.go_next_page, show_first_page)
+        measure_page("refetch same page cached", view_model.fetch_posts, lambda: settle(view_model))
+
+        for name, keyword in SEARCH_KEYWORDS.items():
+            measure_page(f"search {name} cold", lambda: view_model.search_posts(keyword),
+                         lambda: clear_caches(view_model))
+    finally:
+        settle(view_model)
+        view_model.deleteLater()
+        QCoreApplication.processEvents()
+
+
+def main():
+    bench_main("PostViewModel benchmark", {SUITE: run})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+benchmarks/compare.py
+
+두 벤치마크 결과 JSON 파일을 (suite, name, rows) 기준으로 비교하여 변화율을 출력합니다.
+기준보다 threshold(%) 넘게 느려진 항목이 있으면 종료 코드 1을 반환하므로 커밋 간 회귀 확인에 사용할 수 있습니다.
+
+실행: python -m benchmarks.compare before.json after.json [--metric p50] [--threshold 10]
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.bench_utils import format_size
+
+# 비교할 수 있는 통계 값
+METRICS = ("min", "mean", "p50", "p90", "p99", "max")
+# 이보다 짧은 측정값(밀리초)은 타이머 오차가 커서 회귀로 판단하지 않음
+MIN_COMPARABLE_MS = 0.1
+
+
+def load_results(path: str) -> tuple[dict, dict]:
+    """
+    결과 파일을 읽어 (메타 정보, (suite, name, rows) -> 결과) 형태로 반환합니다.
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("meta", {}), {(r["suite"], r["name"], r["rows"]): r for r in data["results"]}
+
+
+def compare(before: dict, after: dict, metric: str, threshold: float) -> tuple[list[tuple], list[tuple]]:
+    """
+    두 결과의 공통 항목을 비교합니다.
+
+    Args:
+        before (dict): 기준 결과
+        after (dict): 비교할 결과
+        metric (str): 비교할 통계 값 (p50 등)
+        threshold (float): 회귀로 판단할 변화율(%)
+
+    Returns:
+        tuple: (항목별 (키, 기준값, 비교값, 변화율%) 리스트, 회귀 항목 리스트)
+    """
+    rows, regressions = [], []
+    for key in sorted(before.keys() & after.keys(), key=lambda k: (k[0], k[2], k[1])):
+        old, new = before[key][metric], after[key][metric]
+        change = (new - old) / old * 100 if old else 0.0
+        rows.append((key, old, new, change))
+        if change > threshold and max(old, new) >= MIN_COMPARABLE_MS:
+            regressions.append((key, old, new, change))
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("before", help="baseline result JSON")
+    parser.add_argument("after", help="result JSON to compare against the baseline")
+    parser.add_argument("--metric", choices=METRICS, default="p50")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    args = parser.parse_args(argv)
+
+    before_meta, before = load_results(args.before)
+    after_meta, after = load_results(args.after)
+    rows, regressions = compare(before, after, args.metric, args.threshold)
+
+    print(f"before: {before_meta.get('commit')} {before_meta.get('timestamp')}")
+    print(f"after:  {after_meta.get('commit')} {after_meta.get('timestamp')}")
+    print(f"{'suite':<12}{'rows':>6}  {'benchmark':<34}{'before':>11}{'after':>11}{'change':>10}  ({args.metric}, ms)")
+    for (suite, name, size), old, new, change in rows:
+        mark = " !" if any(key == (suite, name, size) for key, *_ in regressions) else ""
+        print(f"{suite:<12}{format_size(size):>6}  {name:<34}{old:>11.3f}{new:>11.3f}{change:>+9.1f}%{mark}")
+
+    missing = before.keys() ^ after.keys()
+    if missing:
+        print(f"{len(missing)} benchmarks exist in only one of the files")
+    if regressions:
+        print(f"{len(regressions)} regressions over {args.threshold:.0f}%")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+게시판 전체 내보내기 도구입니다. (GUI 없이 실행)
+
+board.db의 모든 게시글을 id 순서로 조금씩 읽어 CSV 또는 JSONL 파일에 바로 기록하므로,
+게시판 크기와 무관하게 일정한 메모리로 동작합니다. 파일 이름이 .gz로 끝나면 gzip으로 압축합니다.
+
+사용법:
+    python export_posts.py posts.jsonl.gz [--db board.db] [--chunk-size 1000]
+"""
+import argparse
+import sys
+import time
+
+from app.database import db, migrate, PostDao
+from app.database.post_dao import EXPORT_CHUNK_SIZE
+from app.utils.post_io import write_posts
+
+# 진행 상황을 출력하는 최소 간격(초)
+REPORT_INTERVAL = 2.0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Export all posts of the board database to a CSV/JSONL file.")
+    parser.add_argument("output", help="output file (.csv or .jsonl, optionally .gz)")
+    parser.add_argument("--db", help="database file path (default: board.db next to the application)")
+    parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE, help="posts read per fetch")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        db.set_path(args.db)
+
+    conn = db.get_connection()
+    try:
+        migrate(conn)
+    finally:
+        conn.close()
+
+    dao = PostDao()
+    total = dao.get_total_count()
+    start = time.perf_counter()
+    last_report = start
+
+    def report(count: int) -> None:
+        nonlocal last_report
+        now = time.perf_counter()
+        if now - last_report >= REPORT_INTERVAL:
+            last_report = now
+            print(f"{count:,} / {total:,} posts ({count / (now - start):,.0f} posts/s)", flush=True)
+
+    try:
+        count = write_posts(dao.iter_posts(args.chunk_size), args.output, on_progress=report)
+    except (OSError, ValueError) as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Exported {count:,} posts to {args.output} in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+게시글 대량 가져오기 도구입니다. (GUI 없이 실행)
+
+CSV(헤더: title, content, author, created_at, updated_at) 또는 JSONL 파일을 스트리밍으로 읽어
+board.db에 배치 단위로 추가합니다. 적재 중에는 인덱스/카운터 갱신을 미뤘다가 마지막에 한 번에 반영합니다.
+
+사용법:
+    python import_posts.py posts.csv more_posts.jsonl.gz [--db board.db] [--batch-size 5000]
+    python import_posts.py --repair [--db board.db]
+"""
+import argparse
+import sys
+import time
+
+from app.database import db, migrate, PostDao
+from app.database.bulk_load import deferred_maintenance, repair_derived_data
+from app.database.post_dao import INSERT_BATCH_SIZE
+from app.utils.post_io import ThroughputReporter, read_posts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import posts from CSV/JSONL files into the board database.")
+    parser.add_argument("files", nargs="*", help="CSV or JSONL files to import (.gz supported)")
+    parser.add_argument("--db", help="database file path (default: board.db next to the application)")
+    parser.add_argument("--batch-size", type=int, default=INSERT_BATCH_SIZE, help="posts per transaction")
+    parser.add_argument("--keep-indexes", action="store_true",
+                        help="keep secondary indexes during the import (faster for small imports into large boards)")
+    parser.add_argument("--repair", action="store_true",
+                        help="rebuild indexes, post counter and search index (after an interrupted import)")
+    args = parser.parse_args(argv)
+
+    if not args.files and not args.repair:
+        parser.error("no input files")
+
+    if args.db:
+        db.set_path(args.db)
+
+    conn = db.get_connection()
+    try:
+        migrate(conn)
+
+        if args.repair:
+            repair_derived_data(conn)
+            print(f"Repaired derived data in {db.db_path}")
+
+        if args.files:
+            dao = PostDao()
+            total = 0
+            start = time.perf_counter()
+            with deferred_maintenance(conn, defer_indexes=not args.keep_indexes):
+                for path in args.files:
+                    reporter = ThroughputReporter(path)
+                    try:
+                        count = dao.insert_posts(read_posts(path), args.batch_size, on_batch=reporter)
+                    except (OSError, ValueError) as e:
+                        # 실패한 배치만 롤백되고 앞서 커밋된 배치는 남으므로, 다시 실행할 때 중복되지 않도록 알려 줌
+                        print(f"Import failed: {e}", file=sys.stderr)
+                        committed = total + reporter.count
+                        if committed:
+                            print(f"{committed:,} posts were committed before the error: "
+                                  f"the first {reporter.count:,} records of {path}"
+                                  f"{' and all earlier files' if total else ''}. "
+                                  f"Re-importing them would create duplicates; "
+                                  f"fix the record and import only the remaining ones.", file=sys.stderr)
+                        else:
+                            print("No posts were committed; fix the record and run the import again.",
+                                  file=sys.stderr)
+                        return 1
+                    reporter.report(count)
+                    total += count
+                print("Rebuilding indexes...", flush=True)
+            elapsed = time.perf_counter() - start
+            print(f"Imported {total:,} posts into {db.db_path} in {elapsed:.1f}s "
+                  f"({total / elapsed if elapsed > 0 else 0:,.0f} posts/s including index maintenance)")
+    except (OSError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+        db.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
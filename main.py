@@ -1,20 +1,45 @@
+import os
 import sys
+import time
 
+# 시작 시간 측정 기준 (다른 모듈을 가져오기 전에 기록)
+STARTUP_TIME = time.perf_counter()
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QMessageBox
 
-from app.database import db
-from app.models import Post
+from app.database import db, migrate
+from app.utils.startup_profiler import StartupProfiler
+from app.utils.ui_profiler import UiProfiler, UiProfilerOverlay, UI_PROFILE_REPORT
 from app.viewmodels import PostViewModel
-from app.views import PostDetailPage, PostEditorPage, PostListPage
+from app.views import PostListPage
+
+# 쿼리 계측(실행 시간 통계, 느린 쿼리 로그)을 켜고 끄는 단축키
+QUERY_STATS_SHORTCUT = "Ctrl+Shift+Q"
+# UI 응답성 계측(이벤트 루프 지연, 시그널 -> 그리기 지연, 페이지 전환 시간)과 오버레이를 켜고 끄는 단축키
+UI_PROFILE_SHORTCUT = "Ctrl+Shift+U"
+# 시작 후 기존 게시글 압축(백그라운드)을 시작하기까지의 지연 시간(밀리초). 첫 화면 조회와 겹치지 않게 함
+CONTENT_COMPRESSION_DELAY_MS = 3000
 
 def init_app():
     """
     애플리케이션 초기화 함수입니다.
-    데이터베이스 테이블을 생성합니다.
+    데이터베이스 스키마를 최신 버전으로 마이그레이션합니다.
+    커넥션 풀의 연결을 사용하므로, 이 연결은 그대로 첫 목록 조회에 재사용됩니다.
+    """
+    conn = db.pool.acquire()
+    try:
+        migrate(conn)
+    finally:
+        db.pool.release(conn)
+
+
+def print_query_stats():
+    """
+    쿼리 계측이 모은 통계를 표준 에러로 출력합니다.
     """
-    conn = db.get_connection()
-    Post.create_table(conn)
-    conn.close()
+    print("[query stats]", db.query_stats.format_report(), sep="\n", file=sys.stderr)
 
 
 class MainWindow(QMainWindow):
@@ -34,45 +59,120 @@ class MainWindow(QMainWindow):
         self.view_model = PostViewModel()
         self.view_model.error_message_signal.connect(self.show_global_error)
         self.view_model.message_signal.connect(self.show_global_alarm)
+        self.init_profiler()
         self.init_ui()
         self.init_navigation()
+        self.init_shortcuts()
+        self.ui_overlay = UiProfilerOverlay(self.ui_profiler, self)
+        self.ui_overlay.set_active(self.ui_profiler.enabled)
 
-        self.view_model.fetch_posts()
+        # 첫 목록 조회는 창이 화면에 그려진 뒤(이벤트 루프 시작 후)에 시작
+        QTimer.singleShot(0, self.view_model.fetch_posts)
+        QTimer.singleShot(CONTENT_COMPRESSION_DELAY_MS, self.view_model.compress_existing_posts)
+
+    def init_profiler(self):
+        """
+        UI 응답성 계측을 준비합니다. (BOARD_UI_PROFILE=1 또는 단축키로 켬)
+        목록 갱신 시그널은 시그널을 처리하는 페이지보다 먼저 연결해야 처리 시간까지 포함되므로 init_ui 전에 호출합니다.
+        """
+        self.ui_profiler = UiProfiler(report_path=os.path.join(os.path.dirname(db.db_path), UI_PROFILE_REPORT))
+        table_viewport = lambda: self.list_page.table.viewport()
+        self.ui_profiler.watch_signal(self.view_model.post_list_updated, "post_list_updated", table_viewport)
+        self.ui_profiler.watch_signal(self.view_model.paging_info_updated, "paging_info_updated", table_viewport)
 
     def init_ui(self):
         """
-        UI 컴포넌트들을 초기화하고 스택 위젯에 페이지들을 추가합니다.
+        UI 컴포넌트들을 초기화하고 스택 위젯에 목록 페이지를 추가합니다.
+        상세/에디터 페이지는 처음 열 때 만들어집니다.
         """
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
         self.list_page = PostListPage(self.view_model)
-        self.detail_page = PostDetailPage(self.view_model)
-        self.editor_page = PostEditorPage(self.view_model)
-
         self.stack.addWidget(self.list_page)
-        self.stack.addWidget(self.detail_page)
-        self.stack.addWidget(self.editor_page)
+
+        self._detail_page = None
+        self._editor_page = None
 
     def init_navigation(self):
         """
-        각 페이지 간의 화면 전환 시그널을 연결합니다.
+        각 페이지 간의 화면 전환 시그널을 연결합니다. (상세/에디터 페이지는 만들어질 때 연결)
         """
         self.list_page.request_post_signal.connect(self.go_to_edit)
         self.list_page.request_read_signal.connect(self.go_to_detail)
 
-        self.detail_page.request_go_list.connect(self.go_to_list)
-        self.detail_page.request_edit_signal.connect(self.go_to_edit)
+    def init_shortcuts(self):
+        """
+        디버그용 단축키를 등록합니다.
+        """
+        QShortcut(QKeySequence(QUERY_STATS_SHORTCUT), self, self.toggle_query_stats)
+        QShortcut(QKeySequence(UI_PROFILE_SHORTCUT), self, self.toggle_ui_profiler)
 
-        self.editor_page.request_go_list.connect(self.go_to_list)
-        self.editor_page.request_back_to_post.connect(self.go_to_detail)
+    def toggle_query_stats(self):
+        """
+        쿼리 계측을 켜고 끕니다. 끌 때 그동안 모은 쿼리별 통계를 표준 에러로 출력합니다.
+        """
+        stats = db.query_stats
+        if stats.enabled:
+            stats.disable()
+            print_query_stats()
+            self.show_global_alarm("Query statistics disabled. The report was printed to the console.")
+        else:
+            stats.reset()
+            stats.enable()
+            self.show_global_alarm(f"Query statistics enabled.\nSlow queries (>= {stats.slow_query_ms:g} ms) "
+                                   f"are logged to {stats.slow_log_path}")
+
+    def toggle_ui_profiler(self):
+        """
+        UI 응답성 계측과 오버레이를 켜고 끕니다. 끌 때 측정 결과를 JSON 파일로 저장합니다.
+        """
+        profiler = self.ui_profiler
+        if profiler.enabled:
+            profiler.disable()
+            self.ui_overlay.set_active(False)
+            path = profiler.dump()
+            self.show_global_alarm(f"UI profiling disabled. The report was saved to {path}")
+        else:
+            profiler.reset()
+            profiler.enable()
+            self.ui_overlay.set_active(True)
+
+    @property
+    def detail_page(self):
+        """
+        게시글 상세 페이지를 반환합니다. 처음 접근할 때 만들어 스택 위젯에 추가합니다.
+        """
+        if self._detail_page is None:
+            from app.views import PostDetailPage
+
+            self._detail_page = PostDetailPage(self.view_model)
+            self._detail_page.request_go_list.connect(self.go_to_list)
+            self._detail_page.request_edit_signal.connect(self.go_to_edit)
+            self.stack.addWidget(self._detail_page)
+        return self._detail_page
+
+    @property
+    def editor_page(self):
+        """
+        게시글 작성/수정 페이지를 반환합니다. 처음 접근할 때 만들어 스택 위젯에 추가합니다.
+        """
+        if self._editor_page is None:
+            from app.views import PostEditorPage
+
+            self._editor_page = PostEditorPage(self.view_model)
+            self._editor_page.request_go_list.connect(self.go_to_list)
+            self._editor_page.request_back_to_post.connect(self.go_to_detail)
+            self.stack.addWidget(self._editor_page)
+        return self._editor_page
 
     # 화면 전환 함수
     def go_to_list(self):
         """
         게시글 목록 페이지로 이동합니다.
         """
-        self.stack.setCurrentIndex(0)
+        self.ui_profiler.begin("page switch list")
+        self.show_page("list", self.list_page)
 
     def go_to_detail(self, post):
         """
@@ -81,8 +181,9 @@ class MainWindow(QMainWindow):
         Args:
             post (Post): 상세 내용을 표시할 게시글 객체
         """
+        self.ui_profiler.begin("page switch detail")
         self.detail_page.set_data(post)
-        self.stack.setCurrentIndex(1)
+        self.show_page("detail", self.detail_page)
 
     def go_to_edit(self, post=None):
         """
@@ -91,8 +192,21 @@ class MainWindow(QMainWindow):
         Args:
             post (Post, optional): 수정할 게시글 객체. None이면 새 글 작성.
         """
+        self.ui_profiler.begin("page switch editor")
         self.editor_page.set_data(post)
-        self.stack.setCurrentIndex(2)
+        self.show_page("editor", self.editor_page)
+
+    def show_page(self, name: str, page):
+        """
+        스택 위젯에서 page를 표시합니다. UI 계측이 켜져 있으면 전환 시작부터 page가 그려질 때까지의 시간을 기록합니다.
+        (처음 여는 페이지는 생성 시간도 포함)
+
+        Args:
+            name (str): 계측에 기록할 페이지 이름
+            page (QWidget): 표시할 페이지
+        """
+        self.stack.setCurrentWidget(page)
+        self.ui_profiler.end_on_paint(f"page switch {name}", page)
 
     def show_global_error(self, message: str = None):
         """
@@ -114,8 +228,28 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == '__main__':
+    # BOARD_PROFILE_STARTUP=1 또는 --profile-startup 으로 실행하면 시작 단계별 소요 시간을 출력
+    profiler = StartupProfiler(STARTUP_TIME)
+    profiler.mark("import")
     app = QApplication(sys.argv)
+    profiler.mark("QApplication")
     init_app()
+    profiler.mark("DB init")
     window = MainWindow()
+    profiler.mark("window build")
+    # 백그라운드 DB 작업이 끝난 뒤 연결을 닫음
+    app.aboutToQuit.connect(window.view_model.wait_for_tasks)
+    # BOARD_QUERY_STATS=1로 실행했거나 단축키로 켠 상태면 종료 시 쿼리 통계를 출력
+    app.aboutToQuit.connect(lambda: db.query_stats.enabled and print_query_stats())
+    # BOARD_UI_PROFILE=1로 실행했거나 단축키로 켠 상태면 종료 시 UI 계측 결과를 저장
+    app.aboutToQuit.connect(lambda: window.ui_profiler.enabled and window.ui_profiler.dump())
+    app.aboutToQuit.connect(db.close)
+
+    if profiler.enabled:
+        profiler.mark_on_paint(window.list_page, "first paint")
+        # 첫 목록을 받은 뒤 테이블이 다시 그려지면 사용 가능한 상태로 보고 결과 출력
+        window.view_model.post_list_updated.connect(
+            lambda posts: profiler.mark_on_paint(window.list_page.table.viewport(), "first data", profiler.report)
+        )
     window.show()
     sys.exit(app.exec())
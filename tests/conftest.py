@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from app.database import db, migrate
+
+
+@pytest.fixture
+def board_db(tmp_path):
+    """
+    임시 폴더에 최신 스키마의 빈 DB를 만들어 db가 사용하게 하고, 테스트가 끝나면 풀의 연결을 닫습니다.
+    """
+    db.set_path(str(tmp_path / "board.db"))
+    conn = db.pool.acquire()
+    try:
+        migrate(conn)
+    finally:
+        db.pool.release(conn)
+    yield db
+    db.close()
+
+
+@pytest.fixture(scope="session")
+def qt_app():
+    """
+    ViewModel의 시그널, 백그라운드 작업 결과 전달과 화면 위젯에 필요한 Qt 애플리케이션 객체를 만듭니다. (화면 없이 실행)
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
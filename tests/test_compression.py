@@ -0,0 +1,62 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from app.database import compression, db, PostDao
+from app.database.compression import (COMPRESS_MIN_LENGTH, compress_content, decompress_content,
+                                      register_compression_functions, unzip_sql)
+from app.database.search_index import has_search_index
+from app.models import Post
+
+# 압축되는 긴 본문 (여러 줄, 한국어/영어 혼합)
+LONG_CONTENT = "긴 게시글 본문입니다. Long post body.\n" * (COMPRESS_MIN_LENGTH // 10)
+
+
+def _unzip_in_sql(stored):
+    with closing(sqlite3.connect(":memory:")) as conn:
+        register_compression_functions(conn)
+        return conn.execute(f"SELECT {unzip_sql('value')}, typeof(value) FROM (SELECT ? AS value)",
+                            (stored,)).fetchone()
+
+
+@pytest.mark.parametrize("content, stored_type", [
+    (None, "null"),
+    ("", "text"),
+    ("짧은 본문", "text"),
+    ("x" * (COMPRESS_MIN_LENGTH - 1), "text"),
+    ("x" * COMPRESS_MIN_LENGTH, "blob"),
+    (LONG_CONTENT, "blob"),
+], ids=["none", "empty", "short", "below-min", "min", "long"])
+def test_compress_round_trip(content, stored_type):
+    stored = compress_content(content)
+    assert isinstance(stored, bytes) == (stored_type == "blob")
+    assert decompress_content(stored) == content
+    assert _unzip_in_sql(stored) == (content, stored_type)
+
+
+def test_compress_skips_when_not_smaller(monkeypatch):
+    # 압축 결과가 기준 비율보다 크면 원문 그대로 저장
+    monkeypatch.setattr(compression, "COMPRESS_MAX_RATIO", 0.01)
+    assert compress_content(LONG_CONTENT) == LONG_CONTENT
+    assert _unzip_in_sql(LONG_CONTENT) == (LONG_CONTENT, "text")
+
+
+def test_post_dao_round_trip(board_db):
+    dao = PostDao()
+    dao.insert_post(Post(title="long", content=LONG_CONTENT, author="a"))
+    dao.insert_posts([Post(title="short", content="짧은 본문", author="a")])
+    with db.get_cursor(bump_version=False) as cursor:
+        types = dict(cursor.execute("SELECT title, typeof(content) FROM posts").fetchall())
+        search_index = has_search_index(cursor.connection)
+    # 검색 인덱스(FTS5)가 없는 DB는 압축하지 않음
+    assert types == {"long": "blob" if search_index else "text", "short": "text"}
+
+    assert dao.get_post(1).content == LONG_CONTENT
+    assert {post.title: post.content for post in dao.get_posts_by_ids([1, 2])} == \
+           {"long": LONG_CONTENT, "short": "짧은 본문"}
+    assert [post.content for chunk in dao.iter_posts() for post in chunk] == [LONG_CONTENT, "짧은 본문"]
+
+    dao.update_post(Post(id=1, title="long", content="이제 짧은 본문", author="a"))
+    dao.update_post(Post(id=2, title="short", content=LONG_CONTENT, author="a"))
+    assert [post.content for chunk in dao.iter_posts() for post in chunk] == ["이제 짧은 본문", LONG_CONTENT]
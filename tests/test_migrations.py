@@ -0,0 +1,65 @@
+import sqlite3
+from contextlib import closing
+
+from app.database import db, migrate, PostDao
+from app.database.compression import COMPRESS_MIN_LENGTH
+from app.database.migrations import LATEST_VERSION, POSTS_INDEXES, get_schema_version
+from app.database.search_index import has_search_index, is_fts5_available, is_search_index_current
+from app.models import Post
+
+LONG_CONTENT = "migrated board " * (COMPRESS_MIN_LENGTH // 10)
+
+
+def _create_baseline_db(path: str) -> None:
+    """
+    마이그레이션 도입 전 앱이 만들던 DB(posts 테이블만 있고 user_version 0)를 만듭니다.
+    """
+    with closing(sqlite3.connect(path)) as conn:
+        Post.create_table(conn)
+        conn.executemany("INSERT INTO posts (title, content, author) VALUES (?, ?, ?)",
+                         [("first", "hello", "a"), ("second", LONG_CONTENT, "b"), ("셋째", "안녕하세요", "c")])
+        conn.commit()
+
+
+def test_migrate_baseline_db(tmp_path):
+    path = str(tmp_path / "board.db")
+    _create_baseline_db(path)
+    db.set_path(path)
+    conn = db.get_connection()
+    try:
+        assert get_schema_version(conn) == 0
+        assert migrate(conn) == LATEST_VERSION
+
+        index_names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {name for name, _ in POSTS_INDEXES} <= index_names
+        assert conn.execute("SELECT total FROM post_counter WHERE id = 1").fetchone()[0] == 3
+        # 기존 게시글은 마이그레이션에서 압축하지 않음 (앱 실행 중 백그라운드에서 압축)
+        assert conn.execute("SELECT COUNT(*) FROM posts WHERE typeof(content) = 'blob'").fetchone()[0] == 0
+
+        search_index = is_fts5_available(conn)
+        assert has_search_index(conn) == search_index
+        assert is_search_index_current(conn) == search_index
+        end_id = conn.execute("SELECT end_id FROM content_compression WHERE id = 1").fetchone()[0]
+        assert end_id == (3 if search_index else 0)
+
+        # 이미 최신 버전이면 아무것도 바꾸지 않음
+        schema = conn.execute("SELECT sql FROM sqlite_master ORDER BY name").fetchall()
+        assert migrate(conn) == LATEST_VERSION
+        assert conn.execute("SELECT sql FROM sqlite_master ORDER BY name").fetchall() == schema
+    finally:
+        conn.close()
+
+    try:
+        dao = PostDao()
+        assert dao.get_total_count() == 3
+        assert [post.title for post in dao.search_post("board")] == ["second"]
+        assert [post.title for post in dao.search_post("안녕")] == ["셋째"]
+        assert dao.get_post(2).content == LONG_CONTENT
+    finally:
+        db.close()
+
+
+def test_migrate_new_db(tmp_path):
+    with closing(sqlite3.connect(str(tmp_path / "board.db"))) as conn:
+        assert migrate(conn) == LATEST_VERSION
+        assert conn.execute("SELECT total FROM post_counter WHERE id = 1").fetchone()[0] == 0
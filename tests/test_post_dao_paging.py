@@ -0,0 +1,63 @@
+import pytest
+
+from app.database import PostDao
+from app.models import Post
+
+PAGE_SIZE = 7
+
+
+@pytest.fixture
+def dao(board_db):
+    """
+    같은 작성 시각의 게시글이 섞인 게시판을 만듭니다. (정렬 동률은 id로 구분)
+    """
+    dao = PostDao()
+    dao.insert_posts(Post(title=f"post {i}", content="python" if i % 3 == 0 else "qt",
+                          author="a", created_at=f"2025-01-{1 + i // 4:02d} 00:00:00")
+                     for i in range(50))
+    return dao
+
+
+def _ids(posts) -> list[int]:
+    return [post.id for post in posts]
+
+
+def _expected_ids(dao, keyword: str) -> list[int]:
+    posts = dao.search_post(keyword) if keyword else dao.get_posts_by_ids(list(range(1, 51)))
+    return _ids(sorted(posts, key=lambda post: (post.created_at, post.id), reverse=True))
+
+
+@pytest.mark.parametrize("keyword", ["", "python"])
+def test_page_with_count(dao, keyword):
+    expected = _expected_ids(dao, keyword)
+    pages = -(-len(expected) // PAGE_SIZE)
+    for page in range(1, pages + 2):
+        posts, count = dao.get_page_with_count(keyword, page, PAGE_SIZE)
+        assert count == len(expected)
+        assert _ids(posts) == expected[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+
+
+@pytest.mark.parametrize("keyword", ["", "python"])
+def test_seek_pages_match_offset_pages(dao, keyword):
+    expected = _expected_ids(dao, keyword)
+    seek = dao.get_search_posts_seek if keyword else lambda _, *args: dao.get_posts_seek(*args)
+
+    # 다음 페이지 방향으로 끝까지 읽음
+    pages, anchor = [], None
+    while True:
+        posts = seek(keyword, PAGE_SIZE, anchor)
+        if not posts:
+            break
+        pages.append(posts)
+        anchor = (posts[-1].created_at, posts[-1].id)
+    assert [post_id for posts in pages for post_id in _ids(posts)] == expected
+
+    # 이전 페이지 방향으로 읽어도 같은 페이지가 최신순으로 나옴
+    for previous, current in zip(pages, pages[1:]):
+        anchor = (current[0].created_at, current[0].id)
+        assert _ids(seek(keyword, PAGE_SIZE, anchor, True)) == _ids(previous)
+
+    # 기준 키에서 건너뛴 위치부터 읽기 (여러 페이지 이동)
+    if len(pages) > 2:
+        anchor = (pages[0][-1].created_at, pages[0][-1].id)
+        assert _ids(seek(keyword, PAGE_SIZE, anchor, False, PAGE_SIZE)) == _ids(pages[2])
@@ -0,0 +1,36 @@
+from app.views import PostListPage
+# 게시글 40개가 있는 게시판의 ViewModel fixture를 함께 사용
+from tests.test_post_viewmodel import settle, view_model  # noqa: F401
+
+
+def _type_search(page, text: str) -> None:
+    # 사용자 입력처럼 textEdited를 발생시킨 뒤, 입력이 멈춘 것으로 보고 검색을 실행
+    page.input_search.setText(text)
+    page.input_search.textEdited.emit(text)
+    page.search_timer.stop()
+    page.on_search_input_idle()
+
+
+def test_live_search_keeps_input_when_keyword_is_erased(view_model, qt_app):
+    page = PostListPage(view_model)
+    page.show()
+    page.input_search.setFocus()
+    qt_app.processEvents()
+
+    _type_search(page, "post")
+    settle(view_model, qt_app)
+    assert view_model.current_keyword == "post"
+
+    # 검색어를 모두 지워도 전체 목록만 다시 보여주고 검색창 포커스는 유지
+    _type_search(page, "")
+    settle(view_model, qt_app)
+    assert view_model.current_keyword == ""
+    assert page.input_search.hasFocus()
+
+    # 명시적으로 목록을 초기화하면 검색창을 비우고 포커스를 해제
+    page.input_search.setText("post")
+    view_model.reset_and_fetch()
+    settle(view_model, qt_app)
+    assert page.input_search.text() == ""
+    assert not page.input_search.hasFocus()
+    page.close()
@@ -0,0 +1,114 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from app.database import PostDao
+from app.models import Post
+from app.viewmodels import PostViewModel
+
+ITEMS_PER_PAGE = 16
+
+
+@pytest.fixture
+def view_model(board_db, qt_app):
+    """
+    게시글 40개가 있는 게시판의 첫 페이지를 조회한 ViewModel을 만듭니다.
+    """
+    PostDao().insert_posts(Post(title=f"post {i}", content="body", author="a",
+                                created_at=f"2025-01-01 00:00:{i:02d}") for i in range(40))
+    view_model = PostViewModel()
+    view_model.items_per_page = ITEMS_PER_PAGE
+    view_model.pages = []
+    view_model.post_list_updated.connect(lambda posts: view_model.pages.append([post.title for post in posts]))
+    view_model.fetch_posts()
+    settle(view_model, qt_app)
+    yield view_model
+    view_model.wait_for_tasks()
+
+
+def settle(view_model, app) -> None:
+    """
+    백그라운드 조회가 끝나고 결과 시그널이 전달될 때까지 이벤트를 처리합니다.
+    """
+    while True:
+        view_model.wait_for_tasks()
+        app.processEvents()
+        if not view_model.is_loading:
+            break
+
+
+def _write_from_other_connection(db_path: str, sql: str, params=()) -> None:
+    # 다른 프로세스(import_posts.py, sqlite3 등)의 쓰기와 같은, 앱의 DatabaseManager를 거치지 않는 연결
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute(sql, params)
+        conn.commit()
+
+
+def test_other_connection_writes_invalidate_page_cache(view_model, board_db, qt_app):
+    view_model.go_next_page()
+    settle(view_model, qt_app)
+    view_model.go_prev_page()
+    settle(view_model, qt_app)
+    assert view_model.pages[-1][0] == "post 39"
+    assert (view_model.total_count, view_model.total_pages) == (40, 3)
+
+    _write_from_other_connection(board_db.db_path, """
+        INSERT INTO posts (title, content, author, created_at)
+        VALUES ('external', 'body', 'b', '2025-01-02 00:00:00')
+    """)
+    view_model.go_next_page()
+    settle(view_model, qt_app)
+    view_model.go_prev_page()
+    settle(view_model, qt_app)
+    assert view_model.pages[-1][0] == "external"
+    assert view_model.page_cache.get_count("") == 41
+    assert (view_model.total_count, view_model.total_pages) == (41, 3)
+
+    _write_from_other_connection(board_db.db_path, "DELETE FROM posts WHERE title IN ('external', 'post 39')")
+    view_model.go_next_page()
+    settle(view_model, qt_app)
+    assert view_model.pages[-1][0] == "post 22"
+    assert view_model.page_cache.get_count("") == 39
+
+
+def test_own_writes_keep_unaffected_cache(view_model, board_db, qt_app):
+    # 이 ViewModel이 한 쓰기는 다른 프로세스의 변경으로 보지 않으므로 캐시 전체를 버리지 않음
+    version = view_model.page_cache.version
+    view_model.add_post("own", "body")
+    settle(view_model, qt_app)
+    assert view_model.page_cache.version == version + 1
+    assert view_model.pages[-1][0] == "own"
+    assert view_model.total_count == 41
+
+
+def test_seek_pages_after_other_connection_writes(view_model, board_db, qt_app):
+    dao = PostDao()
+
+    def assert_current_page():
+        expected = dao.get_posts_paginated(view_model.current_page, ITEMS_PER_PAGE)
+        assert view_model.pages[-1] == [post.title for post in expected]
+        assert view_model.total_count == dao.get_total_count()
+
+    # 모든 페이지의 기준점과 전체 개수를 캐시에 채움 (마지막 페이지는 목록 끝에서부터 조회)
+    view_model.go_to_page(3)
+    settle(view_model, qt_app)
+    assert_current_page()
+
+    # 앞쪽에 글이 추가되거나 삭제되면 기준점과 전체 개수로 이어 읽은 페이지가 밀림
+    _write_from_other_connection(board_db.db_path, """
+        INSERT INTO posts (title, content, author, created_at)
+        SELECT 'external ' || id, 'body', 'b', '2025-01-02 00:00:00' FROM posts WHERE id <= 10
+    """)
+    for page in (2, 3, 4, 3, 1):
+        view_model.go_to_page(page)
+        settle(view_model, qt_app)
+        assert_current_page()
+    assert view_model.total_pages == 4
+
+    _write_from_other_connection(board_db.db_path, "DELETE FROM posts WHERE id % 2 = 0")
+    for page in (2, 1, 2):
+        view_model.go_to_page(page)
+        settle(view_model, qt_app)
+        assert_current_page()
+    assert view_model.total_pages == 2
@@ -0,0 +1,31 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from app.database import PostDao
+from app.database.search_index import index_posts, is_fts5_available, unindex_posts
+from app.models import Post
+
+with closing(sqlite3.connect(":memory:")) as _conn:
+    pytestmark = pytest.mark.skipif(not is_fts5_available(_conn), reason="SQLite FTS5 trigram is not available")
+
+
+def test_refined_search_sees_other_process_writes(board_db):
+    dao = PostDao()
+    dao.insert_posts(Post(title=f"python {i}", content="body", author="a",
+                          created_at=f"2025-01-01 00:00:{i:02d}") for i in range(5))
+    assert dao.get_search_ids("pyth") == [5, 4, 3, 2, 1]
+
+    # 다른 프로세스의 PostDao처럼, 앱의 DatabaseManager를 거치지 않고 게시글과 검색 인덱스를 함께 바꿈
+    with closing(sqlite3.connect(board_db.db_path)) as conn:
+        cursor = conn.execute("INSERT INTO posts (title, content, author, created_at) "
+                              "VALUES ('python imported', 'body', 'b', '2025-01-02 00:00:00')")
+        index_posts(conn, [(cursor.lastrowid, "python imported", "body")])
+        unindex_posts(conn, [(1, "python 0", "body")])
+        conn.execute("DELETE FROM posts WHERE id = 1")
+        conn.commit()
+
+    # "pyth"의 기억해 둔 결과에서 좁히지 않고 다시 검색해야 함
+    assert dao.get_search_ids("python") == [6, 5, 4, 3, 2]
+    assert dao.get_search_ids("pyth") == [6, 5, 4, 3, 2]
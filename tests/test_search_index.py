@@ -0,0 +1,112 @@
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+from app.database import db, migrate, PostDao
+from app.database.compression import COMPRESS_MIN_LENGTH
+from app.database.search_index import FTS_TABLE, is_fts5_available
+from app.models import Post
+
+with closing(sqlite3.connect(":memory:")) as _conn:
+    pytestmark = pytest.mark.skipif(not is_fts5_available(_conn), reason="SQLite FTS5 trigram is not available")
+
+# 압축되어 저장되는 긴 본문. 본문 끝의 짧은 검색어도 찾을 수 있어야 함
+LONG_CONTENT = "파이썬 게시판 python board " * (COMPRESS_MIN_LENGTH // 10) + "끝ab"
+# 3글자 이상(FTS MATCH)과 짧은 검색어(trigram 목록), 본문 끝 글자를 함께 확인
+KEYWORDS = ["python", "board", "게시판", "파이", "끝ab", "ab", "b", "qt", "짧은", "new"]
+
+
+def _integrity_check() -> None:
+    """
+    앱의 SQL 함수를 등록하지 않은 연결에서 검색 인덱스 integrity-check를 실행합니다. 손상되었으면 예외가 발생합니다.
+    """
+    with closing(sqlite3.connect(db.db_path, isolation_level=None)) as conn:
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('integrity-check')")
+
+
+def _assert_search_matches(dao: PostDao) -> None:
+    """
+    검색 결과가 전체 게시글을 메모리에서 부분 문자열로 비교한 결과와 같은지 확인합니다.
+    """
+    posts = [post for chunk in dao.iter_posts() for post in chunk]
+    for keyword in KEYWORDS:
+        expected = sorted(post.id for post in posts if PostDao.matches_keyword(post, keyword))
+        assert sorted(post.id for post in dao.search_post(keyword)) == expected, keyword
+        assert dao.get_search_count(keyword) == len(expected), keyword
+
+
+def _check(dao: PostDao) -> None:
+    _integrity_check()
+    _assert_search_matches(dao)
+
+
+def test_search_index_follows_writes(board_db):
+    dao = PostDao()
+    dao.insert_post(Post(title="long", content=LONG_CONTENT, author="a"))
+    dao.insert_post(Post(title="short qt", content="짧은 본문 ab", author="a"))
+    dao.insert_posts([Post(title=f"bulk {i}", content=LONG_CONTENT if i % 2 else f"qt {i}", author="b")
+                      for i in range(10)], batch_size=4)
+    with db.get_cursor(bump_version=False) as cursor:
+        stored = dict(cursor.execute("SELECT typeof(content), COUNT(*) FROM posts GROUP BY 1").fetchall())
+    assert stored == {"blob": 6, "text": 6}
+    _check(dao)
+
+    # 압축 <-> 원문 전환, 제목만 수정, 같은 내용으로 수정
+    dao.update_post(Post(id=1, title="long", content="이제 짧은 본문 new", author="a"))
+    dao.update_post(Post(id=2, title="short qt", content=LONG_CONTENT, author="a"))
+    dao.update_post(Post(id=4, title="renamed python", content=LONG_CONTENT, author="b"))
+    dao.update_post(Post(id=5, title="bulk 2", content="qt 2", author="changed"))
+    _check(dao)
+
+    dao.delete_post(2)
+    dao.delete_post(3)
+    assert dao.delete_posts([4, 5, 6, 100]) == 3
+    _check(dao)
+
+    dao.delete_posts(list(range(1, 13)))
+    _check(dao)
+    assert dao.get_search_count("python") == 0
+
+
+def test_plain_sqlite_writes_do_not_need_app_functions(board_db):
+    dao = PostDao()
+    dao.insert_post(Post(title="long", content=LONG_CONTENT, author="a"))
+    # 검색 인덱스 트리거나 스키마가 앱의 SQL 함수를 사용하지 않으므로 다른 도구로도 posts를 바꿀 수 있음
+    with closing(sqlite3.connect(db.db_path)) as conn:
+        conn.execute("INSERT INTO posts (title, content, author) VALUES ('raw', 'raw python', 'r')")
+        conn.execute("UPDATE posts SET author = 'edited' WHERE id = 1")
+        conn.execute("DELETE FROM posts WHERE title = 'raw'")
+        conn.commit()
+    _check(dao)
+
+
+def test_compress_existing_posts_keeps_index(tmp_path):
+    path = str(tmp_path / "board.db")
+    with closing(sqlite3.connect(path)) as conn:
+        # 마이그레이션 도입 전 앱이 원문으로 저장한 게시글
+        Post.create_table(conn)
+        conn.executemany("INSERT INTO posts (title, content, author) VALUES (?, ?, ?)",
+                         [(f"old {i}", LONG_CONTENT if i % 2 else "짧은 본문 qt", "a") for i in range(7)])
+        conn.commit()
+    db.set_path(path)
+    try:
+        conn = db.get_connection()
+        try:
+            migrate(conn)
+        finally:
+            conn.close()
+
+        dao = PostDao()
+        _check(dao)
+        while dao.compress_existing_posts(batch_size=2):
+            pass
+        with db.get_cursor(bump_version=False) as cursor:
+            assert cursor.execute("SELECT COUNT(*) FROM posts WHERE typeof(content) = 'blob'").fetchone()[0] == 3
+        _check(dao)
+
+        dao.update_post(Post(id=2, title="old 1", content="압축이 풀린 본문 new", author="a"))
+        dao.delete_post(4)
+        _check(dao)
+    finally:
+        db.close()